@@ -0,0 +1,2 @@
+# DESCRIPTION Build frozen catalog artifact of applications
+& $env:MECO_PYTHON_EXECUTABLE_PATH -c "import mApplication.applicationCmd;mApplication.applicationCmd.buildCatalog()" $args
\ No newline at end of file
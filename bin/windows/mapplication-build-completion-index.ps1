@@ -0,0 +1,2 @@
+# DESCRIPTION Build completion index used by shell completion of mapplication commands
+& $env:MECO_PYTHON_EXECUTABLE_PATH -c "import mApplication.applicationCmd;mApplication.applicationCmd.buildCompletionIndex()" $args
\ No newline at end of file
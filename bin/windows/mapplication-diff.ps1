@@ -0,0 +1,2 @@
+# DESCRIPTION Display differences between the applications of two environments or releases
+& $env:MECO_PYTHON_EXECUTABLE_PATH -c "import mApplication.applicationCmd;mApplication.applicationCmd.diffCatalogs()" $args
\ No newline at end of file
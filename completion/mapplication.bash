@@ -0,0 +1,59 @@
+# DESCRIPTION Bash completion of mapplication-list and mapplication-search commands
+#
+# Source this file in bash. Values are read from the completion index, which is built by
+# mapplication-build-completion-index command, so completion doesn't run Python.
+
+_mapplication_index_values()
+{
+    local indexFile="${MAPPLICATION_COMPLETION_INDEX_FILE:-$HOME/.mApplication/completionIndex.txt}"
+
+    [ -f "$indexFile" ] || return 0
+
+    awk -F '\t' -v kind="$1" '$1 == kind { print $2 }' "$indexFile"
+}
+
+_mapplication()
+{
+    local current="${COMP_WORDS[COMP_CWORD]}"
+    local previous="${COMP_WORDS[COMP_CWORD-1]}"
+    local command="${COMP_WORDS[0]##*/}"
+    local options="-h --help -d --detail -li --list-inactive -pa --parent-application -p --package -l --limit -pg --page -lo --latest-only -f --format -fi --fields"
+    local values=""
+
+    case "$previous" in
+        -p|--package)
+            values="$(_mapplication_index_values package)" ;;
+        -pa|--parent-application)
+            values="$(_mapplication_index_values parent)" ;;
+        -k|--keyword)
+            values="$(_mapplication_index_values keyword; _mapplication_index_values name | tr '[:upper:]' '[:lower:]')" ;;
+        -dv|--developer)
+            values="$(_mapplication_index_values developer)" ;;
+        -e|--email)
+            values="$(_mapplication_index_values email)" ;;
+        -f|--format)
+            values="$(printf '%s\n' text json ndjson tsv)" ;;
+        -l|--limit|-pg|--page|-fi|--fields|-du|--document-url|-th|--threshold|-t|--top)
+            return 0 ;;
+    esac
+
+    if [ -z "$values" ]; then
+
+        if [ "$command" = "mapplication-list" ]; then
+            options="$options -k --keyword -dv --developer -e --email -du --document-url"
+        else
+            options="$options -fz --fuzzy -th --threshold -t --top"
+        fi
+
+        if [[ "$current" == -* || "$command" = "mapplication-list" ]]; then
+            values="$(printf '%s\n' $options)"
+        else
+            values="$(_mapplication_index_values keyword; _mapplication_index_values name | tr '[:upper:]' '[:lower:]')"
+        fi
+    fi
+
+    local IFS=$'\n'
+    COMPREPLY=($(compgen -W "$values" -- "$current"))
+}
+
+complete -F _mapplication mapplication-list mapplication-search
@@ -30,6 +30,8 @@ import argparse
 import json
 
 import mApplication.applicationInfoAbs
+import mApplication.catalogLib
+import mApplication.outputLib
 
 import mCore.displayLib
 
@@ -81,37 +83,126 @@ def listApplications():
                         help='Keyword, which will be used to find applications with',
                         required=False)
 
+    parser.add_argument('-l',
+                        '--limit',
+                        type=int,
+                        default=None,
+                        help='Maximum number of applications to be listed',
+                        required=False)
+
+    parser.add_argument('-pg',
+                        '--page',
+                        type=int,
+                        default=1,
+                        help='Page of the applications to be listed, starts from 1, used with --limit',
+                        required=False)
+
+    parser.add_argument('-lo',
+                        '--latest-only',
+                        action='store_true',
+                        help='List only the latest version of each application if several releases are visible')
+
+    parser.add_argument('-f',
+                        '--format',
+                        type=str,
+                        default=mApplication.outputLib.FORMAT_TEXT,
+                        choices=mApplication.outputLib.FORMATS,
+                        help='Output format, machine-readable formats are written without importing app info modules '
+                             'if a catalog is available',
+                        required=False)
+
+    parser.add_argument('-fi',
+                        '--fields',
+                        type=str,
+                        default='',
+                        help='Fields written in machine-readable formats separated by comma, '
+                             'default is {}'.format(','.join(mApplication.outputLib.DEFAULT_FIELDS)),
+                        required=False)
+
+    parser.add_argument('-dv',
+                        '--developer',
+                        type=str,
+                        default='',
+                        help='User name of a developer, applications developed by whom will be listed',
+                        required=False)
+
+    parser.add_argument('-e',
+                        '--email',
+                        type=str,
+                        default='',
+                        help='Email address of a developer, applications developed by whom will be listed',
+                        required=False)
+
+    parser.add_argument('-du',
+                        '--document-url',
+                        type=str,
+                        default='',
+                        help='URL of a document, applications documented at which will be listed',
+                        required=False)
+
     _args = parser.parse_args()
 
-    displayAppFilterSuggestion()
+    # Machine-readable output must not contain anything else
+    if _args.format == mApplication.outputLib.FORMAT_TEXT:
+        displayAppFilterSuggestion()
 
     detail            = _args.detail
     parentApplication = _args.parent_application
     packageName       = _args.package
     keyword           = _args.keyword
     listInactive      = not _args.list_inactive
+    limit             = _args.limit
+    offset            = (max(_args.page, 1) - 1) * limit if limit else 0
+    outputFormat      = _args.format
+
+    try:
+        fields = mApplication.outputLib.parseFields(_args.fields)
+    except ValueError as error:
+        mCore.displayLib.Display.displayError(str(error))
+        return
+
+    if _args.developer or _args.email or _args.document_url:
+        applicationList = mApplication.applicationInfoAbs.ApplicationInfo.listByOwnership(developer=_args.developer,
+                                                                                          email=_args.email,
+                                                                                          documentUrl=_args.document_url,
+                                                                                          parentApplication=parentApplication,
+                                                                                          packageName=packageName,
+                                                                                          keyword=keyword,
+                                                                                          ignoreInactive=listInactive,
+                                                                                          lazy=outputFormat != mApplication.outputLib.FORMAT_TEXT,
+                                                                                          latestOnly=_args.latest_only)
+        applicationList = mApplication.catalogLib.selectRange(applicationList, key=lambda x: x.name(), limit=limit, offset=offset)
+    else:
+        applicationList = mApplication.applicationInfoAbs.ApplicationInfo.list(parentApplication=parentApplication,
+                                                                               packageName=packageName,
+                                                                               keyword=keyword,
+                                                                               ignoreInactive=listInactive,
+                                                                               limit=limit,
+                                                                               offset=offset,
+                                                                               lazy=outputFormat != mApplication.outputLib.FORMAT_TEXT,
+                                                                               latestOnly=_args.latest_only)
+
+    if outputFormat != mApplication.outputLib.FORMAT_TEXT:
+        writer = mApplication.outputLib.RecordWriter(outputFormat, fields=fields)
+        writer.writeRecords([x.asDict() for x in applicationList])
+        return
 
-    applicationList = mApplication.applicationInfoAbs.ApplicationInfo.list(parentApplication=parentApplication,
-                                                                           packageName=packageName,
-                                                                           keyword=keyword,
-                                                                           ignoreInactive=listInactive)
     if not applicationList:
         mCore.displayLib.Display.displayInfo('No application found.')
         return
 
     mCore.displayLib.Display.displayBlankLine()
 
-    for application in  applicationList:
-
-        if detail:
-            mCore.displayLib.Display.displayInfo(application, startNewLine=False)
-        else:
+    if detail:
+        mCore.displayLib.Display.displayInfo(mApplication.applicationInfoAbs.ApplicationInfo.renderList(applicationList),
+                                             startNewLine=False)
+    else:
+        for application in  applicationList:
             mCore.displayLib.Display.displayInfo('{}{}{}'.format(application.name().ljust(50),
                                                                  application.versionStr().ljust(10),
                                                                  application.getParentApplicationsAsStr()),
                                                  endNewLine=False)
 
-    if not detail:
         mCore.displayLib.Display.displayBlankLine()
 
     mCore.displayLib.Display.displayInfo(('\n{} application(s) listed.\n'.format(len(applicationList))))
@@ -124,6 +215,8 @@ def listApplications():
 #  @return None - None.
 def search():
 
+    import mApplication.fuzzySearchLib
+
     parser = argparse.ArgumentParser(description='Search applications')
 
     parser.add_argument('keyword',
@@ -154,42 +247,119 @@ def search():
                         help='Name of the package, the applications will be listed for',
                         required=False)
 
+    parser.add_argument('-l',
+                        '--limit',
+                        type=int,
+                        default=None,
+                        help='Maximum number of applications to be listed',
+                        required=False)
+
+    parser.add_argument('-pg',
+                        '--page',
+                        type=int,
+                        default=1,
+                        help='Page of the applications to be listed, starts from 1, used with --limit',
+                        required=False)
+
+    parser.add_argument('-lo',
+                        '--latest-only',
+                        action='store_true',
+                        help='List only the latest version of each application if several releases are visible')
+
+    parser.add_argument('-f',
+                        '--format',
+                        type=str,
+                        default=mApplication.outputLib.FORMAT_TEXT,
+                        choices=mApplication.outputLib.FORMATS,
+                        help='Output format, machine-readable formats are written without importing app info modules '
+                             'if a catalog is available',
+                        required=False)
+
+    parser.add_argument('-fi',
+                        '--fields',
+                        type=str,
+                        default='',
+                        help='Fields written in machine-readable formats separated by comma, '
+                             'default is {}'.format(','.join(mApplication.outputLib.DEFAULT_FIELDS)),
+                        required=False)
+
+    parser.add_argument('-fz',
+                        '--fuzzy',
+                        action='store_true',
+                        help='Typo tolerant search of the names and keywords, applications are listed in order of similarity')
+
+    parser.add_argument('-th',
+                        '--threshold',
+                        type=float,
+                        default=mApplication.fuzzySearchLib.DEFAULT_THRESHOLD,
+                        help='Minimum similarity between 0.0 and 1.0, used with --fuzzy',
+                        required=False)
+
+    parser.add_argument('-t',
+                        '--top',
+                        type=int,
+                        default=mApplication.fuzzySearchLib.DEFAULT_TOP,
+                        help='Maximum number of the most similar applications to be listed, used with --fuzzy',
+                        required=False)
+
     _args = parser.parse_args()
 
-    displayAppFilterSuggestion()
+    # Machine-readable output must not contain anything else
+    if _args.format == mApplication.outputLib.FORMAT_TEXT:
+        displayAppFilterSuggestion()
+
+    if _args.fuzzy:
+        searchFuzzy(_args)
+        return
 
     keyword           = _args.keyword.lower()
     detail            = _args.detail
     parentApplication = _args.parent_application
     packageName       = _args.package
     listInactive      = not _args.list_inactive
+    limit             = _args.limit
+    offset            = (max(_args.page, 1) - 1) * limit if limit else 0
+    outputFormat      = _args.format
+
+    try:
+        fields = mApplication.outputLib.parseFields(_args.fields)
+    except ValueError as error:
+        mCore.displayLib.Display.displayError(str(error))
+        return
 
     applicationList = mApplication.applicationInfoAbs.ApplicationInfo.list(parentApplication=parentApplication,
                                                                            packageName=packageName,
                                                                            keyword=keyword,
-                                                                           ignoreInactive=listInactive)
+                                                                           ignoreInactive=listInactive,
+                                                                           limit=limit,
+                                                                           offset=offset,
+                                                                           lazy=outputFormat != mApplication.outputLib.FORMAT_TEXT,
+                                                                           latestOnly=_args.latest_only)
+
+    if outputFormat != mApplication.outputLib.FORMAT_TEXT:
+        writer = mApplication.outputLib.RecordWriter(outputFormat, fields=fields)
+        writer.writeRecords([x.asDict() for x in applicationList])
+        return
+
     if not applicationList:
         mCore.displayLib.Display.displayBlankLine()
         mCore.displayLib.Display.displayInfo('No application found.\n')
         return
 
-    applicationCount = 0
+    applicationCount = len(applicationList)
 
     mCore.displayLib.Display.displayBlankLine()
 
-    for application in  applicationList:
-
-        applicationCount += 1
-
-        if detail:
-            mCore.displayLib.Display.displayInfo(application, startNewLine=False)
-        else:
+    if detail:
+        mCore.displayLib.Display.displayInfo(mApplication.applicationInfoAbs.ApplicationInfo.renderList(applicationList),
+                                             startNewLine=False)
+    else:
+        for application in  applicationList:
             mCore.displayLib.Display.displayInfo('{}{}{}'.format(application.name().ljust(50),
                                                                  application.versionStr().ljust(10),
                                                                  application.getParentApplicationsAsStr()),
                                                  endNewLine=False)
 
-    if not detail:
         mCore.displayLib.Display.displayBlankLine()
 
     if applicationCount:
@@ -197,6 +367,239 @@ def search():
     else:
         mCore.displayLib.Display.displayInfo('No application found.\n')
 
+#
+## @brief Search applications by names and keywords similar to the searched keyword.
+#
+#  @param args [ argparse.Namespace | None | in  ] - Arguments of search command.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def searchFuzzy(args):
+
+    outputFormat = args.format
+
+    try:
+        fields = mApplication.outputLib.parseFields(args.fields, extraFields=['score'])
+    except ValueError as error:
+        mCore.displayLib.Display.displayError(str(error))
+        return
+
+    if not args.fields:
+        fields.append('score')
+
+    results = mApplication.applicationInfoAbs.ApplicationInfo.fuzzySearch(args.keyword,
+                                                                          parentApplication=args.parent_application,
+                                                                          packageName=args.package,
+                                                                          ignoreInactive=not args.list_inactive,
+                                                                          threshold=args.threshold,
+                                                                          top=args.top,
+                                                                          lazy=outputFormat != mApplication.outputLib.FORMAT_TEXT,
+                                                                          latestOnly=args.latest_only)
+
+    if outputFormat != mApplication.outputLib.FORMAT_TEXT:
+        writer = mApplication.outputLib.RecordWriter(outputFormat, fields=fields, extraFields=['score'])
+        writer.writeRecords([dict(x.asDict(), score=round(score, 3)) for score, x in results])
+        return
+
+    mCore.displayLib.Display.displayBlankLine()
+
+    if not results:
+        mCore.displayLib.Display.displayInfo('No application found.\n')
+        return
+
+    if args.detail:
+        mCore.displayLib.Display.displayInfo(mApplication.applicationInfoAbs.ApplicationInfo.renderList([x[1] for x in results]),
+                                             startNewLine=False)
+    else:
+        for score, application in results:
+            mCore.displayLib.Display.displayInfo('{}{}{}{}'.format('{:.2f}'.format(score).ljust(8),
+                                                                   application.name().ljust(50),
+                                                                   application.versionStr().ljust(10),
+                                                                   application.getParentApplicationsAsStr()),
+                                                 endNewLine=False)
+
+        mCore.displayLib.Display.displayBlankLine()
+
+    mCore.displayLib.Display.displayInfo('\n{} application(s) listed.\n'.format(len(results)))
+
+#
+## @brief Build frozen catalog artifact for the current environment.
+#
+#  Artifact can be provided by mApplication.catalogLib.CATALOG_FILE_ENV_VARIABLE environment variable so
+#  applications are listed from it instead of searching the packages.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def buildCatalog():
+
+    import mApplication.sqliteCatalogLib
+
+    parser = argparse.ArgumentParser(description='Build frozen catalog artifact for the current environment')
+
+    parser.add_argument('output',
+                        type=str,
+                        help='Absolute path of the catalog artifact file to be written')
+
+    parser.add_argument('-p',
+                        '--package',
+                        type=str,
+                        nargs='*',
+                        default=[],
+                        help='Names of the packages, the catalog will be built for, all packages are used if not provided',
+                        required=False)
+
+    parser.add_argument('-b',
+                        '--binary',
+                        action='store_true',
+                        help='Write memory-mapped binary catalog instead of JSON, which is suitable for very large environments')
+
+    parser.add_argument('-s',
+                        '--sqlite',
+                        action='store_true',
+                        help='Write SQLite catalog, which is queried by indexed SQL queries and can be updated in place')
+
+    parser.add_argument('-u',
+                        '--update',
+                        action='store_true',
+                        help='Update applications of the given packages in the existing SQLite catalog instead of rebuilding it')
+
+    _args = parser.parse_args()
+
+    if _args.update:
+
+        if not _args.package or not mApplication.sqliteCatalogLib.isSQLiteCatalog(_args.output):
+            mCore.displayLib.Display.displayError('\nUpdate requires an existing SQLite catalog and names of the packages\n')
+            return
+
+        _catalog = mApplication.sqliteCatalogLib.SQLiteCatalog(_args.output)
+        count = _catalog.updatePackages(_args.package)
+        _catalog.close()
+
+        mCore.displayLib.Display.displayInfo('\n{} application(s) updated in catalog: {}\n'.format(count, _args.output))
+        return
+
+    _catalog = mApplication.catalogLib.Catalog.build(packageNames=_args.package)
+
+    if _args.sqlite:
+        mApplication.sqliteCatalogLib.write(_catalog, _args.output)
+    else:
+        _catalog.write(_args.output, binary=_args.binary)
+
+    mCore.displayLib.Display.displayInfo('\n{} application(s) written in catalog: {}\n'.format(len(_catalog),
+                                                                                              _args.output))
+
+#
+## @brief Build completion index used by the shell completion scripts of the commands of this package.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def buildCompletionIndex():
+
+    import mApplication.completionLib
+
+    parser = argparse.ArgumentParser(description='Build completion index used by shell completion of mapplication commands')
+
+    parser.add_argument('-o',
+                        '--output',
+                        type=str,
+                        default='',
+                        help='Absolute path of the index file, default is {}'.format(mApplication.completionLib.getCompletionIndexFilePath()),
+                        required=False)
+
+    _args = parser.parse_args()
+
+    filePath = mApplication.completionLib.writeCompletionIndex(_args.output)
+
+    mCore.displayLib.Display.displayInfo('\nCompletion index written: {}\n'.format(filePath))
+
+#
+## @brief Display differences between the applications of two environments or releases.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def diffCatalogs():
+
+    import mApplication.catalogDiffLib
+
+    parser = argparse.ArgumentParser(description='Display differences between the applications of two environments or releases')
+
+    parser.add_argument('old',
+                        type=str,
+                        help='Catalog artifact file or search paths separated by {} of the old environment'.format(os.pathsep))
+
+    parser.add_argument('new',
+                        type=str,
+                        help='Catalog artifact file or search paths separated by {} of the new environment'.format(os.pathsep))
+
+    parser.add_argument('-j',
+                        '--json',
+                        action='store_true',
+                        help='Display differences as JSON')
+
+    _args = parser.parse_args()
+
+    try:
+        catalogDiff = mApplication.catalogDiffLib.CatalogDiff.fromSources(_args.old, _args.new)
+    except (ValueError, RuntimeError) as error:
+        mCore.displayLib.Display.displayError(str(error))
+        return
+
+    if _args.json:
+        mApplication.outputLib.writeDocument(catalogDiff.asDict())
+        return
+
+    if catalogDiff.isEmpty():
+        mCore.displayLib.Display.displayInfo('\nNo difference found.\n')
+        return
+
+    mCore.displayLib.Display.displayBlankLine()
+
+    for title, records, prefix in (('Added', catalogDiff.added(), '+'), ('Removed', catalogDiff.removed(), '-')):
+
+        if not records:
+            continue
+
+        mCore.displayLib.Display.displayInfo('{}:'.format(title), endNewLine=False)
+
+        for record in records:
+            mCore.displayLib.Display.displayInfo('{} {}{}{}'.format(prefix,
+                                                                    record['name'].ljust(50),
+                                                                    record['versionStr'].ljust(10),
+                                                                    record['package']),
+                                                 endNewLine=False)
+
+        mCore.displayLib.Display.displayBlankLine()
+
+    if catalogDiff.versionChanged():
+
+        mCore.displayLib.Display.displayInfo('Version changed:', endNewLine=False)
+
+        for oldRecord, newRecord in catalogDiff.versionChanged():
+            mCore.displayLib.Display.displayInfo('~ {}{} -> {}'.format(newRecord['name'].ljust(50),
+                                                                       oldRecord['versionStr'],
+                                                                       newRecord['versionStr']),
+                                                 endNewLine=False)
+
+        mCore.displayLib.Display.displayBlankLine()
+
+    if catalogDiff.parentApplicationsChanged():
+
+        mCore.displayLib.Display.displayInfo('Parent applications changed:', endNewLine=False)
+
+        for oldRecord, newRecord in catalogDiff.parentApplicationsChanged():
+            mCore.displayLib.Display.displayInfo('~ {}{} -> {}'.format(newRecord['name'].ljust(50),
+                                                                       ', '.join(oldRecord['parentApplications']),
+                                                                       ', '.join(newRecord['parentApplications'])),
+                                                 endNewLine=False)
+
+        mCore.displayLib.Display.displayBlankLine()
+
+    mCore.displayLib.Display.displayInfo('{} unchanged package(s) skipped.\n'.format(len(catalogDiff.unchangedPackages())))
+
 #
 ## @brief Display app filter suggestion.
 #
@@ -25,10 +25,18 @@
 # ----------------------------------------------------------------------------------------------------
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
+import os
 import sys
+import types
 import inspect
 import importlib
+import threading
+import traceback
 
+import mApplication.catalogLib
+import mApplication.contentHashLib
+import mApplication.discoveryLib
+import mApplication.fuzzySearchLib
 import mApplication.parentApplicationLib
 
 import mCore.platformLib
@@ -58,6 +66,64 @@ class ApplicationInfo(object):
     #  application available in the packages.
     INFO_MODULE_FILE_BASE_NAME = 'applicationInfoLib'
 
+    ## [ str ] - Template of the string representation, @see ApplicationInfo.asStr.
+    STR_TEMPLATE        = ('\n'
+                           'Name                : {name}\n'
+                           'Version             : {version}\n'
+                           'Description         : {description}\n'
+                           'Icon File Name      : {iconFileName}\n'
+                           'Parent Applications : {parentApplications}\n'
+                           'Keywords            : {keywords}\n'
+                           'GUI                 : {isGUI}\n'
+                           'Python Command      : {pythonCommand}\n'
+                           'Command             : {command}\n'
+                           'Menu Path           : {menuPath}\n'
+                           'Full Menu Path      : {fullMenuPath}\n'
+                           'Package Path        : {packagePath}\n'
+                           'Documents           : {documents}'
+                           'Developers          : {developers}')
+
+    ## [ str ] - Template of the documents and developers in the string representation.
+    STR_ITEM_TEMPLATE   = '                      {} : {}'
+
+    ## [ str ] - Template of the HTML representation, @see ApplicationInfo.asHTML.
+    HTML_TEMPLATE       = ('<b>Name                 :</b> {name}<br><br>'
+                           '<b>Version              :</b> {version}<br><br>'
+                           '<b>Description          :</b> {description}<br><br>'
+                           '<b>Parent Applications  :</b> {parentApplications}<br><br>'
+                           '<b>Keywords             :</b> {keywords}<br><br>'
+                           '<b>GUI                  :</b> {isGUI}<br><br>'
+                           '<b>Python Command       :</b> {pythonCommand}<br><br>'
+                           '<b>Command              :</b> {command}<br><br>'
+                           '<b>Menu Path            :</b> {menuPath}<br><br>'
+                           '<b>Full Menu Path       :</b> {fullMenuPath}<br><br>'
+                           '<b>Path                 :</b> {packagePath}<br><br>'
+                           '<b>Documents           :</b> <br>{documents}<br>'
+                           '<b>Developers          :</b> <br>{developers}<br>')
+
+    ## [ str ] - Template of the documents and developers in the HTML representation.
+    HTML_ITEM_TEMPLATE  = '    <b>{} :</b> {}<br>'
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED STATIC MEMBERS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## [ dict ] - Negative cache of the app info modules failed to be imported or app info classes failed to be
+    #  instantiated. Keys are tuples of (file path, class name), class name is None for the modules failed to be
+    #  imported. Values are dict instances, keys of them are: mtime, contentHash, error, traceback.
+    _failedModules      = {}
+
+    ## [ threading.Lock ] - Lock for the negative cache, so applications can be listed from multiple threads.
+    _failedModulesLock  = threading.Lock()
+
+    ## [ dict ] - Imported app info modules, keys are names of the modules in sys.modules, values are tuples of (file
+    #  path, modification time, content hash) of the files they are imported from, @see ApplicationInfo._importModule.
+    _loadedModules      = {}
+
+    ## [ threading.Lock ] - Lock for the imported app info modules.
+    _loadedModulesLock  = threading.Lock()
+
     #
     # ------------------------------------------------------------------------------------------------
     # BUILT-IN METHODS
@@ -71,7 +137,10 @@ class ApplicationInfo(object):
     def __init__(self):
 
         ## [ mMecoPackage.packageLib.Package ] - Package library.
-        self._package = mMecoPackage.packageLib.Package(path=inspect.getfile(self.__class__))
+        self._package  = mMecoPackage.packageLib.Package(path=self._getFilePath())
+
+        ## [ dict ] - Rendered representations, keys are: str, html.
+        self._rendered = {}
 
         # INFO
 
@@ -226,6 +295,74 @@ class ApplicationInfo(object):
 
             self._fullMenuPath = '/'.join(menuPath)
 
+    #
+    ## @brief Get absolute path of the app info module this class is defined in.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the file.
+    def _getFilePath(self):
+
+        return inspect.getfile(self.__class__)
+
+    #
+    ## @brief Get name of the package this application belongs to.
+    #
+    #  Packages in zip archives can't be resolved on the file system, name of the Python package the app info module
+    #  is in is used for them.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Name of the package.
+    def _getPackageName(self):
+
+        if mApplication.discoveryLib.splitArchivePath(os.path.abspath(self._getFilePath())):
+            return self.__class__.__module__.split('.')[0]
+
+        return self.package().name()
+
+    #
+    ## @brief Get absolute path of the package this application belongs to.
+    #
+    #  Absolute path of the zip archive is provided for the packages in zip archives.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the package.
+    def _getPackagePath(self):
+
+        archivePath = mApplication.discoveryLib.splitArchivePath(os.path.abspath(self._getFilePath()))
+        if archivePath:
+            return archivePath[0]
+
+        return self.package().path()
+
+    #
+    ## @brief Get values of the fields in the representation templates.
+    #
+    #  @param documents  [ str | None | in  ] - Rendered documents.
+    #  @param developers [ str | None | in  ] - Rendered developers.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are the fields in ApplicationInfo.STR_TEMPLATE and ApplicationInfo.HTML_TEMPLATE.
+    def _getRenderValues(self, documents, developers):
+
+        return {'name'               : self._name,
+                'version'            : self._versionStr,
+                'description'        : self._description,
+                'iconFileName'       : self._iconFileName,
+                'parentApplications' : self.getParentApplicationsAsStr(),
+                'keywords'           : self.getKeywordsAsStr(),
+                'isGUI'              : 'True' if self._isGUI else 'False',
+                'pythonCommand'      : self._pythonCommand,
+                'command'            : self._command,
+                'menuPath'           : self._menuPath,
+                'fullMenuPath'       : self._fullMenuPath,
+                'packagePath'        : self._getPackagePath(),
+                'documents'          : documents,
+                'developers'         : developers}
+
     #
     # ------------------------------------------------------------------------------------------------
     # PROPERTY METHODS
@@ -475,118 +612,115 @@ class ApplicationInfo(object):
     #
     ## @brief String representation.
     #
+    #  Representation is rendered from ApplicationInfo.STR_TEMPLATE once and kept, since information of the
+    #  application doesn't change after it is initialized.
+    #
     #  @exception N/A
     #
     #  @return str - Information about the application in human readable form.
     def asStr(self):
 
-        info = '\n'
-        info += 'Name                : {}\n'.format(self._name)
-        info += 'Version             : {}\n'.format(self._versionStr)
-        info += 'Description         : {}\n'.format(self._description)
-        info += 'Icon File Name      : {}\n'.format(self._iconFileName)
-
-        info += 'Parent Applications : {}\n'.format(self.getParentApplicationsAsStr())
-        info += 'Keywords            : {}\n'.format(self.getKeywordsAsStr())
+        info = self._rendered.get('str')
+        if info is not None:
+            return info
 
-        isGUI = 'True' if self._isGUI else 'False'
-        info += 'GUI                 : {}\n'.format(isGUI)
-
-        info += 'Python Command      : {}\n'.format(self._pythonCommand)
-        info += 'Command             : {}\n'.format(self._command)
-
-        info += 'Menu Path           : {}\n'.format(self._menuPath)
-        info += 'Full Menu Path      : {}\n'.format(self._fullMenuPath)
-
-        info += 'Package Path        : {}\n'.format(self._package.path())
-
-        documents = ''
         if self._documents:
-            documents = '\n'
-            for d in self._documents:
-                documents += '                      {} : {}'.format(d['title'].ljust(15), d['url'])
-            documents += '\n'
-
-        if not documents:
+            documents = '\n{}\n'.format(''.join([ApplicationInfo.STR_ITEM_TEMPLATE.format(x['title'].ljust(15), x['url'])
+                                                  for x in self._documents]))
+        else:
             documents = 'N/A\n'
 
-        info += 'Documents           : {}'.format(documents)
-
-
-        developers = ''
         if self._developers:
-            developers = '\n'
-            for d in self._developers:
-                for i in d:
-                    developers += '                      {} : {}\n'.format(i.title().ljust(15), d[i])
-                developers += '\n'
-
-        if not developers:
+            lines = []
+            for developer in self._developers:
+                lines.extend(['{}\n'.format(ApplicationInfo.STR_ITEM_TEMPLATE.format(x.title().ljust(15), developer[x]))
+                              for x in developer])
+                lines.append('\n')
+            developers = '\n{}'.format(''.join(lines))
+        else:
             developers = 'N/A'
 
-        info += 'Developers          : {}'.format(developers)
+        info = ApplicationInfo.STR_TEMPLATE.format(**self._getRenderValues(documents, developers))
+
+        self._rendered['str'] = info
 
         return info
 
     #
     ## @brief Get HTML string representation.
     #
-    #  This method provides information so it can be used on a GUI such as about dialog.
+    #  This method provides information so it can be used on a GUI such as about dialog. Representation is rendered
+    #  from ApplicationInfo.HTML_TEMPLATE once and kept.
     #
     #  @exception N/A
     #
     #  @return str - Information about the application in human readable form in HTML format.
     def asHTML(self):
 
-        info = ''
-
-        info += '<b>Name                 :</b> {}<br><br>'.format(self._name)
-        info += '<b>Version              :</b> {}<br><br>'.format(self._versionStr)
-        info += '<b>Description          :</b> {}<br><br>'.format(self._description)
-
-        info += '<b>Parent Applications  :</b> {}<br><br>'.format(self.getParentApplicationsAsStr())
-        info += '<b>Keywords             :</b> {}<br><br>'.format(self.getKeywordsAsStr())
-
-        isGUI = 'True' if self._isGUI else 'False'
-        info += '<b>GUI                  :</b> {}<br><br>'.format(isGUI)
+        info = self._rendered.get('html')
+        if info is not None:
+            return info
 
-        info += '<b>Python Command       :</b> {}<br><br>'.format(self._pythonCommand)
-        info += '<b>Command              :</b> {}<br><br>'.format(self._command)
-
-        info += '<b>Menu Path            :</b> {}<br><br>'.format(self._menuPath)
-        info += '<b>Full Menu Path       :</b> {}<br><br>'.format(self._fullMenuPath)
-
-        info += '<b>Path                 :</b> {}<br><br>'.format(self._package.path())
-
-        documents = ''
         if self._documents:
-            documents = '<br>'
-            for d in self._documents:
-                documents += '    <b>{} :</b> {}<br>'.format(d['title'].ljust(15), d['url'])
-            documents += '<br>'
-
-        if not documents:
+            documents = '<br>{}<br>'.format(''.join([ApplicationInfo.HTML_ITEM_TEMPLATE.format(x['title'].ljust(15), x['url'])
+                                                    for x in self._documents]))
+        else:
             documents = 'N/A<br>'
 
-        info += '<b>Documents           :</b> <br>{}<br>'.format(documents)
+        lines = []
+        for developer in self._developers:
+            lines.extend([ApplicationInfo.HTML_ITEM_TEMPLATE.format(x.title().ljust(15), developer[x]) for x in developer])
+            lines.append('<br>')
 
+        developers = '<br>{}'.format(''.join(lines))
 
-        developers = '<br>'
-        if self._developers:
-            developers = '<br>'
-            for d in self._developers:
-                for i in d:
-                    developers += '    <b>{} :</b> {}<br>'.format(i.title().ljust(15), d[i])
-                developers += '<br>'
-
-        if not developers:
-            developers = 'N/A<br>'
-
-        info += '<b>Developers          :</b> <br>{}<br>'.format(developers)
+        info = ApplicationInfo.HTML_TEMPLATE.format(**self._getRenderValues(documents, developers))
 
+        self._rendered['html'] = info
 
         return info
 
+    #
+    ## @brief Get dict representation.
+    #
+    #  This method provides metadata of the application, which can be stored in catalogs and used without importing
+    #  the application info module, @see mApplication.catalogLib.Catalog.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Metadata of the application.
+    def asDict(self):
+
+        return {'package'             : self._getPackageName(),
+                'packagePath'         : self._getPackagePath(),
+                'module'              : self.__class__.__module__,
+                'className'           : self.__class__.__name__,
+                'filePath'            : os.path.abspath(self._getFilePath()),
+                'name'                : self._name,
+                'versionMajor'        : self._versionMajor,
+                'versionMinor'        : self._versionMinor,
+                'versionFix'          : self._versionFix,
+                'versionStr'          : self._versionStr,
+                'windowTitle'         : self._windowTitle,
+                'isActive'            : self._isActive,
+                'description'         : self._description,
+                'iconFileName'        : self._iconFileName,
+                'iconFilePath'        : self.getIconFileAbsolutePath(),
+                'usePlatformIcon'     : self._usePlatformIcon,
+                'parentApplications'  : list(self._parentApplications),
+                'keywords'            : list(self._keywords),
+                'isGUI'               : self._isGUI,
+                'runAsPanelInNuke'    : self._runAsPanelInNuke,
+                'documents'           : [dict(x) for x in self._documents],
+                'pythonCommand'       : self._pythonCommand,
+                'command'             : self._command,
+                'menuPath'            : self._menuPath,
+                'fullMenuPath'        : self._fullMenuPath,
+                'menuSeparatorBefore' : self._menuSeparatorBefore,
+                'menuSeparatorAfter'  : self._menuSeparatorAfter,
+                'developers'          : [dict(x) for x in self._developers]
+                }
+
     #
     ## @brief Get parent applications as a string separated by comma.
     #
@@ -657,6 +791,24 @@ class ApplicationInfo(object):
 
         return ', '.join(emails)
 
+    #
+    ## @brief Launch the application.
+    #
+    #  Python command is compiled once and run, otherwise terminal command is run in a new process,
+    #  @see mApplication.launchLib.launch.
+    #
+    #  @param namespace [ dict | None | in  ] - Namespace the Python command is executed in, namespace of __main__
+    #  module is used if None is provided.
+    #
+    #  @exception N/A
+    #
+    #  @return subprocess.Popen - Process of the terminal command, None is returned if a Python command is run.
+    def launch(self, namespace=None):
+
+        import mApplication.launchLib
+
+        return mApplication.launchLib.launch(self, namespace=namespace)
+
     #
     ## @brief Get icon file absolute path used by this application.
     #
@@ -665,7 +817,7 @@ class ApplicationInfo(object):
     #  @return str - Absolute path of the icon file.
     def getIconFileAbsolutePath(self):
 
-        _iconLib = mQtWidgets.iconLib.Icon(inspect.getfile(self.__class__))
+        _iconLib = mQtWidgets.iconLib.Icon(self._getFilePath())
 
         if not self._iconFileName:
 
@@ -686,7 +838,7 @@ class ApplicationInfo(object):
     #  @return QIcon - QIcon instance.
     def getIcon(self):
 
-        _iconLib = mQtWidgets.iconLib.Icon(inspect.getfile(self.__class__))
+        _iconLib = mQtWidgets.iconLib.Icon(self._getFilePath())
 
         if not self._iconFileName:
 
@@ -707,7 +859,7 @@ class ApplicationInfo(object):
     #  @return QPixmap - QPixmap instance.
     def getPixmap(self):
 
-        _iconLib = mQtWidgets.iconLib.Icon(inspect.getfile(self.__class__))
+        _iconLib = mQtWidgets.iconLib.Icon(self._getFilePath())
 
         if not self._iconFileName:
 
@@ -724,86 +876,1140 @@ class ApplicationInfo(object):
     # ------------------------------------------------------------------------------------------------
     # STATIC METHODS
     # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get app info modules and classes failed to be imported or instantiated during listing.
+    #
+    #  Failed modules and classes are skipped by ApplicationInfo.list method until their files are modified.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Keys of dict instances are: filePath, className, mtime, contentHash, error, traceback.
+    #  contentHash is None unless content hash validation is enabled, @see mApplication.contentHashLib.
+    #  className is None for the modules failed to be imported.
+    @staticmethod
+    def getFailedModules():
+
+        failedModules = []
+
+        with ApplicationInfo._failedModulesLock:
+            items = list(ApplicationInfo._failedModules.items())
+
+        for key, value in sorted(items, key=lambda x: (x[0][0], x[0][1] or '')):
+
+            failed = {'filePath'  : key[0],
+                      'className' : key[1]}
+
+            failed.update(value)
+
+            failedModules.append(failed)
+
+        return failedModules
+
+    #
+    ## @brief Clear the negative cache so failed app info modules and classes are tried again.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    @staticmethod
+    def clearFailedModules():
+
+        with ApplicationInfo._failedModulesLock:
+            ApplicationInfo._failedModules.clear()
+
     #
     ## @brief List all application info classes (applications) available in the packages.
     #
-    #  @param parentApplication [ str  | None | in  ] - Parent application name, which listed applications can be run in.
-    #  @param packageName       [ str  | None | in  ] - Name of the package, the applications will be list for.
-    #  @param keyword           [ str  | None | in  ] - Keyword to be searched.
-    #  @param ignoreInactive    [ bool | True | in  ] - Ignore, therefore do not list inactive applications.
+    #  @param parentApplication [ str  | None  | in  ] - Parent application name, which listed applications can be run in.
+    #  @param packageName       [ str  | None  | in  ] - Name of the package, the applications will be list for.
+    #  @param keyword           [ str  | None  | in  ] - Keyword to be searched.
+    #  @param ignoreInactive    [ bool | True  | in  ] - Ignore, therefore do not list inactive applications.
+    #  @param limit             [ int  | None  | in  ] - Maximum number of applications to be listed, None means no limit.
+    #  @param offset            [ int  | 0     | in  ] - Number of applications to be skipped, used for pagination.
+    #  @param lazy              [ bool | False | in  ] - List proxies populated from the catalog instead of importing
+    #  app info modules if a catalog is available, @see mApplication.applicationInfoAbs.ApplicationInfoProxy.
+    #  @param latestOnly        [ bool | False | in  ] - List only the latest version of each application, if several
+    #  releases of a package are visible. Older versions aren't imported if a catalog is available.
+    #
+    #  Applications are sorted by their names. If a limit is provided, only the applications in the requested range
+    #  are selected by a heap based partial selection instead of sorting all of them.
+    #
+    #  Frozen catalog artifact set by mApplication.catalogLib.CATALOG_FILE_ENV_VARIABLE environment variable or the
+    #  shared cache set by mApplication.sharedCacheLib.SHARED_CACHE_DIRECTORY_ENV_VARIABLE environment variable is
+    #  used instead of searching the packages if it matches the environment, @see mApplication.catalogLib.Catalog.
+    #
+    #  Search paths are canonicalized and each directory is scanned only once, @see mApplication.discoveryLib. App info
+    #  modules of the packages shadowed by the packages with the same name earlier on sys.path are loaded from their own
+    #  files, @see ApplicationInfo._importModule.
+    #
+    #  App info modules failed to be imported and app info classes failed to be instantiated are skipped and
+    #  recorded in a negative cache until their files are modified, @see ApplicationInfo.getFailedModules.
     #
     #  @exception N/A
     #
     #  @return list of mApplication.applicationInfoAbs.ApplicationInfo - List of application info class instances.
     @staticmethod
-    def list(parentApplication=None, packageName=None, keyword=None, ignoreInactive=True):
+    def list(parentApplication=None, packageName=None, keyword=None, ignoreInactive=True, limit=None, offset=0, lazy=False,
+             latestOnly=False):
+
+        appInfoList = ApplicationInfo._iterateMatching(parentApplication=parentApplication,
+                                                       packageName=packageName,
+                                                       keyword=keyword,
+                                                       ignoreInactive=ignoreInactive,
+                                                       limit=offset + limit if limit is not None else None,
+                                                       lazy=lazy,
+                                                       latestOnly=latestOnly)
+
+        return mApplication.catalogLib.selectRange(appInfoList, key=lambda x: x.name(), limit=limit, offset=offset)
+
+    #
+    ## @brief Search application info classes by names and keywords similar to given text.
+    #
+    #  Search is typo tolerant, e.g. "lightmixr" finds "LightMixer", @see mApplication.fuzzySearchLib. Trigram index
+    #  of the catalog is used if available, @see mApplication.catalogLib.Catalog.getTrigramIndex, otherwise the
+    #  packages are searched and indexed.
+    #
+    #  @param text              [ str   | None              | in  ] - Text to be searched.
+    #  @param parentApplication [ str   | None              | in  ] - Parent application name, which found applications can be run in.
+    #  @param packageName       [ str   | None              | in  ] - Name of the package, the applications will be searched in.
+    #  @param ignoreInactive    [ bool  | True              | in  ] - Ignore, therefore do not find inactive applications.
+    #  @param threshold         [ float | DEFAULT_THRESHOLD | in  ] - Minimum similarity between 0.0 and 1.0,
+    #  @see mApplication.fuzzySearchLib.DEFAULT_THRESHOLD.
+    #  @param top               [ int   | DEFAULT_TOP       | in  ] - Maximum number of applications, None means no limit,
+    #  @see mApplication.fuzzySearchLib.DEFAULT_TOP.
+    #  @param lazy              [ bool  | False             | in  ] - Find proxies instead of importing app info modules if a
+    #  catalog is available, @see mApplication.applicationInfoAbs.ApplicationInfoProxy.
+    #  @param latestOnly        [ bool  | False             | in  ] - Find only the latest version of each application.
+    #
+    #  @exception N/A
+    #
+    #  @return list of tuple - Similarities and mApplication.applicationInfoAbs.ApplicationInfo instances, the most
+    #  similar application first.
+    @staticmethod
+    def fuzzySearch(text, parentApplication=None, packageName=None, ignoreInactive=True,
+                    threshold=mApplication.fuzzySearchLib.DEFAULT_THRESHOLD, top=mApplication.fuzzySearchLib.DEFAULT_TOP,
+                    lazy=False, latestOnly=False):
+
+        packageNames = [packageName] if packageName else None
+
+        _catalog = mApplication.catalogLib.Catalog.load()
+
+        if _catalog and _catalog.containsPackages(packageNames):
+            trigramIndex = _catalog.getTrigramIndex()
+            appInfoList  = None
+            filterRecord = lambda x: mApplication.catalogLib.Catalog.matchRecord(x,
+                                                                                 parentApplication=parentApplication,
+                                                                                 packageName=packageName,
+                                                                                 ignoreInactive=ignoreInactive)
+        else:
+            # Only names and keywords are indexed, so metadata of the applications, e.g. icon paths, isn't resolved
+            appInfoList  = list(ApplicationInfo.iterate(packageNames=packageNames))
+            records      = [{'name'      : x.name(),
+                             'keywords'  : x.keywords(),
+                             'module'    : x.__class__.__module__,
+                             'className' : x.__class__.__name__,
+                             'version'   : (x.versionMajor(), x.versionMinor(), x.versionFix()),
+                             'index'     : index} for index, x in enumerate(appInfoList)]
+            trigramIndex = mApplication.fuzzySearchLib.TrigramIndex(records)
+            filterRecord = lambda x: ApplicationInfo._matches(appInfoList[x['index']],
+                                                              parentApplication=parentApplication,
+                                                              ignoreInactive=ignoreInactive)
+
+        results = trigramIndex.search(text,
+                                      threshold=threshold,
+                                      top=None if latestOnly else top,
+                                      filterRecord=filterRecord)
+
+        if latestOnly:
+            if appInfoList is None:
+                results = _catalog.selectLatest(results, getRecord=lambda x: x[1])
+            else:
+                results = mApplication.catalogLib.selectLatest(results,
+                                                               getName=lambda x: x[1]['name'],
+                                                               getVersion=lambda x: x[1]['version'])
+            if top is not None:
+                results = results[:top]
+
+        if appInfoList is not None:
+            return [(score, appInfoList[record['index']]) for score, record in results]
+
+        found = []
+
+        for score, record in results:
+
+            if lazy:
+                found.append((score, ApplicationInfoProxy(record)))
+                continue
+
+            for _appInfo in ApplicationInfo._load(record['filePath'], record['module'], classNames=[record['className']]):
+                found.append((score, _appInfo))
+
+        return found
+
+    #
+    ## @brief List application info classes by their developers and documents.
+    #
+    #  Secondary indexes of the catalog are used if available, @see mApplication.catalogLib.Catalog.findBySecondaryKeys,
+    #  otherwise the packages are searched. Applications matching all given values and filters are listed.
+    #
+    #  @param developer         [ str  | None  | in  ] - User name of a developer, case insensitive.
+    #  @param email             [ str  | None  | in  ] - Email address of a developer, case insensitive.
+    #  @param documentUrl       [ str  | None  | in  ] - URL of a document.
+    #  @param parentApplication [ str  | None  | in  ] - Parent application name, which listed applications can be run in.
+    #  @param packageName       [ str  | None  | in  ] - Name of the package, the applications will be list for.
+    #  @param keyword           [ str  | None  | in  ] - Keyword to be searched.
+    #  @param ignoreInactive    [ bool | True  | in  ] - Ignore, therefore do not list inactive applications.
+    #  @param lazy              [ bool | False | in  ] - List proxies instead of importing app info modules if a
+    #  catalog is available, @see mApplication.applicationInfoAbs.ApplicationInfoProxy.
+    #  @param latestOnly        [ bool | False | in  ] - List only the latest version of each application.
+    #
+    #  @code
+    #  import mApplication.applicationInfoAbs
+    #  appInfoList = mApplication.applicationInfoAbs.ApplicationInfo.listByOwnership(developer='soner')
+    #  @endcode
+    #
+    #  @exception N/A
+    #
+    #  @return list of mApplication.applicationInfoAbs.ApplicationInfo - List of application info class instances
+    #  sorted by their names.
+    @staticmethod
+    def listByOwnership(developer=None, email=None, documentUrl=None, parentApplication=None, packageName=None,
+                        keyword=None, ignoreInactive=True, lazy=False, latestOnly=False):
+
+        packageNames = [packageName] if packageName else None
+
+        secondaryKeys = ((mApplication.catalogLib.INDEX_DEVELOPER, developer),
+                         (mApplication.catalogLib.INDEX_EMAIL, email),
+                         (mApplication.catalogLib.INDEX_DOCUMENT_URL, documentUrl))
+
+        _catalog = mApplication.catalogLib.Catalog.load()
+
+        if _catalog and _catalog.containsPackages(packageNames):
+
+            records = [x for x in _catalog.findBySecondaryKeys(developer=developer, email=email, documentUrl=documentUrl)
+                       if mApplication.catalogLib.Catalog.matchRecord(x,
+                                                                      parentApplication=parentApplication,
+                                                                      packageName=packageName,
+                                                                      keyword=keyword,
+                                                                      ignoreInactive=ignoreInactive)]
+
+            if latestOnly:
+                records = _catalog.selectLatest(records)
+
+            appInfoList = []
+
+            for record in records:
+
+                if lazy:
+                    appInfoList.append(ApplicationInfoProxy(record))
+                    continue
+
+                appInfoList.extend(ApplicationInfo._load(record['filePath'],
+                                                         record['module'],
+                                                         classNames=[record['className']]))
+
+            return appInfoList
 
         appInfoList = []
 
+        for _appInfo in ApplicationInfo.iterate(packageNames=packageNames):
+
+            if not ApplicationInfo._matches(_appInfo,
+                                            parentApplication=parentApplication,
+                                            keyword=keyword,
+                                            ignoreInactive=ignoreInactive):
+                continue
+
+            record = {'developers' : _appInfo.developers(), 'documents' : _appInfo.documents()}
+
+            if all([mApplication.catalogLib.normalizeSecondaryKey(index, value) in
+                    mApplication.catalogLib.getSecondaryKeys(record, index) for index, value in secondaryKeys if value]):
+                appInfoList.append(_appInfo)
+
+        appInfoList.sort(key=lambda x: x.name())
+
+        if latestOnly:
+            appInfoList = mApplication.catalogLib.selectLatest(appInfoList,
+                                                               getName=lambda x: x.name(),
+                                                               getVersion=lambda x: (x.versionMajor(), x.versionMinor(), x.versionFix()))
+
+        return appInfoList
+
+    #
+    ## @brief Find the latest version of given application, if several releases of a package are visible.
+    #
+    #  Releases of a package in several search paths are all visible, the ones shadowed by the first release on
+    #  sys.path are loaded from their own files, @see ApplicationInfo._importModule.
+    #
+    #  Version index of the catalog is used if available, @see mApplication.catalogLib.Catalog.findLatest, so older
+    #  versions aren't imported. Otherwise the packages are searched.
+    #
+    #  @param name [ str  | None  | in  ] - Name of the application.
+    #  @param lazy [ bool | False | in  ] - Find a proxy instead of importing the app info module if a catalog is
+    #  available, @see mApplication.applicationInfoAbs.ApplicationInfoProxy.
+    #
+    #  @exception N/A
+    #
+    #  @return mApplication.applicationInfoAbs.ApplicationInfo - Application info class instance, None is returned if
+    #  there is no such application.
+    @staticmethod
+    def findLatest(name, lazy=False):
+
+        _catalog = mApplication.catalogLib.Catalog.load()
+
+        if _catalog and _catalog.containsPackages(None):
+            appInfoList = ApplicationInfo._loadRecords([x for x in [_catalog.findLatest(name)] if x], lazy=lazy)
+        else:
+            appInfoList = ApplicationInfo.findVersionRange(name)
+
+        return appInfoList[0] if appInfoList else None
+
+    #
+    ## @brief Find given version of given application.
+    #
+    #  Version index of the catalog is used if available, @see mApplication.catalogLib.Catalog.findVersion, otherwise
+    #  the packages are searched.
+    #
+    #  @param name    [ str          | None  | in  ] - Name of the application.
+    #  @param version [ tuple of int | None  | in  ] - Major, minor and fix versions.
+    #  @param lazy    [ bool         | False | in  ] - Find a proxy instead of importing the app info module if a catalog
+    #  is available, @see mApplication.applicationInfoAbs.ApplicationInfoProxy.
+    #
+    #  @exception N/A
+    #
+    #  @return mApplication.applicationInfoAbs.ApplicationInfo - Application info class instance, None is returned if
+    #  there is no such version.
+    @staticmethod
+    def findVersion(name, version, lazy=False):
+
+        version  = tuple(version)
+
+        _catalog = mApplication.catalogLib.Catalog.load()
+
+        if _catalog and _catalog.containsPackages(None):
+            appInfoList = ApplicationInfo._loadRecords([x for x in [_catalog.findVersion(name, version)] if x], lazy=lazy)
+        else:
+            appInfoList = [x for x in ApplicationInfo.findVersionRange(name, minimum=version)
+                           if (x.versionMajor(), x.versionMinor(), x.versionFix()) == version]
+
+        return appInfoList[0] if appInfoList else None
+
+    #
+    ## @brief Find versions of given application in given range.
+    #
+    #  Version index of the catalog is used if available, @see mApplication.catalogLib.Catalog.findVersionRange, so
+    #  versions out of the range aren't imported. Otherwise the packages are searched.
+    #
+    #  @param name    [ str          | None  | in  ] - Name of the application.
+    #  @param minimum [ tuple of int | None  | in  ] - Minimum version (inclusive), None means no minimum.
+    #  @param maximum [ tuple of int | None  | in  ] - Maximum version (exclusive), None means no maximum.
+    #  @param lazy    [ bool         | False | in  ] - Find proxies instead of importing app info modules if a catalog
+    #  is available, @see mApplication.applicationInfoAbs.ApplicationInfoProxy.
+    #
+    #  @exception N/A
+    #
+    #  @return list of mApplication.applicationInfoAbs.ApplicationInfo - Application info class instances, the latest
+    #  version first.
+    @staticmethod
+    def findVersionRange(name, minimum=None, maximum=None, lazy=False):
+
+        _catalog = mApplication.catalogLib.Catalog.load()
+
+        if _catalog and _catalog.containsPackages(None):
+            return ApplicationInfo._loadRecords(_catalog.findVersionRange(name, minimum=minimum, maximum=maximum),
+                                                lazy=lazy)
+
+        minimum = tuple(minimum) if minimum is not None else None
+        maximum = tuple(maximum) if maximum is not None else None
+
+        appInfoList = []
+
+        for _appInfo in ApplicationInfo.iterate():
+
+            if _appInfo.name() != name:
+                continue
+
+            version = (_appInfo.versionMajor(), _appInfo.versionMinor(), _appInfo.versionFix())
+
+            if (minimum is None or version >= minimum) and (maximum is None or version < maximum):
+                appInfoList.append(_appInfo)
+
+        appInfoList.sort(key=lambda x: (x.versionMajor(), x.versionMinor(), x.versionFix()), reverse=True)
+
+        return appInfoList
+
+    #
+    ## @brief List application info classes for multiple queries by a single search of the packages.
+    #
+    #  Listing applications for several parent applications one after another with ApplicationInfo.list method
+    #  searches the packages for each of them, this method searches the packages (or the catalog) once and matches
+    #  each application against all queries. Application info classes matching more than one query are shared.
+    #
+    #  @param queries [ list of dict | None  | in  ] - Queries, keys of dict instances are the filters of
+    #  ApplicationInfo.list method: parentApplication, packageName, keyword, ignoreInactive. Missing keys get the
+    #  default values of ApplicationInfo.list method.
+    #  @param lazy    [ bool         | False | in  ] - List proxies populated from the catalog instead of importing
+    #  app info modules if a catalog is available, @see mApplication.applicationInfoAbs.ApplicationInfoProxy.
+    #
+    #  @code
+    #  import mApplication.applicationInfoAbs
+    #  mayaList, nukeList = mApplication.applicationInfoAbs.ApplicationInfo.listMany([{'parentApplication': 'maya'},
+    #                                                                                {'parentApplication': 'nuke'}])
+    #  @endcode
+    #
+    #  @exception N/A
+    #
+    #  @return list of list - Lists of mApplication.applicationInfoAbs.ApplicationInfo instances sorted by their names,
+    #  one list for each query in the order of the queries.
+    @staticmethod
+    def listMany(queries, lazy=False):
+
+        queries = [{'parentApplication' : x.get('parentApplication'),
+                    'packageName'       : x.get('packageName'),
+                    'keyword'           : x.get('keyword'),
+                    'ignoreInactive'    : x.get('ignoreInactive', True)} for x in queries]
+
+        appInfoLists = [[] for x in queries]
+
+        if not queries:
+            return appInfoLists
+
+        # Packages are filtered during the search only if every query is limited to a package
+        packageNames = [x['packageName'] for x in queries]
+        if not all(packageNames):
+            packageNames = None
+
+        _catalog = mApplication.catalogLib.Catalog.load()
+
+        if _catalog and _catalog.containsPackages(packageNames):
+
+            loaded = {}
+
+            for record in _catalog.records():
+
+                indices = [index for index, query in enumerate(queries)
+                           if mApplication.catalogLib.Catalog.matchRecord(record, **query)]
+                if not indices:
+                    continue
+
+                key = (record['filePath'], record['className'])
+
+                if key not in loaded:
+                    if lazy:
+                        loaded[key] = [ApplicationInfoProxy(record)]
+                    else:
+                        loaded[key] = ApplicationInfo._load(record['filePath'],
+                                                            record['module'],
+                                                            classNames=[record['className']])
+
+                for index in indices:
+                    appInfoLists[index].extend(loaded[key])
+
+        else:
+
+            for _appInfo in ApplicationInfo.iterate(packageNames=packageNames):
+
+                appInfoPackageName = _appInfo._getPackageName().lower()
+
+                for index, query in enumerate(queries):
+
+                    if query['packageName'] and query['packageName'].lower() != appInfoPackageName:
+                        continue
+
+                    if ApplicationInfo._matches(_appInfo,
+                                                parentApplication=query['parentApplication'],
+                                                keyword=query['keyword'],
+                                                ignoreInactive=query['ignoreInactive']):
+                        appInfoLists[index].append(_appInfo)
+
+        for appInfoList in appInfoLists:
+            appInfoList.sort(key=lambda x: x.name())
+
+        return appInfoLists
+
+    #
+    ## @brief Render representations of given application info classes in one pass.
+    #
+    #  Representations are joined once instead of being written one by one, e.g. for detailed listings.
+    #
+    #  @param appInfoList [ list of mApplication.applicationInfoAbs.ApplicationInfo | None  | in  ] - Class instances.
+    #  @param html        [ bool                                                    | False | in  ] - Render HTML
+    #  representations instead of strings, @see ApplicationInfo.asHTML.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Representations separated by new lines (or <br> for HTML).
+    @staticmethod
+    def renderList(appInfoList, html=False):
+
+        if html:
+            return '<br>'.join([x.asHTML() for x in appInfoList])
+
+        return '\n'.join([x.asStr() for x in appInfoList])
+
+    #
+    ## @brief List application info classes asynchronously.
+    #
+    #  Arguments are the same as ApplicationInfo.list method, @see mApplication.asyncLib.alist.
+    #
+    #  @exception N/A
+    #
+    #  @return coroutine - Coroutine, which returns list of mApplication.applicationInfoAbs.ApplicationInfo instances.
+    @staticmethod
+    def alist(parentApplication=None, packageName=None, keyword=None, ignoreInactive=True, limit=None, offset=0, lazy=False):
+
+        import mApplication.asyncLib
+
+        return mApplication.asyncLib.alist(parentApplication=parentApplication,
+                                           packageName=packageName,
+                                           keyword=keyword,
+                                           ignoreInactive=ignoreInactive,
+                                           limit=limit,
+                                           offset=offset,
+                                           lazy=lazy)
+
+    #
+    ## @brief Iterate application info classes matching given filters asynchronously as they are found.
+    #
+    #  Arguments are the same as ApplicationInfo.list method, @see mApplication.asyncLib.aiterate.
+    #
+    #  @exception N/A
+    #
+    #  @return async generator - Async generator of mApplication.applicationInfoAbs.ApplicationInfo instances.
+    @staticmethod
+    def aiterate(parentApplication=None, packageName=None, keyword=None, ignoreInactive=True, lazy=False):
+
+        import mApplication.asyncLib
+
+        return mApplication.asyncLib.aiterate(parentApplication=parentApplication,
+                                              packageName=packageName,
+                                              keyword=keyword,
+                                              ignoreInactive=ignoreInactive,
+                                              lazy=lazy)
+
+    #
+    ## @brief Iterate application info class instances available in the packages.
+    #
+    #  Unlike ApplicationInfo.list method, no filter other than package names is applied and application info class
+    #  instances are provided as they are found.
+    #
+    #  @param packageNames [ list of str | None | in  ] - Names of the packages, applications will be iterated for,
+    #  all packages are used if None is provided.
+    #  @param paths        [ list of str | None | in  ] - Search paths, sys.path is used if None is provided. Given
+    #  paths must be importable, i.e. in sys.path, @see mApplication.environmentScanLib for other environments.
+    #
+    #  @exception N/A
+    #
+    #  @return generator - Generator of mApplication.applicationInfoAbs.ApplicationInfo instances.
+    @staticmethod
+    def iterate(packageNames=None, paths=None):
+
+        if paths is None:
+            paths = sys.path
+
+        # Search paths and package directories are tracked separately, so a package directory, which is a search
+        # path as well (e.g. the current working directory), isn't skipped
+        visitedDirectories = set()
+
+        for path in mApplication.discoveryLib.listSearchPaths(paths, includeArchives=True):
+
+            if mApplication.discoveryLib.isArchive(path):
+                for _appInfo in ApplicationInfo.iterateArchive(path, packageNames=packageNames):
+                    yield _appInfo
+                continue
+
+            directoryList = mApplication.discoveryLib.listPackageDirectories(path, visited=visitedDirectories)
+            if not directoryList:
+                continue
+
+            for directory in directoryList:
+
+                for _appInfo in ApplicationInfo.iterateDirectory(directory, packageNames=packageNames):
+                    yield _appInfo
+
+    #
+    ## @brief Iterate application info class instances available in given package directory.
+    #
+    #  @param directory    [ str         | None | in  ] - Absolute path of the package directory (Python package).
+    #  @param packageNames [ list of str | None | in  ] - Names of the packages, applications will be iterated for,
+    #  all packages are used if None is provided.
+    #
+    #  @exception N/A
+    #
+    #  @return generator - Generator of mApplication.applicationInfoAbs.ApplicationInfo instances.
+    @staticmethod
+    def iterateDirectory(directory, packageNames=None):
+
         _package    = mMecoPackage.packageLib.Package()
-        _dir        = mFileSystem.directoryLib.Directory()
         _moduleDir  = mFileSystem.directoryLib.Directory()
         _file       = mFileSystem.fileLib.File()
 
-        for path in sys.path:
+        if not _moduleDir.setDirectory(directory):
+            return
+
+        if not _package.setPackage(directory):
+            return
+
+        if packageNames:
+            if _package.name().lower() not in [x.lower() for x in packageNames]:
+                return
 
-            if not _dir.setDirectory(directory=path):
+        fileList = _moduleDir.listFilesWithAbsolutePath(extension='py')
+        if not fileList:
+            return
+
+        fileList = [x for x in fileList if x.endswith('{}.py'.format(mMecoPackage.enumLib.PackagePythonFileSuffix.kApp))]
+
+        if not fileList:
+            return
+
+        for appInfoFile in fileList:
+
+            if not _file.setFile(appInfoFile):
                 continue
 
-            directoryList = _dir.listDirectories()
-            if not directoryList:
+            moduleName = '{}.{}'.format(_moduleDir.getBaseName(), _file.baseName())
+
+            for _appInfo in ApplicationInfo._load(appInfoFile, moduleName):
+                yield _appInfo
+
+    #
+    ## @brief Iterate application info class instances available in given zip archive on sys.path.
+    #
+    #  App info modules are found in the listing of the archive, @see mApplication.discoveryLib.listArchive, and
+    #  imported by zipimport. Packages are identified by the names of the Python packages in the archive, since
+    #  package info modules can't be read from the file system.
+    #
+    #  @param path         [ str         | None | in  ] - Absolute path of the zip archive.
+    #  @param packageNames [ list of str | None | in  ] - Names of the packages, applications will be iterated for,
+    #  all packages are used if None is provided.
+    #
+    #  @exception N/A
+    #
+    #  @return generator - Generator of mApplication.applicationInfoAbs.ApplicationInfo instances.
+    @staticmethod
+    def iterateArchive(path, packageNames=None):
+
+        if packageNames:
+            packageNames = [x.lower() for x in packageNames]
+
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return
+
+        suffix = '{}.py'.format(mMecoPackage.enumLib.PackagePythonFileSuffix.kApp)
+
+        for packageName, fileName in mApplication.discoveryLib.listArchivePackageFiles(path, suffix):
+
+            if packageNames and packageName.lower() not in packageNames:
                 continue
 
-            for directory in directoryList:
+            moduleName = '{}.{}'.format(packageName, os.path.splitext(fileName)[0])
 
-                if not _moduleDir.setDirectory(directory):
-                    continue
+            for _appInfo in ApplicationInfo._load(os.path.join(path, packageName, fileName), moduleName, mtime=mtime):
+                yield _appInfo
 
-                if not _package.setPackage(directory):
-                    continue
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Iterate application info classes matching given filters.
+    #
+    #  Catalog is used if available, @see mApplication.catalogLib.Catalog.load, otherwise the packages are searched.
+    #  Application info classes are provided in name order if a catalog is used, otherwise as they are found.
+    #
+    #  @param parentApplication [ str  | None  | in  ] - Parent application name, which listed applications can be run in.
+    #  @param packageName       [ str  | None  | in  ] - Name of the package, the applications will be list for.
+    #  @param keyword           [ str  | None  | in  ] - Keyword to be searched.
+    #  @param ignoreInactive    [ bool | True  | in  ] - Ignore, therefore do not list inactive applications.
+    #  @param limit             [ int  | None  | in  ] - Number of applications needed in name order, which lets
+    #  catalogs skip importing the rest of them, None means no limit.
+    #  @param lazy              [ bool | False | in  ] - Provide proxies instead of importing app info modules if a
+    #  catalog is used.
+    #  @param latestOnly        [ bool | False | in  ] - Provide only the latest version of each application.
+    #
+    #  @exception N/A
+    #
+    #  @return generator - Generator of mApplication.applicationInfoAbs.ApplicationInfo instances.
+    @staticmethod
+    def _iterateMatching(parentApplication=None, packageName=None, keyword=None, ignoreInactive=True, limit=None, lazy=False,
+                         latestOnly=False):
 
-                if packageName:
-                    if packageName.lower() != _package.name().lower():
-                        continue
+        packageNames = [packageName] if packageName else None
 
-                fileList = _moduleDir.listFilesWithAbsolutePath(extension='py')
-                if not fileList:
-                    continue
+        _catalog = mApplication.catalogLib.Catalog.load()
+
+        if _catalog and _catalog.containsPackages(packageNames):
+
+            # Applications are selected before importing their modules
+            records = _catalog.query(parentApplication=parentApplication,
+                                     packageName=packageName,
+                                     keyword=keyword,
+                                     ignoreInactive=ignoreInactive,
+                                     limit=None if latestOnly else limit)
 
-                fileList = [x for x in fileList if x.endswith('{}.py'.format(mMecoPackage.enumLib.PackagePythonFileSuffix.kApp))]
+            if latestOnly:
+                records = _catalog.selectLatest(records)
+                if limit is not None:
+                    records = records[:limit]
 
-                if not fileList:
+            for record in records:
+
+                if lazy:
+                    yield ApplicationInfoProxy(record)
                     continue
 
-                for appInfoFile in fileList:
+                for _appInfo in ApplicationInfo._load(record['filePath'],
+                                                      record['module'],
+                                                      classNames=[record['className']]):
+                    yield _appInfo
 
-                    if not _file.setFile(appInfoFile):
-                        continue
+            return
+
+        appInfoList = (x for x in ApplicationInfo.iterate(packageNames=packageNames)
+                       if ApplicationInfo._matches(x,
+                                                   parentApplication=parentApplication,
+                                                   keyword=keyword,
+                                                   ignoreInactive=ignoreInactive))
 
-                    _module = importlib.import_module('{}.{}'.format(_moduleDir.getBaseName(), _file.baseName()))
+        if latestOnly:
+            appInfoList = mApplication.catalogLib.selectLatest(appInfoList,
+                                                               getName=lambda x: x.name(),
+                                                               getVersion=lambda x: (x.versionMajor(), x.versionMinor(), x.versionFix()))
 
-                    for name, obj in inspect.getmembers(_module):
+        for _appInfo in appInfoList:
+            yield _appInfo
 
-                        if not inspect.isclass(obj):
-                            continue
+    #
+    ## @brief Get application info classes of given metadata of applications.
+    #
+    #  @param records [ list of dict | None  | in  ] - Metadata of applications, @see ApplicationInfo.asDict.
+    #  @param lazy    [ bool         | False | in  ] - Provide proxies instead of importing app info modules.
+    #
+    #  @exception N/A
+    #
+    #  @return list of mApplication.applicationInfoAbs.ApplicationInfo - Application info class instances in the order
+    #  of the metadata.
+    @staticmethod
+    def _loadRecords(records, lazy=False):
 
-                        _appInfo = obj()
+        appInfoList = []
 
-                        if ignoreInactive and not _appInfo.isActive():
-                            continue
+        for record in records:
 
-                        if parentApplication and parentApplication != mApplication.parentApplicationLib.Application.kAll:
-                            if parentApplication not in _appInfo.parentApplications():
-                                del _appInfo
-                                continue
+            if lazy:
+                appInfoList.append(ApplicationInfoProxy(record))
+                continue
 
-                        if keyword:
-                            if not keyword in _appInfo.keywords() and not keyword in _appInfo.name().lower():
-                                continue
+            appInfoList.extend(ApplicationInfo._load(record['filePath'], record['module'], classNames=[record['className']]))
 
-                        appInfoList.append(_appInfo)
+        return appInfoList
 
-        if appInfoList:
-            appInfoList.sort(key=lambda x: x.name())
+    #
+    ## @brief Import given app info module and instantiate app info classes in it.
+    #
+    #  @param filePath   [ str         | None | in  ] - Absolute path of the app info module.
+    #  @param moduleName [ str         | None | in  ] - Name of the app info module to be imported.
+    #  @param classNames [ list of str | None | in  ] - Names of the classes to be instantiated, all classes are
+    #  instantiated if None is provided.
+    #  @param mtime      [ float       | None | in  ] - Modification time of the app info module, e.g. modification
+    #  time of the zip archive it is in, it is got from the file if None is provided.
+    #
+    #  @exception N/A
+    #
+    #  @return list of mApplication.applicationInfoAbs.ApplicationInfo - List of application info class instances.
+    @staticmethod
+    def _load(filePath, moduleName, classNames=None, mtime=None):
+
+        appInfoList = []
+
+        if mtime is None:
+            try:
+                mtime = os.stat(filePath).st_mtime
+            except OSError:
+
+                # App info modules in zip archives
+                archivePath = mApplication.discoveryLib.splitArchivePath(filePath)
+                if not archivePath:
+                    return appInfoList
+
+                mtime = os.stat(archivePath[0]).st_mtime
+
+        # Modification times can't be relied on for some deployments, @see mApplication.contentHashLib
+        contentHash = mApplication.contentHashLib.hashFile(filePath) if mApplication.contentHashLib.isEnabled() else None
+
+        if ApplicationInfo._isFailed(filePath, None, mtime, contentHash):
+            return appInfoList
+
+        try:
+            _module = ApplicationInfo._importModule(filePath, moduleName, mtime, contentHash)
+        except Exception as error:
+            ApplicationInfo._addFailed(filePath, None, mtime, error, contentHash)
+            return appInfoList
+
+        for name, obj in inspect.getmembers(_module):
+
+            if not inspect.isclass(obj):
+                continue
+
+            if classNames is not None and name not in classNames:
+                continue
+
+            if ApplicationInfo._isFailed(filePath, name, mtime, contentHash):
+                continue
+
+            try:
+                _appInfo = obj()
+            except Exception as error:
+                ApplicationInfo._addFailed(filePath, name, mtime, error, contentHash)
+                continue
+
+            appInfoList.append(_appInfo)
 
         return appInfoList
+
+    #
+    ## @brief Import given app info module.
+    #
+    #  Modules imported from an older modification time or content hash of their files are removed from sys.modules
+    #  and imported again, so modified app info modules are picked up in long running sessions. Classes of the older
+    #  modules recorded in the negative cache are removed as well.
+    #
+    #  Importing by name provides the module of the first package with the same name on sys.path, so app info modules
+    #  of the shadowed packages, e.g. other releases of a package, are loaded from their own files under unique names,
+    #  @see mApplication.discoveryLib.getShadowedModuleName.
+    #
+    #  @param filePath    [ str   | None | in  ] - Absolute path of the app info module.
+    #  @param moduleName  [ str   | None | in  ] - Name of the app info module, unique names of the modules in shadowed
+    #  packages are accepted as well.
+    #  @param mtime       [ float | None | in  ] - Current modification time of the app info module.
+    #  @param contentHash [ str   | None | in  ] - Current content hash of the app info module, None if content hash
+    #  validation is disabled, @see mApplication.contentHashLib.
+    #
+    #  @exception Exception - Errors raised by the module.
+    #
+    #  @return module - Module.
+    @staticmethod
+    def _importModule(filePath, moduleName, mtime, contentHash=None):
+
+        shadowedModuleName = mApplication.discoveryLib.getShadowedModuleName(moduleName, filePath)
+
+        isShadowed = moduleName == shadowedModuleName
+        if not isShadowed:
+            importedFilePath = mApplication.discoveryLib.getModuleFilePath(moduleName)
+            isShadowed       = not mApplication.discoveryLib.isSameModuleFile(importedFilePath, filePath)
+
+        if isShadowed:
+            moduleName = shadowedModuleName
+
+        stamp = (filePath, mtime, contentHash)
+
+        with ApplicationInfo._loadedModulesLock:
+            loaded = ApplicationInfo._loadedModules.get(moduleName)
+            if loaded is not None and loaded != stamp:
+                sys.modules.pop(moduleName, None)
+
+        if loaded is not None and loaded != stamp:
+            with ApplicationInfo._failedModulesLock:
+                for key in [x for x in ApplicationInfo._failedModules if x[0] == loaded[0]]:
+                    ApplicationInfo._failedModules.pop(key, None)
+
+        if isShadowed:
+            _module = sys.modules.get(moduleName) if loaded == stamp else None
+            if _module is None:
+                _module = ApplicationInfo._loadModuleFile(filePath, moduleName)
+        else:
+            _module = importlib.import_module(moduleName)
+
+        with ApplicationInfo._loadedModulesLock:
+            ApplicationInfo._loadedModules[moduleName] = stamp
+
+        return _module
+
+    #
+    ## @brief Load given app info module from its file under given name.
+    #
+    #  Module is executed from the source of the file, therefore modules in zip archives are loaded as well.
+    #
+    #  @param filePath   [ str | None | in  ] - Absolute path of the app info module.
+    #  @param moduleName [ str | None | in  ] - Name the module is added to sys.modules with.
+    #
+    #  @exception ImportError - If the file can't be read.
+    #  @exception Exception   - Errors raised by the module.
+    #
+    #  @return module - Module.
+    @staticmethod
+    def _loadModuleFile(filePath, moduleName):
+
+        try:
+            with open(filePath, 'rb') as _file:
+                source = _file.read()
+        except (IOError, OSError):
+            source = mApplication.discoveryLib.readArchiveFile(filePath)
+            if source is None:
+                raise ImportError('App info module can not be read: {}'.format(filePath))
+
+        _module             = types.ModuleType(moduleName)
+        _module.__file__    = filePath
+        _module.__package__ = moduleName.rpartition('.')[0]
+
+        # Classes are resolved to their files through sys.modules, @see ApplicationInfo._getFilePath
+        sys.modules[moduleName] = _module
+
+        try:
+            exec(compile(source, filePath, 'exec'), _module.__dict__)
+        except Exception:
+            sys.modules.pop(moduleName, None)
+            raise
+
+        return _module
+
+    #
+    ## @brief Check whether given application info class instance matches given filters.
+    #
+    #  @param appInfo           [ mApplication.applicationInfoAbs.ApplicationInfo | None | in  ] - Class instance.
+    #  @param parentApplication [ str                                             | None | in  ] - Parent application name.
+    #  @param keyword           [ str                                             | None | in  ] - Keyword to be searched.
+    #  @param ignoreInactive    [ bool                                            | True | in  ] - Ignore inactive applications.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    @staticmethod
+    def _matches(appInfo, parentApplication=None, keyword=None, ignoreInactive=True):
+
+        if ignoreInactive and not appInfo.isActive():
+            return False
+
+        if parentApplication and parentApplication != mApplication.parentApplicationLib.Application.kAll:
+            if parentApplication not in appInfo.parentApplications():
+                return False
+
+        if keyword:
+            if not keyword in appInfo.keywords() and not keyword in appInfo.name().lower():
+                return False
+
+        return True
+
+    #
+    ## @brief Check whether given app info module or class is recorded in the negative cache.
+    #
+    #  Entries recorded for an older modification time or content hash of the file are considered invalid and removed.
+    #
+    #  @param filePath    [ str   | None | in  ] - Absolute path of the app info module.
+    #  @param className   [ str   | None | in  ] - Name of the app info class, None for the module itself.
+    #  @param mtime       [ float | None | in  ] - Current modification time of the app info module.
+    #  @param contentHash [ str   | None | in  ] - Current content hash of the app info module, None if content hash
+    #  validation is disabled, @see mApplication.contentHashLib.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    @staticmethod
+    def _isFailed(filePath, className, mtime, contentHash=None):
+
+        key = (filePath, className)
+
+        with ApplicationInfo._failedModulesLock:
+
+            failed = ApplicationInfo._failedModules.get(key)
+            if not failed:
+                return False
+
+            if failed['mtime'] == mtime and failed['contentHash'] == contentHash:
+                return True
+
+            ApplicationInfo._failedModules.pop(key, None)
+
+        return False
+
+    #
+    ## @brief Record given app info module or class in the negative cache.
+    #
+    #  This method has to be called within an except block so the traceback of the error can be retained.
+    #
+    #  @param filePath    [ str       | None | in  ] - Absolute path of the app info module.
+    #  @param className   [ str       | None | in  ] - Name of the app info class, None for the module itself.
+    #  @param mtime       [ float     | None | in  ] - Modification time of the app info module.
+    #  @param error       [ Exception | None | in  ] - Error raised.
+    #  @param contentHash [ str       | None | in  ] - Content hash of the app info module, None if content hash
+    #  validation is disabled.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    @staticmethod
+    def _addFailed(filePath, className, mtime, error, contentHash=None):
+
+        failed = {'mtime'       : mtime,
+                  'contentHash' : contentHash,
+                  'error'       : error,
+                  'traceback'   : traceback.format_exc()}
+
+        with ApplicationInfo._failedModulesLock:
+            ApplicationInfo._failedModules[(filePath, className)] = failed
+
+#
+## @brief [ CLASS ] - Proxy of an application info class populated from metadata of the application.
+#
+#  Proxies provide the same API as the application info classes without importing their modules, so they can be used
+#  for menus and listings, @see ApplicationInfo.list. The application info class is imported and instantiated
+#  transparently on first access to an attribute the proxy doesn't provide, @see ApplicationInfoProxy.getInstance.
+class ApplicationInfoProxy(ApplicationInfo):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param record [ dict | None | in  ] - Metadata of the application, @see ApplicationInfo.asDict.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, record):
+
+        ## [ dict ] - Metadata of the application.
+        self._record                = record
+
+        ## [ mApplication.applicationInfoAbs.ApplicationInfo ] - Application info class instance, created on demand.
+        self._instance              = None
+
+        ## [ mMecoPackage.packageLib.Package ] - Package library, created on demand.
+        self._package               = None
+
+        ## [ dict ] - Rendered representations, keys are: str, html.
+        self._rendered              = {}
+
+        self._name                  = record['name']
+        self._versionMajor          = record['versionMajor']
+        self._versionMinor          = record['versionMinor']
+        self._versionFix            = record['versionFix']
+        self._versionStr            = record['versionStr']
+        self._windowTitle           = record['windowTitle']
+        self._isActive              = record['isActive']
+        self._description           = record['description']
+        self._iconFileName          = record['iconFileName']
+        self._usePlatformIcon       = record['usePlatformIcon']
+        self._parentApplications    = record['parentApplications']
+        self._keywords              = record['keywords']
+        self._isGUI                 = record['isGUI']
+        self._runAsPanelInNuke      = record['runAsPanelInNuke']
+        self._documents             = record['documents']
+        self._pythonCommand         = record['pythonCommand']
+        self._command               = record['command']
+        self._fullMenuPath          = record['fullMenuPath']
+        self._menuPath              = record['menuPath']
+        self._menuSeparatorBefore   = record['menuSeparatorBefore']
+        self._menuSeparatorAfter    = record['menuSeparatorAfter']
+        self._developers            = record['developers']
+
+    #
+    ## @brief Get attributes, which aren't provided by the proxy, from the application info class instance.
+    #
+    #  @param name [ str | None | in  ] - Name of the attribute.
+    #
+    #  @exception AttributeError - If the attribute doesn't exist.
+    #
+    #  @return variant - Value of the attribute.
+    def __getattr__(self, name):
+
+        if name.startswith('__') or name in ('_record', '_instance'):
+            raise AttributeError(name)
+
+        _instance = self.getInstance()
+        if _instance is None:
+            raise AttributeError('Application info class of {} could not be loaded, attribute: {}'.format(self._record['name'],
+                                                                                                        name))
+
+        return getattr(_instance, name)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get absolute path of the app info module the application info class is defined in.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the file.
+    def _getFilePath(self):
+
+        return self._record['filePath']
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Package class instance, which is created on first call.
+    #
+    #  @exception N/A
+    #
+    #  @return mMecoPackage.packageLib.Package - Class instance.
+    def package(self):
+
+        if self._package is None:
+            self._package = mMecoPackage.packageLib.Package(path=self._getFilePath())
+
+        return self._package
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get dict representation.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Metadata of the application.
+    def asDict(self):
+
+        return dict(self._record)
+
+    #
+    ## @brief Get icon file absolute path used by this application.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the icon file.
+    def getIconFileAbsolutePath(self):
+
+        if self._record.get('iconFilePath'):
+            return self._record['iconFilePath']
+
+        return ApplicationInfo.getIconFileAbsolutePath(self)
+
+    #
+    ## @brief Whether the application info class is imported and instantiated.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isLoaded(self):
+
+        return self._instance is not None
+
+    #
+    ## @brief Get application info class instance, which is imported and instantiated on first call.
+    #
+    #  @exception N/A
+    #
+    #  @return mApplication.applicationInfoAbs.ApplicationInfo - Class instance, None is returned if the app info
+    #  module can't be imported or the class can't be instantiated, @see ApplicationInfo.getFailedModules.
+    def getInstance(self):
+
+        if self._instance is None:
+
+            appInfoList = ApplicationInfo._load(self._record['filePath'],
+                                                self._record['module'],
+                                                classNames=[self._record['className']])
+            if appInfoList:
+                self._instance = appInfoList[0]
+
+        return self._instance
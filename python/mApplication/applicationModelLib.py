@@ -0,0 +1,438 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mApplication/applicationModelLib.py @brief [ FILE   ] - Qt item models for application launchers.
+## @package mApplication.applicationModelLib    @brief [ MODULE ] - Qt item models for application launchers.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+from mQt import QtCore, QtGui
+
+import mApplication.catalogLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - List model of applications, rows of which are fetched incrementally.
+#
+#  Rows are metadata of applications, @see mApplication.catalogLib.iterateRecords, therefore no application info
+#  module is imported if a catalog is available. Icons are created only for the rows requested by the views.
+class ApplicationListModel(QtCore.QAbstractListModel):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC STATIC MEMBERS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## [ int ] - Role for metadata of the application, @see ApplicationInfo.asDict.
+    RECORD_ROLE         = QtCore.Qt.UserRole + 1
+
+    ## [ int ] - Role for the version of the application in "major.minor.fix" format.
+    VERSION_ROLE        = QtCore.Qt.UserRole + 2
+
+    ## [ int ] - Role for the keywords of the application.
+    KEYWORDS_ROLE       = QtCore.Qt.UserRole + 3
+
+    ## [ int ] - Role for the full menu path of the application.
+    FULL_MENU_PATH_ROLE = QtCore.Qt.UserRole + 4
+
+    ## [ int ] - Default number of rows fetched at once.
+    DEFAULT_BATCH_SIZE  = 100
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param parentApplication [ str     | None               | in  ] - Parent application name, which listed applications can be run in.
+    #  @param packageName       [ str     | None               | in  ] - Name of the package, the applications will be list for.
+    #  @param ignoreInactive    [ bool    | True               | in  ] - Ignore, therefore do not list inactive applications.
+    #  @param batchSize         [ int     | DEFAULT_BATCH_SIZE | in  ] - Number of rows fetched at once.
+    #  @param parent            [ QObject | None               | in  ] - Parent.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, parentApplication=None, packageName=None, ignoreInactive=True, batchSize=DEFAULT_BATCH_SIZE, parent=None):
+
+        QtCore.QAbstractListModel.__init__(self, parent)
+
+        ## [ int ] - Number of rows fetched at once.
+        self._batchSize  = batchSize
+
+        ## [ list of dict ] - Metadata of the applications fetched.
+        self._records    = []
+
+        ## [ dict ] - Icons created for the rows, keys are row numbers.
+        self._icons      = {}
+
+        ## [ generator ] - Generator of metadata of the applications to be fetched, None once exhausted.
+        self._generator  = mApplication.catalogLib.iterateRecords(parentApplication=parentApplication,
+                                                                  packageName=packageName,
+                                                                  ignoreInactive=ignoreInactive)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # OVERWRITTEN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Number of rows fetched.
+    #
+    #  @param parent [ QModelIndex | QModelIndex() | in  ] - Parent index.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Count.
+    def rowCount(self, parent=QtCore.QModelIndex()):
+
+        if parent.isValid():
+            return 0
+
+        return len(self._records)
+
+    #
+    ## @brief Data of given index for given role.
+    #
+    #  @param index [ QModelIndex | None               | in  ] - Index.
+    #  @param role  [ int         | QtCore.Qt.DisplayRole | in  ] - Role.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Data.
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+
+        if not index.isValid() or index.row() >= len(self._records):
+            return None
+
+        record = self._records[index.row()]
+
+        if role == QtCore.Qt.DisplayRole:
+            return record['name']
+
+        if role == QtCore.Qt.DecorationRole:
+            return self.getIcon(index.row())
+
+        if role == QtCore.Qt.ToolTipRole:
+            return record['description'] or record['windowTitle']
+
+        if role == ApplicationListModel.RECORD_ROLE:
+            return record
+
+        if role == ApplicationListModel.VERSION_ROLE:
+            return record['versionStr']
+
+        if role == ApplicationListModel.KEYWORDS_ROLE:
+            return record['keywords']
+
+        if role == ApplicationListModel.FULL_MENU_PATH_ROLE:
+            return record['fullMenuPath']
+
+        return None
+
+    #
+    ## @brief Whether there are more rows to be fetched.
+    #
+    #  @param parent [ QModelIndex | None | in  ] - Parent index.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def canFetchMore(self, parent):
+
+        if parent.isValid():
+            return False
+
+        return self._generator is not None
+
+    #
+    ## @brief Fetch next batch of rows.
+    #
+    #  @param parent [ QModelIndex | None | in  ] - Parent index.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def fetchMore(self, parent):
+
+        if parent.isValid() or self._generator is None:
+            return
+
+        records = []
+
+        for record in self._generator:
+            records.append(record)
+            if len(records) >= self._batchSize:
+                break
+        else:
+            self._generator = None
+
+        if not records:
+            return
+
+        self.beginInsertRows(QtCore.QModelIndex(), len(self._records), len(self._records) + len(records) - 1)
+        self._records.extend(records)
+        self.endInsertRows()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get metadata of the application at given row.
+    #
+    #  @param row [ int | None | in  ] - Row.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Metadata, @see ApplicationInfo.asDict.
+    def record(self, row):
+
+        return self._records[row]
+
+    #
+    ## @brief Get icon of the application at given row.
+    #
+    #  Icons are created on first request and kept for the later ones.
+    #
+    #  @param row [ int | None | in  ] - Row.
+    #
+    #  @exception N/A
+    #
+    #  @return QIcon - Icon.
+    def getIcon(self, row):
+
+        icon = self._icons.get(row)
+        if icon is None:
+            icon = QtGui.QIcon(self._records[row]['iconFilePath'] or '')
+            self._icons[row] = icon
+
+        return icon
+
+    #
+    ## @brief Fetch all remaining rows.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def fetchAll(self):
+
+        while self.canFetchMore(QtCore.QModelIndex()):
+            self.fetchMore(QtCore.QModelIndex())
+
+#
+## @brief [ CLASS ] - Filter proxy model of ApplicationListModel, which filters rows by a search text.
+#
+#  Rows are filtered the same way ApplicationInfo.list method filters applications by keyword, i.e. a row is
+#  accepted if the search text is one of its keywords or it is in its lower case name. Keywords and names of the
+#  source rows are indexed as they are fetched, therefore changing the search text doesn't search the packages again.
+class ApplicationFilterProxyModel(QtCore.QSortFilterProxyModel):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param parent [ QObject | None | in  ] - Parent.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, parent=None):
+
+        QtCore.QSortFilterProxyModel.__init__(self, parent)
+
+        ## [ str ] - Search text.
+        self._searchText    = ''
+
+        ## [ dict ] - Index of the keywords, keys are keywords, values are sets of source rows.
+        self._keywordIndex  = {}
+
+        ## [ list of str ] - Lower case names of the source rows.
+        self._names         = []
+
+        ## [ set of int ] - Source rows accepted for the search text, None means all of them.
+        self._acceptedRows  = None
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Rebuild the index with all source rows.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _rebuildIndex(self):
+
+        self._keywordIndex  = {}
+        self._names         = []
+
+        sourceModel = self.sourceModel()
+        if sourceModel:
+            self._addRows(0, sourceModel.rowCount() - 1)
+
+    #
+    ## @brief Add given source rows to the index.
+    #
+    #  @param first [ int | None | in  ] - First row.
+    #  @param last  [ int | None | in  ] - Last row.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _addRows(self, first, last):
+
+        sourceModel = self.sourceModel()
+
+        for row in range(first, last + 1):
+
+            record = sourceModel.record(row)
+
+            self._names.append(record['name'].lower())
+
+            for keyword in record['keywords']:
+                self._keywordIndex.setdefault(keyword, set()).add(row)
+
+            if self._acceptedRows is not None and self._isMatch(row):
+                self._acceptedRows.add(row)
+
+    #
+    ## @brief Whether given source row matches the search text.
+    #
+    #  @param row [ int | None | in  ] - Source row.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def _isMatch(self, row):
+
+        return row in self._keywordIndex.get(self._searchText, ()) or self._searchText in self._names[row]
+
+    #
+    ## @brief Slot called when rows are inserted into the source model.
+    #
+    #  @param parent [ QModelIndex | None | in  ] - Parent index.
+    #  @param first  [ int         | None | in  ] - First row.
+    #  @param last   [ int         | None | in  ] - Last row.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _sourceRowsInserted(self, parent, first, last):
+
+        if parent.isValid():
+            return
+
+        if first != len(self._names):
+            self._rebuildIndex()
+            return
+
+        self._addRows(first, last)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # OVERWRITTEN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Set source model.
+    #
+    #  @param sourceModel [ mApplication.applicationModelLib.ApplicationListModel | None | in  ] - Source model.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setSourceModel(self, sourceModel):
+
+        previousSourceModel = self.sourceModel()
+        if previousSourceModel:
+            previousSourceModel.rowsInserted.disconnect(self._sourceRowsInserted)
+            previousSourceModel.modelReset.disconnect(self._rebuildIndex)
+
+        # Index has to be updated before the proxy model processes the inserted rows
+        if sourceModel:
+            sourceModel.rowsInserted.connect(self._sourceRowsInserted)
+            sourceModel.modelReset.connect(self._rebuildIndex)
+
+        QtCore.QSortFilterProxyModel.setSourceModel(self, sourceModel)
+
+        self._rebuildIndex()
+
+    #
+    ## @brief Whether given source row is accepted.
+    #
+    #  @param sourceRow    [ int         | None | in  ] - Source row.
+    #  @param sourceParent [ QModelIndex | None | in  ] - Source parent index.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def filterAcceptsRow(self, sourceRow, sourceParent):
+
+        if self._acceptedRows is None:
+            return True
+
+        return sourceRow in self._acceptedRows
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Search text.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Text.
+    def searchText(self):
+
+        return self._searchText
+
+    #
+    ## @brief Set search text.
+    #
+    #  @param text [ str | None | in  ] - Search text, all rows are accepted if an empty string is provided.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setSearchText(self, text):
+
+        text = text.strip().lower() if text else ''
+
+        if text == self._searchText:
+            return
+
+        self._searchText = text
+
+        if not text:
+            self._acceptedRows = None
+        else:
+            self._acceptedRows = set(self._keywordIndex.get(text, ()))
+            self._acceptedRows.update(row for row, name in enumerate(self._names) if text in name)
+
+        self.invalidateFilter()
@@ -0,0 +1,148 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mApplication/asyncLib.py @brief [ FILE   ] - Asyncio API for application discovery, Python 3 only.
+## @package mApplication.asyncLib    @brief [ MODULE ] - Asyncio API for application discovery, Python 3 only.
+#
+#  Directory scanning and module loading run in a worker thread one application at a time, so the event loop (such
+#  as a qasync loop of a Qt launcher) stays responsive and discovery stops soon after the awaiting task is cancelled.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import asyncio
+import threading
+import concurrent.futures
+
+import mApplication.applicationInfoAbs
+import mApplication.catalogLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ object ] - Sentinel, which marks the end of iteration.
+_END            = object()
+
+## [ concurrent.futures.ThreadPoolExecutor ] - Executor discovery runs in, created on first use.
+_executor       = None
+
+## [ threading.Lock ] - Lock to create the executor.
+_executorLock   = threading.Lock()
+
+#
+## @brief Get executor discovery runs in.
+#
+#  A single worker thread is used so discoveries run one step at a time and a cancelled discovery can't keep more
+#  than one step busy.
+#
+#  @exception N/A
+#
+#  @return concurrent.futures.ThreadPoolExecutor - Executor.
+def getExecutor():
+
+    global _executor
+
+    with _executorLock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+    return _executor
+
+#
+## @brief Iterate application info classes matching given filters as they are found.
+#
+#  Application info classes are provided in name order if a catalog is used, otherwise as they are found.
+#
+#  @param parentApplication [ str  | None  | in  ] - Parent application name, which listed applications can be run in.
+#  @param packageName       [ str  | None  | in  ] - Name of the package, the applications will be list for.
+#  @param keyword           [ str  | None  | in  ] - Keyword to be searched.
+#  @param ignoreInactive    [ bool | True  | in  ] - Ignore, therefore do not list inactive applications.
+#  @param limit             [ int  | None  | in  ] - Number of applications needed in name order, None means no limit.
+#  @param lazy              [ bool | False | in  ] - Provide proxies instead of importing app info modules if a
+#  catalog is used, @see mApplication.applicationInfoAbs.ApplicationInfoProxy.
+#
+#  @exception N/A
+#
+#  @return async generator - Async generator of mApplication.applicationInfoAbs.ApplicationInfo instances.
+async def aiterate(parentApplication=None, packageName=None, keyword=None, ignoreInactive=True, limit=None, lazy=False):
+
+    generator = mApplication.applicationInfoAbs.ApplicationInfo._iterateMatching(parentApplication=parentApplication,
+                                                                                packageName=packageName,
+                                                                                keyword=keyword,
+                                                                                ignoreInactive=ignoreInactive,
+                                                                                limit=limit,
+                                                                                lazy=lazy)
+
+    executor  = getExecutor()
+    future    = None
+
+    try:
+
+        while True:
+
+            future = executor.submit(next, generator, _END)
+
+            _appInfo = await asyncio.wrap_future(future)
+            if _appInfo is _END:
+                break
+
+            yield _appInfo
+
+    finally:
+
+        # Generator can't be closed while the worker thread is still advancing it (cancellation)
+        if future and not future.done():
+            future.add_done_callback(lambda x: generator.close())
+        else:
+            generator.close()
+
+#
+## @brief List application info classes.
+#
+#  Arguments and result are the same as ApplicationInfo.list method.
+#
+#  @param parentApplication [ str  | None  | in  ] - Parent application name, which listed applications can be run in.
+#  @param packageName       [ str  | None  | in  ] - Name of the package, the applications will be list for.
+#  @param keyword           [ str  | None  | in  ] - Keyword to be searched.
+#  @param ignoreInactive    [ bool | True  | in  ] - Ignore, therefore do not list inactive applications.
+#  @param limit             [ int  | None  | in  ] - Maximum number of applications to be listed, None means no limit.
+#  @param offset            [ int  | 0     | in  ] - Number of applications to be skipped, used for pagination.
+#  @param lazy              [ bool | False | in  ] - List proxies instead of importing app info modules if a catalog
+#  is used, @see mApplication.applicationInfoAbs.ApplicationInfoProxy.
+#
+#  @exception N/A
+#
+#  @return list of mApplication.applicationInfoAbs.ApplicationInfo - List of application info class instances.
+async def alist(parentApplication=None, packageName=None, keyword=None, ignoreInactive=True, limit=None, offset=0, lazy=False):
+
+    appInfoList = []
+
+    async for _appInfo in aiterate(parentApplication=parentApplication,
+                                   packageName=packageName,
+                                   keyword=keyword,
+                                   ignoreInactive=ignoreInactive,
+                                   limit=offset + limit if limit is not None else None,
+                                   lazy=lazy):
+        appInfoList.append(_appInfo)
+
+    return mApplication.catalogLib.selectRange(appInfoList, key=lambda x: x.name(), limit=limit, offset=offset)
@@ -0,0 +1,527 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mApplication/binaryCatalogLib.py @brief [ FILE   ] - Memory-mapped binary catalog of applications.
+## @package mApplication.binaryCatalogLib    @brief [ MODULE ] - Memory-mapped binary catalog of applications.
+#
+#  Layout of the binary catalog artifact is as follows, all integers are little endian unsigned integers.
+#
+#  - Header       : HEADER_STRUCT.
+#  - Record table : RECORD_STRUCT for each application, sorted by lower case names.
+#  - Keyword table: KEYWORD_STRUCT for each keyword of each application, sorted by keywords.
+#  - String table : Lower case names of applications in the order of the record table, each of them is terminated
+#                   by a null byte, followed by the other strings (UTF-8), which are stored only once.
+#
+#  Strings are referenced by (offset, length) pairs, offsets are relative to the beginning of the file. Full metadata
+#  of each application is stored as a JSON string, which is decoded only for the applications matching a query.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import bisect
+import json
+import mmap
+import struct
+
+import mApplication.catalogLib
+import mApplication.parentApplicationLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ bytes ] - Magic bytes binary catalog artifacts start with.
+MAGIC           = b'MAPC'
+
+## [ struct.Struct ] - Header: magic, format version, record count, keyword count, record table offset,
+#  keyword table offset, name section offset, name section length, environment offset, environment length.
+HEADER_STRUCT   = struct.Struct('<4sIIIIIIIII')
+
+## [ struct.Struct ] - Record: name offset, name length, package offset, package length, parent applications offset,
+#  parent applications length, data offset, data length, major version, minor version, fix version, flags, rank of
+#  the record when records are sorted by case sensitive names.
+RECORD_STRUCT   = struct.Struct('<IIIIIIIIHHHHI')
+
+## [ struct.Struct ] - Keyword: keyword offset, keyword length, record index.
+KEYWORD_STRUCT  = struct.Struct('<III')
+
+## [ int ] - Record flag for active applications.
+FLAG_ACTIVE     = 1
+
+#
+## @brief Whether given file is a binary catalog artifact.
+#
+#  @param filePath [ str | None | in  ] - Absolute path of the file.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def isBinaryCatalog(filePath):
+
+    try:
+        with open(filePath, 'rb') as _file:
+            return _file.read(len(MAGIC)) == MAGIC
+    except (IOError, OSError):
+        return False
+
+#
+## @brief Write given catalog into given file as a binary catalog artifact atomically.
+#
+#  @param catalog  [ mApplication.catalogLib.Catalog | None | in  ] - Catalog.
+#  @param filePath [ str                             | None | in  ] - Absolute path of the artifact file.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def write(catalog, filePath):
+
+    records = sorted(catalog.records(), key=lambda x: (x['name'].lower(), x['module'], x['className']))
+
+    ranks   = {}
+    for rank, index in enumerate(sorted(range(len(records)), key=lambda x: records[x]['name'])):
+        ranks[index] = rank
+
+    recordTableOffset   = HEADER_STRUCT.size
+    keywordTableOffset  = recordTableOffset + RECORD_STRUCT.size * len(records)
+
+    keywords = []
+    for index, record in enumerate(records):
+        for keyword in set(record['keywords']):
+            keywords.append((keyword.encode('utf-8'), index))
+
+    keywords.sort()
+
+    nameSectionOffset   = keywordTableOffset + KEYWORD_STRUCT.size * len(keywords)
+
+    strings             = bytearray()
+    stringOffsets       = {}
+
+    def addString(value, unique=True):
+
+        offset = nameSectionOffset + len(strings)
+
+        if unique:
+            if value in stringOffsets:
+                return stringOffsets[value], len(value)
+            stringOffsets[value] = offset
+
+        strings.extend(value)
+
+        return offset, len(value)
+
+    # Names are stored first and contiguously so they can be searched for sub strings at once
+    nameRefs = []
+    for record in records:
+        nameRefs.append(addString(record['name'].lower().encode('utf-8'), unique=False))
+        strings.extend(b'\0')
+
+    nameSectionLength = len(strings)
+
+    recordTable = bytearray()
+    for index, record in enumerate(records):
+
+        packageRef  = addString(record['package'].lower().encode('utf-8'))
+        parentsRef  = addString(','.join(record['parentApplications']).encode('utf-8'))
+        dataRef     = addString(json.dumps(record, sort_keys=True, separators=(',', ':')).encode('utf-8'), unique=False)
+
+        recordTable.extend(RECORD_STRUCT.pack(nameRefs[index][0], nameRefs[index][1],
+                                              packageRef[0], packageRef[1],
+                                              parentsRef[0], parentsRef[1],
+                                              dataRef[0], dataRef[1],
+                                              record['versionMajor'], record['versionMinor'], record['versionFix'],
+                                              FLAG_ACTIVE if record['isActive'] else 0,
+                                              ranks[index]))
+
+    keywordTable = bytearray()
+    for keyword, index in keywords:
+        keywordRef = addString(keyword)
+        keywordTable.extend(KEYWORD_STRUCT.pack(keywordRef[0], keywordRef[1], index))
+
+    environmentRef = addString(json.dumps(catalog.environment(), sort_keys=True).encode('utf-8'), unique=False)
+
+    header = HEADER_STRUCT.pack(MAGIC,
+                                mApplication.catalogLib.CATALOG_FORMAT_VERSION,
+                                len(records),
+                                len(keywords),
+                                recordTableOffset,
+                                keywordTableOffset,
+                                nameSectionOffset,
+                                nameSectionLength,
+                                environmentRef[0],
+                                environmentRef[1])
+
+    mApplication.catalogLib.writeFileAtomically(filePath, bytes(header + recordTable + keywordTable + strings), binary=True)
+
+#
+## @brief [ CLASS ] - Catalog of applications read from a memory-mapped binary catalog artifact.
+#
+#  Lookups run directly against the mapped buffer, therefore processes reading the same artifact share a single
+#  copy of it in the page cache of the host. Metadata of applications is decoded only for query results.
+class MappedCatalog(mApplication.catalogLib.Catalog):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param filePath [ str | None | in  ] - Absolute path of the binary catalog artifact.
+    #
+    #  @exception ValueError - If given file is not a binary catalog artifact written with the current format version.
+    #
+    #  @return None - None.
+    def __init__(self, filePath):
+
+        with open(filePath, 'rb') as _file:
+            ## [ mmap.mmap ] - Read-only mapped buffer.
+            self._buffer = mmap.mmap(_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._buffer) < HEADER_STRUCT.size:
+            raise ValueError('File is not a binary catalog: {}'.format(filePath))
+
+        header = HEADER_STRUCT.unpack_from(self._buffer, 0)
+
+        if header[0] != MAGIC or header[1] != mApplication.catalogLib.CATALOG_FORMAT_VERSION:
+            raise ValueError('File is not a supported binary catalog: {}'.format(filePath))
+
+        ## [ int ] - Number of applications.
+        self._recordCount        = header[2]
+
+        ## [ int ] - Number of keyword entries.
+        self._keywordCount       = header[3]
+
+        ## [ int ] - Offset of the record table.
+        self._recordTableOffset  = header[4]
+
+        ## [ int ] - Offset of the keyword table.
+        self._keywordTableOffset = header[5]
+
+        ## [ int ] - Offset of the name section.
+        self._nameSectionOffset  = header[6]
+
+        ## [ int ] - Length of the name section.
+        self._nameSectionLength  = header[7]
+
+        ## [ list of int ] - Offsets of the names, used to find records of sub string matches.
+        self._nameOffsets        = [self._unpackRecord(x)[0] for x in range(self._recordCount)]
+
+        mApplication.catalogLib.Catalog.__init__(self,
+                                                 records=None,
+                                                 environment=json.loads(self._getString(header[8], header[9])),
+                                                 filePath=filePath)
+
+    #
+    ## @brief Number of applications.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Count.
+    def __len__(self):
+
+        return self._recordCount
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get string from the mapped buffer.
+    #
+    #  @param offset [ int | None | in  ] - Offset.
+    #  @param length [ int | None | in  ] - Length.
+    #
+    #  @exception N/A
+    #
+    #  @return str - String.
+    def _getString(self, offset, length):
+
+        return self._buffer[offset:offset + length].decode('utf-8')
+
+    #
+    ## @brief Unpack record at given index.
+    #
+    #  @param index [ int | None | in  ] - Index of the record.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Values, @see RECORD_STRUCT.
+    def _unpackRecord(self, index):
+
+        return RECORD_STRUCT.unpack_from(self._buffer, self._recordTableOffset + RECORD_STRUCT.size * index)
+
+    #
+    ## @brief Get metadata of the application at given index.
+    #
+    #  @param index [ int | None | in  ] - Index of the record.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Metadata, @see ApplicationInfo.asDict.
+    def _getRecord(self, index):
+
+        values = self._unpackRecord(index)
+
+        return json.loads(self._getString(values[6], values[7]))
+
+    #
+    ## @brief Check whether the record at given index matches given filters without decoding its metadata.
+    #
+    #  @param index             [ int   | None | in  ] - Index of the record.
+    #  @param parentApplication [ str   | None | in  ] - Parent application name.
+    #  @param packageName       [ bytes | None | in  ] - Lower case name of the package encoded in UTF-8.
+    #  @param ignoreInactive    [ bool  | True | in  ] - Ignore inactive applications.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def _matchesIndex(self, index, parentApplication=None, packageName=None, ignoreInactive=True):
+
+        values = self._unpackRecord(index)
+
+        if ignoreInactive and not values[11] & FLAG_ACTIVE:
+            return False
+
+        if packageName and self._buffer[values[2]:values[2] + values[3]] != packageName:
+            return False
+
+        if parentApplication and parentApplication != mApplication.parentApplicationLib.Application.kAll:
+            if parentApplication not in self._getString(values[4], values[5]).split(','):
+                return False
+
+        return True
+
+    #
+    ## @brief Find indices of the records with given lower case name.
+    #
+    #  @param name [ bytes | None | in  ] - Lower case name encoded in UTF-8.
+    #
+    #  @exception N/A
+    #
+    #  @return list of int - Indices.
+    def _findNameIndices(self, name):
+
+        low     = 0
+        high    = self._recordCount
+
+        while low < high:
+            middle = (low + high) // 2
+            values = self._unpackRecord(middle)
+            if self._buffer[values[0]:values[0] + values[1]] < name:
+                low = middle + 1
+            else:
+                high = middle
+
+        indices = []
+
+        while low < self._recordCount:
+            values = self._unpackRecord(low)
+            if self._buffer[values[0]:values[0] + values[1]] != name:
+                break
+            indices.append(low)
+            low += 1
+
+        return indices
+
+    #
+    ## @brief Find indices of the records with given keyword.
+    #
+    #  @param keyword [ bytes | None | in  ] - Keyword encoded in UTF-8.
+    #
+    #  @exception N/A
+    #
+    #  @return list of int - Indices.
+    def _findKeywordIndices(self, keyword):
+
+        low     = 0
+        high    = self._keywordCount
+
+        while low < high:
+            middle = (low + high) // 2
+            values = KEYWORD_STRUCT.unpack_from(self._buffer, self._keywordTableOffset + KEYWORD_STRUCT.size * middle)
+            if self._buffer[values[0]:values[0] + values[1]] < keyword:
+                low = middle + 1
+            else:
+                high = middle
+
+        indices = []
+
+        while low < self._keywordCount:
+            values = KEYWORD_STRUCT.unpack_from(self._buffer, self._keywordTableOffset + KEYWORD_STRUCT.size * low)
+            if self._buffer[values[0]:values[0] + values[1]] != keyword:
+                break
+            indices.append(values[2])
+            low += 1
+
+        return indices
+
+    #
+    ## @brief Find indices of the records, lower case names of which contain given sub string.
+    #
+    #  @param subString [ bytes | None | in  ] - Lower case sub string encoded in UTF-8.
+    #
+    #  @exception N/A
+    #
+    #  @return list of int - Indices.
+    def _findNameSubStringIndices(self, subString):
+
+        indices = []
+
+        if not subString or b'\0' in subString:
+            return indices
+
+        start   = self._nameSectionOffset
+        end     = self._nameSectionOffset + self._nameSectionLength
+
+        while True:
+
+            position = self._buffer.find(subString, start, end)
+            if position == -1:
+                break
+
+            index = bisect.bisect_right(self._nameOffsets, position) - 1
+            indices.append(index)
+
+            # Continue from the next name
+            start = self._buffer.find(b'\0', position, end) + 1
+            if not start:
+                break
+
+        return indices
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Metadata of applications.
+    #
+    #  Metadata of all applications is decoded, use query methods to decode only the matching ones.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Metadata, @see ApplicationInfo.asDict.
+    def records(self):
+
+        return [self._getRecord(x) for x in range(self._recordCount)]
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Find metadata of applications with given name.
+    #
+    #  @param name [ str | None | in  ] - Name of the application, case insensitive.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Metadata of applications.
+    def findByName(self, name):
+
+        return [self._getRecord(x) for x in self._findNameIndices(name.lower().encode('utf-8'))]
+
+    #
+    ## @brief Find metadata of applications with given keyword.
+    #
+    #  @param keyword [ str | None | in  ] - Keyword.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Metadata of applications.
+    def findByKeyword(self, keyword):
+
+        return [self._getRecord(x) for x in self._findKeywordIndices(keyword.encode('utf-8'))]
+
+    #
+    ## @brief Query metadata of applications.
+    #
+    #  Filters work the same way as they do in ApplicationInfo.list method, keywords are looked up in the keyword
+    #  table and the name section of the mapped buffer. Matching records are selected by their ranks, therefore only
+    #  metadata of the selected ones is decoded.
+    #
+    #  @param parentApplication [ str  | None | in  ] - Parent application name, which listed applications can be run in.
+    #  @param packageName       [ str  | None | in  ] - Name of the package, the applications will be list for.
+    #  @param keyword           [ str  | None | in  ] - Keyword to be searched.
+    #  @param ignoreInactive    [ bool | True | in  ] - Ignore, therefore do not list inactive applications.
+    #  @param limit             [ int  | None | in  ] - Maximum number of applications, None means no limit.
+    #  @param offset            [ int  | 0    | in  ] - Number of applications to be skipped.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Metadata of applications sorted by their names.
+    def query(self, parentApplication=None, packageName=None, keyword=None, ignoreInactive=True, limit=None, offset=0):
+
+        if keyword:
+            indices = set(self._findKeywordIndices(keyword.encode('utf-8')))
+            indices.update(self._findNameSubStringIndices(keyword.encode('utf-8')))
+            indices = sorted(indices)
+        else:
+            indices = range(self._recordCount)
+
+        if packageName:
+            packageName = packageName.lower().encode('utf-8')
+
+        indices = [x for x in indices if self._matchesIndex(x,
+                                                            parentApplication=parentApplication,
+                                                            packageName=packageName,
+                                                            ignoreInactive=ignoreInactive)]
+
+        indices = mApplication.catalogLib.selectRange(indices,
+                                                      key=lambda x: self._unpackRecord(x)[12],
+                                                      limit=limit,
+                                                      offset=offset)
+
+        return [self._getRecord(x) for x in indices]
+
+    #
+    ## @brief Write the catalog into given artifact file atomically.
+    #
+    #  @param filePath [ str  | None  | in  ] - Absolute path of the artifact file.
+    #  @param binary   [ bool | False | in  ] - Write binary catalog artifact instead of JSON.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def write(self, filePath, binary=False):
+
+        if binary:
+            write(self, filePath)
+            self.writeTrigramIndex(filePath)
+            return
+
+        mApplication.catalogLib.Catalog(records=self.records(), environment=self.environment()).write(filePath)
+
+    #
+    ## @brief Close the mapped buffer.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def close(self):
+
+        self._buffer.close()
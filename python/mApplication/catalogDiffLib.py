@@ -0,0 +1,379 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mApplication/catalogDiffLib.py @brief [ FILE   ] - Differences between catalogs of applications.
+## @package mApplication.catalogDiffLib    @brief [ MODULE ] - Differences between catalogs of applications.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+
+import mApplication.catalogLib
+import mApplication.environmentScanLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Differences between two catalogs, e.g. of two environments or releases.
+#
+#  Applications are matched by their packages and app info class names. Packages, content hashes of which are the
+#  same in both catalogs, are skipped without comparing their applications, @see Catalog.hashPackages.
+class CatalogDiff(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param oldCatalog        [ mApplication.catalogLib.Catalog | None | in  ] - Old catalog.
+    #  @param newCatalog        [ mApplication.catalogLib.Catalog | None | in  ] - New catalog.
+    #  @param unchangedPackages [ set                             | None | in  ] - Names of the packages known to be
+    #  unchanged, they are found by the package hashes of the catalogs if None is provided.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, oldCatalog, newCatalog, unchangedPackages=None):
+
+        ## [ list of dict ] - Metadata of the applications added.
+        self._added                     = []
+
+        ## [ list of dict ] - Metadata of the applications removed.
+        self._removed                   = []
+
+        ## [ list of tuple ] - Old and new metadata of the applications, versions of which are changed.
+        self._versionChanged            = []
+
+        ## [ list of tuple ] - Old and new metadata of the applications, parent applications of which are changed.
+        self._parentApplicationsChanged = []
+
+        ## [ list of str ] - Names of the packages skipped since they are not changed.
+        self._unchangedPackages         = []
+
+        self._compare(oldCatalog, newCatalog, unchangedPackages)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Metadata of the applications added.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Metadata.
+    def added(self):
+
+        return self._added
+
+    #
+    ## @brief Metadata of the applications removed.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Metadata.
+    def removed(self):
+
+        return self._removed
+
+    #
+    ## @brief Old and new metadata of the applications, versions of which are changed.
+    #
+    #  @exception N/A
+    #
+    #  @return list of tuple - Tuples of (old metadata, new metadata).
+    def versionChanged(self):
+
+        return self._versionChanged
+
+    #
+    ## @brief Old and new metadata of the applications, parent applications of which are changed.
+    #
+    #  @exception N/A
+    #
+    #  @return list of tuple - Tuples of (old metadata, new metadata).
+    def parentApplicationsChanged(self):
+
+        return self._parentApplicationsChanged
+
+    #
+    ## @brief Names of the packages skipped since their content hashes are the same in both catalogs.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Names.
+    def unchangedPackages(self):
+
+        return self._unchangedPackages
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Compare given catalogs.
+    #
+    #  @param oldCatalog        [ mApplication.catalogLib.Catalog | None | in  ] - Old catalog.
+    #  @param newCatalog        [ mApplication.catalogLib.Catalog | None | in  ] - New catalog.
+    #  @param unchangedPackages [ set                             | None | in  ] - Names of the packages known to be
+    #  unchanged, they are found by the package hashes of the catalogs if None is provided.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _compare(self, oldCatalog, newCatalog, unchangedPackages=None):
+
+        if unchangedPackages is None:
+            unchangedPackages = CatalogDiff._getUnchangedPackages(oldCatalog.getPackageHashes(),
+                                                                  newCatalog.getPackageHashes())
+
+        self._unchangedPackages = sorted(unchangedPackages)
+
+        unchangedPackages = set(self._unchangedPackages)
+
+        oldRecords = CatalogDiff._getRecordsByKey(oldCatalog, unchangedPackages)
+        newRecords = CatalogDiff._getRecordsByKey(newCatalog, unchangedPackages)
+
+        for key in sorted(set(oldRecords) | set(newRecords)):
+
+            oldRecord = oldRecords.get(key)
+            newRecord = newRecords.get(key)
+
+            if not oldRecord:
+                self._added.append(newRecord)
+                continue
+
+            if not newRecord:
+                self._removed.append(oldRecord)
+                continue
+
+            if CatalogDiff._getVersion(oldRecord) != CatalogDiff._getVersion(newRecord):
+                self._versionChanged.append((oldRecord, newRecord))
+
+            if sorted(oldRecord['parentApplications']) != sorted(newRecord['parentApplications']):
+                self._parentApplicationsChanged.append((oldRecord, newRecord))
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Whether there is no difference.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isEmpty(self):
+
+        return not (self._added or self._removed or self._versionChanged or self._parentApplicationsChanged)
+
+    #
+    ## @brief Get dict representation.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are: added, removed, versionChanged, parentApplicationsChanged, unchangedPackages.
+    #  Applications are provided as dict instances with keys: package, className, name and old and new versions or
+    #  parent applications for the changed ones.
+    def asDict(self):
+
+        def getInfo(record):
+            return {'package': record['package'], 'className': record['className'], 'name': record['name']}
+
+        versionChanged = []
+        for oldRecord, newRecord in self._versionChanged:
+            info = getInfo(newRecord)
+            info['oldVersion'] = oldRecord['versionStr']
+            info['newVersion'] = newRecord['versionStr']
+            versionChanged.append(info)
+
+        parentApplicationsChanged = []
+        for oldRecord, newRecord in self._parentApplicationsChanged:
+            info = getInfo(newRecord)
+            info['oldParentApplications'] = oldRecord['parentApplications']
+            info['newParentApplications'] = newRecord['parentApplications']
+            parentApplicationsChanged.append(info)
+
+        return {'added'                     : [getInfo(x) for x in self._added],
+                'removed'                   : [getInfo(x) for x in self._removed],
+                'versionChanged'            : versionChanged,
+                'parentApplicationsChanged' : parentApplicationsChanged,
+                'unchangedPackages'         : self._unchangedPackages}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get catalog from given source.
+    #
+    #  @param source [ str | None | in  ] - Absolute path of a catalog artifact file or search paths of an environment
+    #  separated by os.pathsep, which are scanned, @see mApplication.environmentScanLib.EnvironmentScanner.
+    #
+    #  @exception ValueError - If given catalog artifact can't be read.
+    #
+    #  @return mApplication.catalogLib.Catalog - Class instance.
+    @staticmethod
+    def getCatalog(source):
+
+        if os.path.isfile(source):
+            return CatalogDiff._readCatalog(source)
+
+        return mApplication.environmentScanLib.EnvironmentScanner().scan(CatalogDiff._getPaths(source))
+
+    #
+    ## @brief Compare given sources.
+    #
+    #  Packages of the environments are hashed by their app info modules first without importing them, and only the
+    #  packages, hashes of which differ, are scanned. Catalog artifacts are read as they are,
+    #  @see mApplication.environmentScanLib.EnvironmentScanner.hashPackages.
+    #
+    #  @param oldSource [ str | None | in  ] - Old source, @see getCatalog.
+    #  @param newSource [ str | None | in  ] - New source, @see getCatalog.
+    #
+    #  @exception ValueError   - If a catalog artifact can't be read.
+    #  @exception RuntimeError - If a worker interpreter scanning an environment fails.
+    #
+    #  @return mApplication.catalogDiffLib.CatalogDiff - Class instance.
+    @staticmethod
+    def fromSources(oldSource, newSource):
+
+        sources  = (oldSource, newSource)
+        catalogs = []
+        hashes   = []
+
+        for source in sources:
+
+            if os.path.isfile(source):
+                _catalog = CatalogDiff._readCatalog(source)
+                catalogs.append(_catalog)
+                hashes.append(_catalog.getPackageHashes())
+            else:
+                catalogs.append(None)
+                paths = CatalogDiff._getPaths(source)
+                hashes.append(mApplication.environmentScanLib.EnvironmentScanner.hashPackages(paths))
+
+        unchangedPackages = CatalogDiff._getUnchangedPackages(hashes[0], hashes[1])
+        changedPackages   = sorted((set(hashes[0]) | set(hashes[1])) - unchangedPackages)
+        scanner           = mApplication.environmentScanLib.EnvironmentScanner()
+
+        for index, source in enumerate(sources):
+
+            if catalogs[index] is not None:
+                continue
+
+            paths = CatalogDiff._getPaths(source)
+
+            # All packages would be scanned without package names
+            if changedPackages:
+                catalogs[index] = scanner.scan(paths, packageNames=changedPackages)
+            else:
+                environment     = mApplication.catalogLib.Catalog.getEnvironment(paths=paths)
+                catalogs[index] = mApplication.catalogLib.Catalog(records=[], environment=environment)
+
+        return CatalogDiff(catalogs[0], catalogs[1], unchangedPackages=unchangedPackages)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Read catalog from given artifact file.
+    #
+    #  @param filePath [ str | None | in  ] - Absolute path of the artifact file.
+    #
+    #  @exception ValueError - If the artifact can't be read.
+    #
+    #  @return mApplication.catalogLib.Catalog - Class instance.
+    @staticmethod
+    def _readCatalog(filePath):
+
+        _catalog = mApplication.catalogLib.Catalog.read(filePath)
+        if not _catalog:
+            raise ValueError('Catalog artifact can not be read: {}'.format(filePath))
+
+        return _catalog
+
+    #
+    ## @brief Get search paths of given environment source.
+    #
+    #  @param source [ str | None | in  ] - Search paths separated by os.pathsep.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Search paths.
+    @staticmethod
+    def _getPaths(source):
+
+        return [x for x in source.split(os.pathsep) if x]
+
+    #
+    ## @brief Get names of the packages, hashes of which are the same in both given package hashes.
+    #
+    #  @param oldHashes [ dict | None | in  ] - Keys are names of the packages, values are old hashes.
+    #  @param newHashes [ dict | None | in  ] - Keys are names of the packages, values are new hashes.
+    #
+    #  @exception N/A
+    #
+    #  @return set - Names of the packages.
+    @staticmethod
+    def _getUnchangedPackages(oldHashes, newHashes):
+
+        return set([x for x in oldHashes if newHashes.get(x) == oldHashes[x]])
+
+    #
+    ## @brief Get metadata of the applications of given catalog keyed by packages and app info class names.
+    #
+    #  @param catalog      [ mApplication.catalogLib.Catalog | None | in  ] - Catalog.
+    #  @param skipPackages [ set                             | None | in  ] - Names of the packages to be skipped.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are tuples of (package, module, class name), values are metadata.
+    @staticmethod
+    def _getRecordsByKey(catalog, skipPackages):
+
+        return dict([((x['package'], x['module'], x['className']), x) for x in catalog.records()
+                     if x['package'] not in skipPackages])
+
+    #
+    ## @brief Get version of given metadata of an application.
+    #
+    #  @param record [ dict | None | in  ] - Metadata.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Major, minor and fix versions.
+    @staticmethod
+    def _getVersion(record):
+
+        return (record['versionMajor'], record['versionMinor'], record['versionFix'])
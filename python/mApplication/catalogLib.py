@@ -0,0 +1,1205 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mApplication/catalogLib.py @brief [ FILE   ] - Catalog of applications.
+## @package mApplication.catalogLib    @brief [ MODULE ] - Catalog of applications.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import json
+import heapq
+import hashlib
+import tempfile
+import threading
+
+import mApplication.contentHashLib
+import mApplication.discoveryLib
+import mApplication.parentApplicationLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ int ] - Version of the catalog artifact format, artifacts written with other versions are ignored.
+CATALOG_FORMAT_VERSION      = 1
+
+## [ str ] - Name of the environment variable, which provides absolute path of the frozen catalog artifact.
+CATALOG_FILE_ENV_VARIABLE   = 'MAPPLICATION_CATALOG_FILE'
+
+## [ str ] - Suffix of the trigram index files written next to the catalog artifacts, @see Catalog.getTrigramIndex.
+TRIGRAM_INDEX_FILE_SUFFIX   = '.trigrams'
+
+## [ str ] - Secondary index of the user names of the developers, @see Catalog.getSecondaryIndex.
+INDEX_DEVELOPER             = 'developer'
+
+## [ str ] - Secondary index of the email addresses of the developers, @see Catalog.getSecondaryIndex.
+INDEX_EMAIL                 = 'email'
+
+## [ str ] - Secondary index of the URLs of the documents, @see Catalog.getSecondaryIndex.
+INDEX_DOCUMENT_URL          = 'documentUrl'
+
+## [ tuple of str ] - Secondary indexes.
+SECONDARY_INDEXES           = (INDEX_DEVELOPER, INDEX_EMAIL, INDEX_DOCUMENT_URL)
+
+#
+## @brief Write given data into given file atomically.
+#
+#  Data is written into a temporary file in the same directory first, then the temporary file is renamed, therefore
+#  readers see either the previous or the new content of the file but never a partially written one.
+#
+#  @param filePath [ str | None | in  ] - Absolute path of the file.
+#  @param data     [ str | None | in  ] - Data to be written.
+#  @param binary   [ bool | False | in  ] - Whether given data is binary.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def writeFileAtomically(filePath, data, binary=False):
+
+    directory = os.path.dirname(os.path.abspath(filePath))
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    fileDescriptor, temporaryFilePath = tempfile.mkstemp(prefix='.{}.'.format(os.path.basename(filePath)),
+                                                         dir=directory)
+
+    try:
+        with os.fdopen(fileDescriptor, 'wb' if binary else 'w') as _file:
+            _file.write(data)
+            _file.flush()
+            os.fsync(_file.fileno())
+
+        os.chmod(temporaryFilePath, 0o644)
+
+        replaceFile(temporaryFilePath, filePath)
+
+    except Exception:
+        if os.path.isfile(temporaryFilePath):
+            os.remove(temporaryFilePath)
+        raise
+
+#
+## @brief Replace given file with given source file by renaming it.
+#
+#  Renaming is atomic on POSIX systems. os.replace isn't available in Python 2, the file is removed before it is
+#  replaced on Windows then.
+#
+#  @param sourceFilePath [ str | None | in  ] - Absolute path of the source file, which is in the same directory.
+#  @param filePath       [ str | None | in  ] - Absolute path of the file to be replaced.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def replaceFile(sourceFilePath, filePath):
+
+    if hasattr(os, 'replace'):
+        os.replace(sourceFilePath, filePath)
+        return
+
+    if os.name == 'nt' and os.path.isfile(filePath):
+        os.remove(filePath)
+
+    os.rename(sourceFilePath, filePath)
+
+#
+## @brief Get stamp of given file, which changes when the file is replaced or modified.
+#
+#  @param filePath [ str | None | in  ] - Absolute path of the file.
+#
+#  @exception N/A
+#
+#  @return list - Size and modification time, None is returned if the file can't be accessed.
+def getFileStamp(filePath):
+
+    try:
+        _stat = os.stat(filePath)
+    except OSError:
+        return None
+
+    return [_stat.st_size, _stat.st_mtime]
+
+#
+## @brief Get absolute path of the trigram index file of given catalog artifact.
+#
+#  @param filePath [ str | None | in  ] - Absolute path of the catalog artifact.
+#
+#  @exception N/A
+#
+#  @return str - Path.
+def getTrigramIndexFilePath(filePath):
+
+    return '{}{}'.format(filePath, TRIGRAM_INDEX_FILE_SUFFIX)
+
+#
+## @brief Select a range of given items in sorted order.
+#
+#  A heap based partial selection is used if a limit is provided, therefore items beyond the range aren't sorted.
+#
+#  @param items  [ iterable | None | in  ] - Items.
+#  @param key    [ callable | None | in  ] - Function to get sort key of an item.
+#  @param limit  [ int      | None | in  ] - Maximum number of items, None means no limit.
+#  @param offset [ int      | 0    | in  ] - Number of items to be skipped.
+#
+#  @exception N/A
+#
+#  @return list - Items.
+def selectRange(items, key=None, limit=None, offset=0):
+
+    offset = max(offset or 0, 0)
+
+    if limit is None:
+        return sorted(items, key=key)[offset:]
+
+    if limit <= 0:
+        return []
+
+    return heapq.nsmallest(offset + limit, items, key=key)[offset:]
+
+#
+## @brief Get version of given metadata of an application as a tuple of integers, which can be compared.
+#
+#  @param record [ dict | None | in  ] - Metadata of an application.
+#
+#  @exception N/A
+#
+#  @return tuple of int - Major, minor and fix versions.
+def getVersionKey(record):
+
+    return (int(record['versionMajor']), int(record['versionMinor']), int(record['versionFix']))
+
+#
+## @brief Get key of given metadata of an application, which identifies it in a catalog.
+#
+#  @param record [ dict | None | in  ] - Metadata of an application.
+#
+#  @exception N/A
+#
+#  @return tuple of str - Package, module and class name.
+def getRecordKey(record):
+
+    return (record['package'], record['module'], record['className'])
+
+#
+## @brief Normalize given value of a secondary index, so it can be looked up.
+#
+#  User names and email addresses are case insensitive, trailing slashes of URLs are ignored.
+#
+#  @param index [ str | None | in  ] - Secondary index, one of SECONDARY_INDEXES.
+#  @param value [ str | None | in  ] - Value.
+#
+#  @exception N/A
+#
+#  @return str - Normalized value.
+def normalizeSecondaryKey(index, value):
+
+    value = (value or '').strip()
+
+    if index == INDEX_DOCUMENT_URL:
+        return value.rstrip('/')
+
+    return value.lower()
+
+#
+## @brief Get values of given secondary index for given metadata of an application.
+#
+#  @param record [ dict | None | in  ] - Metadata of an application.
+#  @param index  [ str  | None | in  ] - Secondary index, one of SECONDARY_INDEXES.
+#
+#  @exception ValueError - If given index is not supported.
+#
+#  @return set of str - Normalized values, @see normalizeSecondaryKey.
+def getSecondaryKeys(record, index):
+
+    if index == INDEX_DEVELOPER:
+        values = [x.get('userName') for x in record['developers']]
+    elif index == INDEX_EMAIL:
+        values = [x.get('email') for x in record['developers']]
+    elif index == INDEX_DOCUMENT_URL:
+        values = [x.get('url') for x in record['documents']]
+    else:
+        raise ValueError('Secondary index is not supported: {}'.format(index))
+
+    return set([normalizeSecondaryKey(index, x) for x in values if x])
+
+#
+## @brief Select the latest version of each application in given items.
+#
+#  @param items      [ iterable | None | in  ] - Items.
+#  @param getName    [ callable | None | in  ] - Function to get name of the application of an item.
+#  @param getVersion [ callable | None | in  ] - Function to get version of an item as a tuple of integers.
+#
+#  @exception N/A
+#
+#  @return list - Items in the order the applications first appear in given items.
+def selectLatest(items, getName, getVersion):
+
+    names  = []
+    latest = {}
+
+    for item in items:
+
+        name    = getName(item)
+        current = latest.get(name)
+
+        if current is None:
+            names.append(name)
+            latest[name] = (getVersion(item), item)
+
+        else:
+            version = getVersion(item)
+            if version > current[0]:
+                latest[name] = (version, item)
+
+    return [latest[x][1] for x in names]
+
+#
+## @brief Iterate metadata of applications matching given filters.
+#
+#  Catalog is used if available, @see Catalog.load, so no application info module is imported. Otherwise the packages
+#  are searched and metadata is provided as the applications are found.
+#
+#  @param parentApplication [ str  | None | in  ] - Parent application name, which listed applications can be run in.
+#  @param packageName       [ str  | None | in  ] - Name of the package, the applications will be list for.
+#  @param keyword           [ str  | None | in  ] - Keyword to be searched.
+#  @param ignoreInactive    [ bool | True | in  ] - Ignore, therefore do not list inactive applications.
+#
+#  @exception N/A
+#
+#  @return generator - Generator of dict instances, @see ApplicationInfo.asDict.
+def iterateRecords(parentApplication=None, packageName=None, keyword=None, ignoreInactive=True):
+
+    packageNames = [packageName] if packageName else None
+
+    _catalog = Catalog.load()
+
+    if _catalog and _catalog.containsPackages(packageNames):
+
+        for record in _catalog.query(parentApplication=parentApplication,
+                                     packageName=packageName,
+                                     keyword=keyword,
+                                     ignoreInactive=ignoreInactive):
+            yield record
+
+        return
+
+    import mApplication.applicationInfoAbs
+
+    for _appInfo in mApplication.applicationInfoAbs.ApplicationInfo.iterate(packageNames=packageNames):
+
+        record = _appInfo.asDict()
+
+        if Catalog.matchRecord(record,
+                               parentApplication=parentApplication,
+                               keyword=keyword,
+                               ignoreInactive=ignoreInactive):
+            yield record
+
+#
+## @brief [ CLASS ] - Catalog of applications, which contains metadata of application info classes.
+#
+#  Catalogs can be written into artifacts for released environments, so applications can be listed by a single
+#  file read instead of searching the packages.
+class Catalog(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED STATIC MEMBERS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## [ dict ] - Catalogs read from artifacts. Keys are absolute paths of the artifacts, values are tuples of
+    #  (mtime, size, Catalog).
+    _loaded     = {}
+
+    ## [ threading.Lock ] - Lock for the catalogs read from artifacts.
+    _loadedLock = threading.Lock()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param records     [ list of dict | None | in  ] - Metadata of applications, @see ApplicationInfo.asDict.
+    #  @param environment [ dict         | None | in  ] - Environment the catalog is built for, @see Catalog.getEnvironment.
+    #  @param filePath    [ str          | None | in  ] - Absolute path of the artifact the catalog is read from.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, records=None, environment=None, filePath=None):
+
+        ## [ list of dict ] - Metadata of applications.
+        self._records      = records if records else []
+
+        ## [ dict ] - Environment the catalog is built for.
+        self._environment  = environment if environment else Catalog.getEnvironment()
+
+        ## [ str ] - Absolute path of the artifact the catalog is read from.
+        self._filePath     = filePath
+
+        ## [ list ] - Stamp of the artifact when the catalog is read from it, @see getFileStamp.
+        self._fileStamp    = getFileStamp(filePath) if filePath else None
+
+        ## [ dict ] - Version index, created on first use, @see Catalog.getVersionIndex.
+        self._versionIndex = None
+
+        ## [ mApplication.fuzzySearchLib.TrigramIndex ] - Trigram index, created on first use, @see Catalog.getTrigramIndex.
+        self._trigramIndex = None
+
+        ## [ dict ] - Secondary indexes created on first use, keys are SECONDARY_INDEXES, @see Catalog.getSecondaryIndex.
+        self._secondaryIndexes = {}
+
+    #
+    ## @brief Number of applications.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Count.
+    def __len__(self):
+
+        return len(self._records)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Metadata of applications.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Metadata, @see ApplicationInfo.asDict.
+    def records(self):
+
+        return self._records
+
+    #
+    ## @brief Environment the catalog is built for.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are: pythonVersion, paths, packageNames and packageHashes for the catalogs built with the
+    #  hashes of the packages, @see Catalog.hashPackages.
+    def environment(self):
+
+        return self._environment
+
+    #
+    ## @brief Absolute path of the artifact the catalog is read from.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Path, None is returned for the catalogs, which aren't read from artifacts.
+    def filePath(self):
+
+        return self._filePath
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Whether the catalog contains applications of given packages.
+    #
+    #  Catalogs built for all packages contain any package.
+    #
+    #  @param packageNames [ list of str | None | in  ] - Names of the packages, None means all packages.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def containsPackages(self, packageNames=None):
+
+        catalogPackageNames = self._environment.get('packageNames')
+        if not catalogPackageNames:
+            return True
+
+        if not packageNames:
+            return False
+
+        catalogPackageNames = [x.lower() for x in catalogPackageNames]
+
+        for packageName in packageNames:
+            if packageName.lower() not in catalogPackageNames:
+                return False
+
+        return True
+
+    #
+    ## @brief Get content hashes of the packages in the catalog.
+    #
+    #  Hashes written in the catalog are used, they are computed from the app info modules listed in the catalog
+    #  otherwise.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are names of the packages, values are hashes.
+    def getPackageHashes(self):
+
+        packageHashes = self._environment.get('packageHashes')
+        if packageHashes is None:
+            packageHashes = Catalog.hashPackages(self.records())
+
+        return packageHashes
+
+    #
+    ## @brief Whether the catalog is built for given environment.
+    #
+    #  @param paths [ list of str | None | in  ] - Search paths of the environment, sys.path is used if None is provided.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def matchesEnvironment(self, paths=None):
+
+        environment = Catalog.getEnvironment(paths)
+
+        for key in ('pythonVersion', 'paths'):
+            if self._environment.get(key) != environment[key]:
+                return False
+
+        return True
+
+    #
+    ## @brief Query metadata of applications.
+    #
+    #  Filters work the same way as they do in ApplicationInfo.list method.
+    #
+    #  @param parentApplication [ str  | None | in  ] - Parent application name, which listed applications can be run in.
+    #  @param packageName       [ str  | None | in  ] - Name of the package, the applications will be list for.
+    #  @param keyword           [ str  | None | in  ] - Keyword to be searched.
+    #  @param ignoreInactive    [ bool | True | in  ] - Ignore, therefore do not list inactive applications.
+    #  @param limit             [ int  | None | in  ] - Maximum number of applications, None means no limit.
+    #  @param offset            [ int  | 0    | in  ] - Number of applications to be skipped.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Metadata of applications sorted by their names.
+    def query(self, parentApplication=None, packageName=None, keyword=None, ignoreInactive=True, limit=None, offset=0):
+
+        records = (x for x in self._records if Catalog.matchRecord(x,
+                                                                   parentApplication=parentApplication,
+                                                                   packageName=packageName,
+                                                                   keyword=keyword,
+                                                                   ignoreInactive=ignoreInactive))
+
+        return selectRange(records, key=lambda x: x['name'], limit=limit, offset=offset)
+
+    #
+    ## @brief Get version index of the applications.
+    #
+    #  Index is built once per catalog since catalogs aren't modified. Releases of a package in several search paths
+    #  have their own records, @see mApplication.applicationInfoAbs.ApplicationInfo._importModule.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are names of the applications, values are lists of metadata sorted by their versions,
+    #  the latest version first.
+    def getVersionIndex(self):
+
+        versionIndex = self._versionIndex
+
+        if versionIndex is None:
+
+            versionIndex = {}
+            for record in self.records():
+                versionIndex.setdefault(record['name'], []).append(record)
+
+            for records in versionIndex.values():
+                records.sort(key=getVersionKey, reverse=True)
+
+            self._versionIndex = versionIndex
+
+        return versionIndex
+
+    #
+    ## @brief Get trigram index of the names and keywords of the applications.
+    #
+    #  Index is built once per catalog since catalogs aren't modified. Catalogs read from artifacts read the index
+    #  written next to the artifact if it is written for the same artifact, otherwise the index is built and written,
+    #  so other processes don't build it again, @see getTrigramIndexFilePath.
+    #
+    #  @exception N/A
+    #
+    #  @return mApplication.fuzzySearchLib.TrigramIndex - Index.
+    def getTrigramIndex(self):
+
+        trigramIndex = self._trigramIndex
+
+        if trigramIndex is None:
+
+            import mApplication.fuzzySearchLib
+
+            if self._fileStamp:
+                trigramIndex = self._readTrigramIndex()
+
+            if trigramIndex is None:
+
+                trigramIndex = mApplication.fuzzySearchLib.TrigramIndex(self.records())
+
+                if self._fileStamp:
+                    try:
+                        self._writeTrigramIndex(trigramIndex, self._filePath, self._fileStamp)
+                    except (IOError, OSError):
+                        # Artifacts can be shared on read-only file systems
+                        pass
+
+            self._trigramIndex = trigramIndex
+
+        return trigramIndex
+
+    #
+    ## @brief Get given secondary index of the applications.
+    #
+    #  Index is built once per catalog since catalogs aren't modified.
+    #
+    #  @param index [ str | None | in  ] - Secondary index, one of SECONDARY_INDEXES.
+    #
+    #  @exception ValueError - If given index is not supported.
+    #
+    #  @return dict - Keys are normalized values, @see normalizeSecondaryKey, values are lists of metadata of
+    #  applications sorted by their names.
+    def getSecondaryIndex(self, index):
+
+        secondaryIndex = self._secondaryIndexes.get(index)
+
+        if secondaryIndex is None:
+
+            if index not in SECONDARY_INDEXES:
+                raise ValueError('Secondary index is not supported: {}'.format(index))
+
+            secondaryIndex = {}
+            for record in self.records():
+                for key in getSecondaryKeys(record, index):
+                    secondaryIndex.setdefault(key, []).append(record)
+
+            for records in secondaryIndex.values():
+                records.sort(key=lambda x: (x['name'], x['module'], x['className']))
+
+            self._secondaryIndexes[index] = secondaryIndex
+
+        return secondaryIndex
+
+    #
+    ## @brief Find metadata of applications by their developers and documents.
+    #
+    #  Applications matching all given values are found, e.g. all applications of a developer documented at a URL.
+    #
+    #  @param developer   [ str | None | in  ] - User name of a developer, case insensitive.
+    #  @param email       [ str | None | in  ] - Email address of a developer, case insensitive.
+    #  @param documentUrl [ str | None | in  ] - URL of a document.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Metadata of applications sorted by their names, all applications are provided if no value
+    #  is given.
+    def findBySecondaryKeys(self, developer=None, email=None, documentUrl=None):
+
+        found = None
+
+        for index, value in ((INDEX_DEVELOPER, developer), (INDEX_EMAIL, email), (INDEX_DOCUMENT_URL, documentUrl)):
+
+            if not value:
+                continue
+
+            records = self.getSecondaryIndex(index).get(normalizeSecondaryKey(index, value), [])
+
+            if found is None:
+                found = records
+            else:
+                keys  = set([(x['package'], x['module'], x['className']) for x in records])
+                found = [x for x in found if (x['package'], x['module'], x['className']) in keys]
+
+        if found is None:
+            return sorted(self.records(), key=lambda x: (x['name'], x['module'], x['className']))
+
+        return list(found)
+
+    #
+    ## @brief Select the latest version of each application in given items by the version index.
+    #
+    #  Versions of each application are visited from the latest one by the version index until one of given items is
+    #  found, so the latest version among given items is selected, e.g. the latest active version.
+    #
+    #  @param items     [ iterable | None | in  ] - Items, which are metadata of the applications of this catalog or
+    #  contain them.
+    #  @param getRecord [ callable | None | in  ] - Function to get metadata of an item, items are metadata if None is
+    #  provided.
+    #
+    #  @exception N/A
+    #
+    #  @return list - Items in the order the applications first appear in given items.
+    def selectLatest(self, items, getRecord=None):
+
+        versionIndex = self.getVersionIndex()
+
+        names   = []
+        matches = {}
+
+        for item in items:
+
+            record = getRecord(item) if getRecord else item
+
+            if record['name'] not in matches:
+                names.append(record['name'])
+                matches[record['name']] = {}
+
+            matches[record['name']].setdefault(getRecordKey(record), item)
+
+        selected = []
+
+        for name in names:
+            for record in versionIndex.get(name, []):
+                item = matches[name].get(getRecordKey(record))
+                if item is not None:
+                    selected.append(item)
+                    break
+
+        return selected
+
+    #
+    ## @brief Find the latest version of given application.
+    #
+    #  @param name [ str | None | in  ] - Name of the application.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Metadata, None is returned if there is no such application.
+    def findLatest(self, name):
+
+        records = self.getVersionIndex().get(name)
+        if not records:
+            return None
+
+        return records[0]
+
+    #
+    ## @brief Find given version of given application.
+    #
+    #  @param name    [ str          | None | in  ] - Name of the application.
+    #  @param version [ tuple of int | None | in  ] - Major, minor and fix versions.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Metadata, None is returned if there is no such version.
+    def findVersion(self, name, version):
+
+        version = tuple(version)
+
+        for record in self.getVersionIndex().get(name, []):
+            if getVersionKey(record) == version:
+                return record
+
+        return None
+
+    #
+    ## @brief Find versions of given application in given range.
+    #
+    #  @param name    [ str          | None | in  ] - Name of the application.
+    #  @param minimum [ tuple of int | None | in  ] - Minimum version (inclusive), None means no minimum.
+    #  @param maximum [ tuple of int | None | in  ] - Maximum version (exclusive), None means no maximum.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Metadata, the latest version first.
+    def findVersionRange(self, name, minimum=None, maximum=None):
+
+        minimum = tuple(minimum) if minimum is not None else None
+        maximum = tuple(maximum) if maximum is not None else None
+
+        records = []
+
+        for record in self.getVersionIndex().get(name, []):
+
+            version = getVersionKey(record)
+
+            if maximum is not None and version >= maximum:
+                continue
+
+            if minimum is not None and version < minimum:
+                break
+
+            records.append(record)
+
+        return records
+
+    #
+    ## @brief Get dict representation, which is written in catalog artifacts.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are: version, environment, records.
+    def asDict(self):
+
+        return {'version'     : CATALOG_FORMAT_VERSION,
+                'environment' : self._environment,
+                'records'     : self.records()}
+
+    #
+    ## @brief Write the catalog into given artifact file atomically.
+    #
+    #  Binary catalog artifacts can be memory-mapped, @see mApplication.binaryCatalogLib.
+    #
+    #  @param filePath [ str  | None  | in  ] - Absolute path of the artifact file.
+    #  @param binary   [ bool | False | in  ] - Write binary catalog artifact instead of JSON.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def write(self, filePath, binary=False):
+
+        if binary:
+            import mApplication.binaryCatalogLib
+            mApplication.binaryCatalogLib.write(self, filePath)
+        else:
+            writeFileAtomically(filePath, json.dumps(self.asDict(), sort_keys=True, separators=(',', ':')))
+
+        self.writeTrigramIndex(filePath)
+
+    #
+    ## @brief Write trigram index of the applications next to given catalog artifact, which is written for this catalog.
+    #
+    #  @param filePath [ str | None | in  ] - Absolute path of the catalog artifact.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def writeTrigramIndex(self, filePath):
+
+        Catalog._writeTrigramIndex(self.getTrigramIndex(), filePath, getFileStamp(filePath))
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Read trigram index written next to the artifact of the catalog.
+    #
+    #  @exception N/A
+    #
+    #  @return mApplication.fuzzySearchLib.TrigramIndex - Index, None is returned if there is no index written for
+    #  the artifact the catalog is read from.
+    def _readTrigramIndex(self):
+
+        import mApplication.fuzzySearchLib
+
+        try:
+            with open(getTrigramIndexFilePath(self._filePath), 'r') as _file:
+                data = json.load(_file)
+        except (IOError, OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get('version') != CATALOG_FORMAT_VERSION:
+            return None
+
+        if data.get('artifact') != self._fileStamp:
+            return None
+
+        try:
+            return mApplication.fuzzySearchLib.TrigramIndex(self.records(), data=data.get('index'))
+        except ValueError:
+            return None
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get environment information catalogs are validated with.
+    #
+    #  Empty search paths, which refer to the current working directory, are ignored.
+    #
+    #  @param paths        [ list of str | None | in  ] - Search paths, sys.path is used if None is provided.
+    #  @param packageNames [ list of str | None | in  ] - Names of the packages, None means all packages.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are: pythonVersion, paths, packageNames.
+    @staticmethod
+    def getEnvironment(paths=None, packageNames=None):
+
+        if paths is None:
+            paths = sys.path
+
+        # Empty entries refer to the current working directory (python -c), which isn't part of the environment
+        paths = [x for x in paths if x]
+
+        return {'pythonVersion' : '{}.{}'.format(sys.version_info[0], sys.version_info[1]),
+                'paths'         : mApplication.discoveryLib.listSearchPaths(paths, includeArchives=True),
+                'packageNames'  : sorted(packageNames) if packageNames else None}
+
+    #
+    ## @brief Build a catalog by searching the packages in the current environment.
+    #
+    #  Inactive applications are included in the catalog.
+    #
+    #  @param packageNames [ list of str | None | in  ] - Names of the packages, None means all packages.
+    #
+    #  @exception N/A
+    #
+    #  @return mApplication.catalogLib.Catalog - Class instance.
+    @staticmethod
+    def build(packageNames=None):
+
+        import mApplication.applicationInfoAbs
+
+        records = [x.asDict() for x in mApplication.applicationInfoAbs.ApplicationInfo.iterate(packageNames=packageNames)]
+        records.sort(key=lambda x: (x['name'], x['module'], x['className']))
+
+        environment = Catalog.getEnvironment(packageNames=packageNames)
+        environment['packageHashes'] = Catalog.hashPackages(records)
+
+        return Catalog(records=records, environment=environment)
+
+    #
+    ## @brief Compute content hashes of the packages of given metadata of applications.
+    #
+    #  Hash of a package is built with the names and content hashes of its app info modules, therefore it changes only
+    #  if one of them is modified, added or removed. Content hashes are computed in parallel and kept in memory,
+    #  @see mApplication.contentHashLib.hashFiles.
+    #
+    #  @param records [ list of dict | None | in  ] - Metadata of applications.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are names of the packages, values are hashes.
+    @staticmethod
+    def hashPackages(records):
+
+        filePaths = {}
+        for record in records:
+            filePaths.setdefault(record['package'], set()).add(record['filePath'])
+
+        return Catalog.hashPackageFiles(filePaths)
+
+    #
+    ## @brief Compute content hashes of the packages of given app info modules without importing them.
+    #
+    #  @param filePaths [ dict | None | in  ] - Keys are names of the packages, values are absolute paths of their app
+    #  info modules.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are names of the packages, values are hashes, @see hashPackages.
+    @staticmethod
+    def hashPackageFiles(filePaths):
+
+        contentHashes = mApplication.contentHashLib.hashFiles([x for y in filePaths.values() for x in y])
+
+        packageHashes = {}
+
+        for packageName, packageFilePaths in filePaths.items():
+
+            _hash = hashlib.sha1()
+
+            for filePath in sorted(packageFilePaths):
+                _hash.update(os.path.basename(filePath).encode('utf-8'))
+                _hash.update((contentHashes[filePath] or '\0').encode('utf-8'))
+
+            packageHashes[packageName] = _hash.hexdigest()
+
+        return packageHashes
+
+    #
+    ## @brief Read catalog from given artifact file.
+    #
+    #  @param filePath [ str | None | in  ] - Absolute path of the artifact file.
+    #
+    #  @exception N/A
+    #
+    #  Binary catalog artifacts are memory-mapped, @see mApplication.binaryCatalogLib.MappedCatalog. SQLite catalogs
+    #  are queried by SQL, @see mApplication.sqliteCatalogLib.SQLiteCatalog.
+    #
+    #  @return mApplication.catalogLib.Catalog - Class instance, None is returned if the artifact can't be read or
+    #  it has been written with another format version.
+    @staticmethod
+    def read(filePath):
+
+        import mApplication.binaryCatalogLib
+
+        if mApplication.binaryCatalogLib.isBinaryCatalog(filePath):
+            try:
+                return mApplication.binaryCatalogLib.MappedCatalog(filePath)
+            except (IOError, OSError, ValueError):
+                return None
+
+        import mApplication.sqliteCatalogLib
+
+        if mApplication.sqliteCatalogLib.isSQLiteCatalog(filePath):
+            try:
+                return mApplication.sqliteCatalogLib.SQLiteCatalog(filePath, readOnly=True)
+            except (mApplication.sqliteCatalogLib.sqlite3.Error, ValueError):
+                return None
+
+        try:
+            with open(filePath, 'r') as _file:
+                data = json.load(_file)
+        except (IOError, OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get('version') != CATALOG_FORMAT_VERSION:
+            return None
+
+        return Catalog(records=data.get('records'), environment=data.get('environment'), filePath=filePath)
+
+    #
+    ## @brief Load catalog from the frozen catalog artifact if it matches the current environment.
+    #
+    #  Catalogs are read once and kept in memory until their artifacts are modified.
+    #
+    #  If no artifact file is provided by CATALOG_FILE_ENV_VARIABLE environment variable, catalog is got from the
+    #  shared cache if it is enabled, @see mApplication.sharedCacheLib.SharedCatalogCache.
+    #
+    #  @param filePath [ str | None | in  ] - Absolute path of the artifact file, value of
+    #  CATALOG_FILE_ENV_VARIABLE environment variable is used if None is provided.
+    #
+    #  @exception N/A
+    #
+    #  @return mApplication.catalogLib.Catalog - Class instance, None is returned if no artifact is available or it
+    #  doesn't match the current environment.
+    @staticmethod
+    def load(filePath=None):
+
+        if not filePath:
+            filePath = os.environ.get(CATALOG_FILE_ENV_VARIABLE)
+            if not filePath:
+                import mApplication.sharedCacheLib
+                return mApplication.sharedCacheLib.SharedCatalogCache().get()
+
+        try:
+            _stat = os.stat(filePath)
+        except OSError:
+            return None
+
+        loaded = Catalog._loaded.get(filePath)
+        if loaded and loaded[0] == _stat.st_mtime and loaded[1] == _stat.st_size:
+            _catalog = loaded[2]
+        else:
+            with Catalog._loadedLock:
+
+                # Another thread may have read the artifact while waiting for the lock
+                loaded = Catalog._loaded.get(filePath)
+                if loaded and loaded[0] == _stat.st_mtime and loaded[1] == _stat.st_size:
+                    _catalog = loaded[2]
+                else:
+                    _catalog = Catalog.read(filePath)
+                    Catalog._loaded[filePath] = (_stat.st_mtime, _stat.st_size, _catalog)
+
+        if not _catalog or not _catalog.matchesEnvironment():
+            return None
+
+        return _catalog
+
+    #
+    ## @brief Check whether given metadata of an application matches given filters.
+    #
+    #  @param record            [ dict | None | in  ] - Metadata of the application.
+    #  @param parentApplication [ str  | None | in  ] - Parent application name.
+    #  @param packageName       [ str  | None | in  ] - Name of the package.
+    #  @param keyword           [ str  | None | in  ] - Keyword to be searched.
+    #  @param ignoreInactive    [ bool | True | in  ] - Ignore inactive applications.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    @staticmethod
+    def matchRecord(record, parentApplication=None, packageName=None, keyword=None, ignoreInactive=True):
+
+        if ignoreInactive and not record['isActive']:
+            return False
+
+        if packageName and packageName.lower() != record['package'].lower():
+            return False
+
+        if parentApplication and parentApplication != mApplication.parentApplicationLib.Application.kAll:
+            if parentApplication not in record['parentApplications']:
+                return False
+
+        if keyword:
+            if not keyword in record['keywords'] and not keyword in record['name'].lower():
+                return False
+
+        return True
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Write given trigram index next to given catalog artifact atomically.
+    #
+    #  @param trigramIndex [ mApplication.fuzzySearchLib.TrigramIndex | None | in  ] - Index.
+    #  @param filePath     [ str                                      | None | in  ] - Absolute path of the catalog
+    #  artifact.
+    #  @param stamp        [ list                                     | None | in  ] - Stamp of the artifact the
+    #  index is built for, @see getFileStamp.
+    #
+    #  @exception IOError - If the file can't be written.
+    #
+    #  @return None - None.
+    @staticmethod
+    def _writeTrigramIndex(trigramIndex, filePath, stamp):
+
+        data = {'version'  : CATALOG_FORMAT_VERSION,
+                'artifact' : stamp,
+                'index'    : trigramIndex.asDict()}
+
+        writeFileAtomically(getTrigramIndexFilePath(filePath), json.dumps(data, sort_keys=True, separators=(',', ':')))
+
+#
+## @brief [ CLASS ] - Thread-safe access to the catalog of the current environment.
+#
+#  Readers get the current snapshot, which is an immutable catalog, without any lock, therefore concurrent queries
+#  never block each other. Refreshes build a new snapshot under a writer lock and swap it in by a single assignment,
+#  so readers see either the previous or the new snapshot but never a partially refreshed one. Snapshots must not be
+#  modified by readers.
+class CatalogStore(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param loader [ callable | None | in  ] - Function, which returns a new mApplication.catalogLib.Catalog
+    #  instance, CatalogStore.loadCatalog is used if None is provided.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, loader=None):
+
+        ## [ callable ] - Function, which returns a new catalog.
+        self._loader        = loader if loader else CatalogStore.loadCatalog
+
+        ## [ mApplication.catalogLib.Catalog ] - Current snapshot, created on first access.
+        self._snapshot      = None
+
+        ## [ int ] - Number of the snapshots swapped in.
+        self._generation    = 0
+
+        ## [ threading.Lock ] - Writer lock.
+        self._writeLock     = threading.Lock()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get number of the snapshots swapped in, which can be used to detect refreshes.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Generation.
+    def generation(self):
+
+        return self._generation
+
+    #
+    ## @brief Get current snapshot, it is created if there is none yet.
+    #
+    #  @exception N/A
+    #
+    #  @return mApplication.catalogLib.Catalog - Snapshot.
+    def snapshot(self):
+
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.refresh(force=False)
+
+        return snapshot
+
+    #
+    ## @brief Build a new snapshot and swap it in.
+    #
+    #  Refreshes requested while another one is in progress wait for it and don't build another snapshot.
+    #
+    #  @param force [ bool | True | in  ] - Build a new snapshot even if there is one already.
+    #
+    #  @exception N/A
+    #
+    #  @return mApplication.catalogLib.Catalog - New snapshot.
+    def refresh(self, force=True):
+
+        generation = self._generation
+
+        with self._writeLock:
+
+            if self._snapshot is not None and (not force or self._generation != generation):
+                return self._snapshot
+
+            _catalog = self._loader()
+
+            # Records of the snapshot are frozen so readers can't append to or remove from them, records of memory-mapped
+            # and SQLite catalogs are copied as well since their artifacts can be rewritten while they are queried
+            if type(_catalog) is not Catalog or not isinstance(_catalog.records(), tuple):
+                _catalog = Catalog(records=tuple(_catalog.records()), environment=dict(_catalog.environment()))
+
+            self._snapshot    = _catalog
+            self._generation += 1
+
+        return _catalog
+
+    #
+    ## @brief Query metadata of applications in the current snapshot.
+    #
+    #  Arguments are the same as Catalog.query method.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Metadata of applications sorted by their names.
+    def query(self, parentApplication=None, packageName=None, keyword=None, ignoreInactive=True, limit=None, offset=0):
+
+        return self.snapshot().query(parentApplication=parentApplication,
+                                     packageName=packageName,
+                                     keyword=keyword,
+                                     ignoreInactive=ignoreInactive,
+                                     limit=limit,
+                                     offset=offset)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Load the catalog of the current environment, it is built if no catalog is available.
+    #
+    #  @exception N/A
+    #
+    #  @return mApplication.catalogLib.Catalog - Catalog.
+    @staticmethod
+    def loadCatalog():
+
+        _catalog = Catalog.load()
+        if _catalog:
+            return _catalog
+
+        return Catalog.build()
@@ -0,0 +1,131 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mApplication/completionLib.py @brief [ FILE   ] - Index of the values used by shell completion.
+## @package mApplication.completionLib    @brief [ MODULE ] - Index of the values used by shell completion.
+#
+#  Completion index is a text file, each line of which contains a kind and a value separated by a tab, e.g.
+#  "package<TAB>mApplication". It is read by the completion scripts in the completion directory of this package
+#  directly, so completion doesn't run Python at all.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+
+import mApplication.catalogLib
+import mApplication.parentApplicationLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ str ] - Name of the environment variable, which provides absolute path of the completion index file.
+COMPLETION_INDEX_FILE_ENV_VARIABLE  = 'MAPPLICATION_COMPLETION_INDEX_FILE'
+
+## [ str ] - Names of the packages.
+KIND_PACKAGE                        = 'package'
+
+## [ str ] - Parent applications.
+KIND_PARENT_APPLICATION             = 'parent'
+
+## [ str ] - Names of the applications.
+KIND_NAME                           = 'name'
+
+## [ str ] - Keywords of the applications.
+KIND_KEYWORD                        = 'keyword'
+
+## [ str ] - User names of the developers of the applications.
+KIND_DEVELOPER                      = 'developer'
+
+## [ str ] - Email addresses of the developers of the applications.
+KIND_EMAIL                          = 'email'
+
+#
+## @brief Get absolute path of the completion index file.
+#
+#  @exception N/A
+#
+#  @return str - Path, value of COMPLETION_INDEX_FILE_ENV_VARIABLE environment variable if it is set.
+def getCompletionIndexFilePath():
+
+    filePath = os.environ.get(COMPLETION_INDEX_FILE_ENV_VARIABLE)
+    if filePath:
+        return filePath
+
+    return os.path.join(os.path.expanduser('~'), '.mApplication', 'completionIndex.txt')
+
+#
+## @brief Build content of the completion index.
+#
+#  @param records [ iterable | None | in  ] - Metadata of the applications, @see ApplicationInfo.asDict. Metadata of
+#  all applications in the current environment is used if None is provided, @see mApplication.catalogLib.iterateRecords.
+#
+#  @exception N/A
+#
+#  @return str - Content.
+def buildCompletionIndex(records=None):
+
+    if records is None:
+        records = mApplication.catalogLib.iterateRecords(ignoreInactive=False)
+
+    entries = set()
+
+    parentApplications = mApplication.parentApplicationLib.Application.listAttributes()
+    parentApplications.extend([mApplication.parentApplicationLib.Application.kAll,
+                               mApplication.parentApplicationLib.Application.kStandalone])
+
+    for parentApplication in parentApplications:
+        entries.add((KIND_PARENT_APPLICATION, parentApplication))
+
+    for record in records:
+
+        entries.add((KIND_PACKAGE, record['package']))
+        entries.add((KIND_NAME, record['name']))
+
+        for keyword in record['keywords']:
+            entries.add((KIND_KEYWORD, keyword))
+
+        for developer in record['developers']:
+            entries.add((KIND_DEVELOPER, developer.get('userName') or ''))
+            entries.add((KIND_EMAIL, developer.get('email') or ''))
+
+    lines = ['{}\t{}\n'.format(kind, ' '.join(value.split())) for kind, value in sorted(entries) if value and value.strip()]
+
+    return ''.join(lines)
+
+#
+## @brief Write the completion index of the current environment.
+#
+#  @param filePath [ str | None | in  ] - Absolute path of the index file, @see getCompletionIndexFilePath.
+#
+#  @exception N/A
+#
+#  @return str - Absolute path of the index file.
+def writeCompletionIndex(filePath=None):
+
+    if not filePath:
+        filePath = getCompletionIndexFilePath()
+
+    mApplication.catalogLib.writeFileAtomically(filePath, buildCompletionIndex())
+
+    return filePath
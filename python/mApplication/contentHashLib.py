@@ -0,0 +1,455 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mApplication/contentHashLib.py @brief [ FILE   ] - Content hashes of app info modules.
+## @package mApplication.contentHashLib    @brief [ MODULE ] - Content hashes of app info modules.
+#
+#  Caches are validated with modification times of the files by default. Some deployments (e.g. rsync or NFS)
+#  preserve or coarsen modification times, content hash validation can be enabled for them by
+#  CONTENT_HASH_VALIDATION_ENV_VARIABLE environment variable, so app info modules and package info modules are
+#  fingerprinted by their contents as well.
+#
+#  Hashes are computed in parallel and kept by inode, size, modification and change times of the files in memory and
+#  in a file next to the catalog, therefore unchanged files aren't read again by the same process or by other
+#  processes sharing the catalog, @see getHashesFilePath.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import json
+import hashlib
+import threading
+
+import mApplication.discoveryLib
+
+import mMecoPackage.enumLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ str ] - Name of the environment variable, which enables content hash validation, e.g. 1.
+CONTENT_HASH_VALIDATION_ENV_VARIABLE    = 'MAPPLICATION_CONTENT_HASH_VALIDATION'
+
+## [ str ] - Name of the package info module, which contains metadata of the packages.
+PACKAGE_INFO_FILE_NAME                  = 'packageInfoLib.py'
+
+## [ int ] - Maximum number of the threads hashing files.
+DEFAULT_MAX_WORKERS                     = 8
+
+## [ int ] - Size of the chunks files are read in.
+CHUNK_SIZE                              = 1048576
+
+## [ str ] - Name of the file hashes are written in, @see getHashesFilePath.
+HASHES_FILE_NAME                        = 'contentHashes.json'
+
+## [ int ] - Version of the hashes file format, files written with other versions are ignored.
+HASHES_FILE_FORMAT_VERSION              = 2
+
+## [ str ] - Name of the hash algorithm, blake2b isn't available in Python 2.
+HASH_ALGORITHM                          = 'blake2b' if hasattr(hashlib, 'blake2b') else 'sha1'
+
+## [ dict ] - Keys are absolute paths of the files, values are tuples of (identity, hash), @see getFileIdentity.
+_hashes                                 = {}
+
+## [ dict ] - Keys are absolute paths of the hashes files read, values are their sizes and modification times.
+_hashesFileStamps                       = {}
+
+## [ threading.Lock ] - Lock for the hashes.
+_hashesLock                             = threading.Lock()
+
+#
+## @brief Whether content hash validation is enabled by CONTENT_HASH_VALIDATION_ENV_VARIABLE environment variable.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def isEnabled():
+
+    return os.environ.get(CONTENT_HASH_VALIDATION_ENV_VARIABLE, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+#
+## @brief Create a new hash object of HASH_ALGORITHM.
+#
+#  @exception N/A
+#
+#  @return object - Hash object.
+def _newHash():
+
+    if HASH_ALGORITHM == 'blake2b':
+        return hashlib.blake2b(digest_size=16)
+
+    return hashlib.sha1()
+
+#
+## @brief Get absolute path of the file hashes are written in by default.
+#
+#  Hashes are written in the shared cache directory if the shared cache is enabled, otherwise next to the frozen
+#  catalog artifact if there is one, @see mApplication.sharedCacheLib and mApplication.catalogLib.
+#
+#  @exception N/A
+#
+#  @return str - Path, None is returned if hashes aren't written.
+def getHashesFilePath():
+
+    import mApplication.catalogLib
+    import mApplication.sharedCacheLib
+
+    directory = os.environ.get(mApplication.sharedCacheLib.SHARED_CACHE_DIRECTORY_ENV_VARIABLE)
+    if not directory:
+
+        catalogFilePath = os.environ.get(mApplication.catalogLib.CATALOG_FILE_ENV_VARIABLE)
+        if not catalogFilePath:
+            return None
+
+        directory = os.path.dirname(os.path.abspath(catalogFilePath))
+
+    return os.path.join(directory, HASHES_FILE_NAME)
+
+#
+## @brief Read hashes from given file.
+#
+#  @param filePath [ str | None | in  ] - Absolute path of the hashes file.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are absolute paths of the files, values are tuples of (identity, hash), empty dict is returned
+#  if the file can't be read or it is written with another hash algorithm.
+def _readHashes(filePath):
+
+    try:
+        with open(filePath, 'r') as _file:
+            data = json.load(_file)
+    except (IOError, OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get('version') != HASHES_FILE_FORMAT_VERSION:
+        return {}
+
+    if data.get('algorithm') != HASH_ALGORITHM:
+        return {}
+
+    try:
+        return dict([(key, (tuple(value[0]), value[1])) for key, value in data['hashes'].items()])
+    except (KeyError, TypeError, IndexError, AttributeError):
+        return {}
+
+#
+## @brief Read hashes written by other processes from given file into the memory if the file is modified.
+#
+#  @param filePath [ str | None | in  ] - Absolute path of the hashes file.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def _loadHashes(filePath):
+
+    try:
+        _stat = os.stat(filePath)
+    except OSError:
+        return
+
+    stamp = (_stat.st_size, _stat.st_mtime)
+
+    with _hashesLock:
+        if _hashesFileStamps.get(filePath) == stamp:
+            return
+
+    hashes = _readHashes(filePath)
+
+    with _hashesLock:
+
+        for key, value in hashes.items():
+            if key not in _hashes:
+                _hashes[key] = value
+
+        _hashesFileStamps[filePath] = stamp
+
+#
+## @brief Write given hashes into given file atomically, hashes of the other files in it are kept.
+#
+#  Processes writing the file at the same time may lose some of each other's hashes, which are computed again then.
+#
+#  @param filePath [ str  | None | in  ] - Absolute path of the hashes file.
+#  @param hashes   [ dict | None | in  ] - Keys are absolute paths of the files, values are tuples of (identity, hash).
+#
+#  @exception N/A
+#
+#  @return None - None.
+def _saveHashes(filePath, hashes):
+
+    import mApplication.catalogLib
+
+    data = _readHashes(filePath)
+    data.update(hashes)
+
+    try:
+        mApplication.catalogLib.writeFileAtomically(filePath,
+                                                    json.dumps({'version'   : HASHES_FILE_FORMAT_VERSION,
+                                                                'algorithm' : HASH_ALGORITHM,
+                                                                'hashes'    : dict([(key, [list(value[0]), value[1]])
+                                                                                    for key, value in data.items()])},
+                                                               sort_keys=True,
+                                                               separators=(',', ':')))
+    except (IOError, OSError):
+        # Shared directories can be read-only for some users
+        return
+
+    _stat = os.stat(filePath)
+
+    with _hashesLock:
+        _hashesFileStamps[filePath] = (_stat.st_size, _stat.st_mtime)
+
+#
+## @brief Get identity of given file, which changes when the file is replaced or modified.
+#
+#  Change time is included, since it is updated when a file is modified in place even if its modification time is
+#  restored afterwards, e.g. by tools preserving timestamps. App info modules in zip archives are identified by their
+#  archives.
+#
+#  @param filePath [ str | None | in  ] - Absolute path of the file.
+#
+#  @exception N/A
+#
+#  @return tuple - Device, inode, size, modification and change times, in nanoseconds if available, None is returned if
+#  the file can't be accessed.
+def getFileIdentity(filePath):
+
+    try:
+        _stat = os.stat(filePath)
+    except OSError:
+
+        archivePath = mApplication.discoveryLib.splitArchivePath(filePath)
+        if not archivePath:
+            return None
+
+        try:
+            _stat = os.stat(archivePath[0])
+        except OSError:
+            return None
+
+    # Times in nanoseconds aren't available in Python 2
+    return (_stat.st_dev,
+            _stat.st_ino,
+            _stat.st_size,
+            getattr(_stat, 'st_mtime_ns', _stat.st_mtime),
+            getattr(_stat, 'st_ctime_ns', _stat.st_ctime))
+
+#
+## @brief Read given file and compute its hash.
+#
+#  @param filePath [ str | None | in  ] - Absolute path of the file.
+#
+#  @exception N/A
+#
+#  @return str - Hash, None is returned if the file can't be read.
+def _computeHash(filePath):
+
+    _hash = _newHash()
+
+    try:
+        with open(filePath, 'rb') as _file:
+            for chunk in iter(lambda: _file.read(CHUNK_SIZE), b''):
+                _hash.update(chunk)
+    except (IOError, OSError):
+
+        data = mApplication.discoveryLib.readArchiveFile(filePath)
+        if data is None:
+            return None
+
+        _hash.update(data)
+
+    return _hash.hexdigest()
+
+#
+## @brief Get content hash of given file.
+#
+#  Hash is read from the memory or the hashes file if the file hasn't been replaced or modified since it was hashed.
+#
+#  @param filePath       [ str | None | in  ] - Absolute path of the file, which can be in a zip archive.
+#  @param hashesFilePath [ str | None | in  ] - Absolute path of the hashes file, default is used if None is provided,
+#  @see getHashesFilePath.
+#
+#  @exception N/A
+#
+#  @return str - Hash, None is returned if the file can't be read.
+def hashFile(filePath, hashesFilePath=None):
+
+    return hashFiles([filePath], hashesFilePath=hashesFilePath).get(filePath)
+
+#
+## @brief Get content hashes of given files.
+#
+#  Files, which haven't been hashed or have been modified, are read in parallel and their hashes are written into the
+#  hashes file.
+#
+#  @param filePaths      [ list of str | None                | in  ] - Absolute paths of the files.
+#  @param maxWorkers     [ int         | DEFAULT_MAX_WORKERS | in  ] - Maximum number of the threads hashing files.
+#  @param hashesFilePath [ str         | None                | in  ] - Absolute path of the hashes file, default is used
+#  if None is provided, @see getHashesFilePath.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are the paths, values are hashes, None for the files can't be read.
+def hashFiles(filePaths, maxWorkers=DEFAULT_MAX_WORKERS, hashesFilePath=None):
+
+    if hashesFilePath is None:
+        hashesFilePath = getHashesFilePath()
+
+    if hashesFilePath:
+        _loadHashes(hashesFilePath)
+
+    hashes     = {}
+    identities = {}
+
+    # Files are accessed outside of the lock, so other threads aren't blocked by slow file systems
+    with _hashesLock:
+        cachedHashes = dict([(x, _hashes.get(x)) for x in filePaths])
+
+    for filePath in filePaths:
+
+        identity = getFileIdentity(filePath)
+        if identity is None:
+            hashes[filePath] = None
+            continue
+
+        cached = cachedHashes[filePath]
+        if cached and cached[0] == identity:
+            hashes[filePath] = cached[1]
+        else:
+            identities[filePath] = identity
+
+    if not identities:
+        return hashes
+
+    missingFilePaths = list(identities.keys())
+
+    computed         = [None] * len(missingFilePaths)
+    indices          = list(range(len(missingFilePaths)))
+    lock             = threading.Lock()
+
+    def hashNext():
+        while True:
+            with lock:
+                if not indices:
+                    return
+                index = indices.pop(0)
+            computed[index] = _computeHash(missingFilePaths[index])
+
+    if len(missingFilePaths) == 1 or maxWorkers <= 1:
+        hashNext()
+    else:
+        threads = [threading.Thread(target=hashNext) for x in range(min(maxWorkers, len(missingFilePaths)))]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+    newHashes = {}
+
+    for filePath, _hash in zip(missingFilePaths, computed):
+
+        hashes[filePath] = _hash
+
+        # File may have been modified while it was read, it is hashed again next time then
+        if _hash is not None and getFileIdentity(filePath) == identities[filePath]:
+            newHashes[filePath] = (identities[filePath], _hash)
+
+    with _hashesLock:
+        _hashes.update(newHashes)
+
+    if hashesFilePath and newHashes:
+        _saveHashes(hashesFilePath, newHashes)
+
+    return hashes
+
+#
+## @brief List app info modules and package info modules of the packages in given search paths.
+#
+#  Zip archives are listed as they are, since their app info modules can't be accessed without reading them.
+#
+#  @param paths [ list of str | None | in  ] - Search paths.
+#
+#  @exception N/A
+#
+#  @return list of str - Absolute paths of the files.
+def listPackageFiles(paths):
+
+    suffix              = '{}.py'.format(mMecoPackage.enumLib.PackagePythonFileSuffix.kApp)
+    visitedDirectories  = set()
+    filePaths           = []
+
+    for path in mApplication.discoveryLib.listSearchPaths(paths, includeArchives=True):
+
+        if mApplication.discoveryLib.isArchive(path):
+            filePaths.append(path)
+            continue
+
+        for directory in mApplication.discoveryLib.listPackageDirectories(path, visited=visitedDirectories):
+
+            try:
+                names = os.listdir(directory)
+            except OSError:
+                continue
+
+            filePaths.extend([os.path.join(directory, x) for x in sorted(names)
+                              if x.endswith(suffix) or x == PACKAGE_INFO_FILE_NAME])
+
+    return filePaths
+
+#
+## @brief Get fingerprint of the app info modules and package info modules in given search paths.
+#
+#  @param paths          [ list of str | None                | in  ] - Search paths.
+#  @param maxWorkers     [ int         | DEFAULT_MAX_WORKERS | in  ] - Maximum number of the threads hashing files.
+#  @param hashesFilePath [ str         | None                | in  ] - Absolute path of the hashes file, default is used
+#  if None is provided, @see getHashesFilePath.
+#
+#  @exception N/A
+#
+#  @return str - Fingerprint, which changes when one of the files is added, removed or its content is modified.
+def getFingerprint(paths, maxWorkers=DEFAULT_MAX_WORKERS, hashesFilePath=None):
+
+    filePaths = listPackageFiles(paths)
+    hashes    = hashFiles(filePaths, maxWorkers=maxWorkers, hashesFilePath=hashesFilePath)
+
+    _hash = _newHash()
+
+    for filePath in filePaths:
+        _hash.update('{}\0{}\0'.format(filePath, hashes[filePath]).encode('utf-8'))
+
+    return _hash.hexdigest()
+
+#
+## @brief Clear the hashes kept in memory, hashes files are read again next time.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def clear():
+
+    with _hashesLock:
+        _hashes.clear()
+        _hashesFileStamps.clear()
@@ -0,0 +1,362 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mApplication/discoveryLib.py @brief [ FILE   ] - Discovery of the directories application info modules are searched in.
+## @package mApplication.discoveryLib    @brief [ MODULE ] - Discovery of the directories application info modules are searched in.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import stat
+import hashlib
+import pkgutil
+import zipfile
+import threading
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ dict ] - Listings of zip archives, keys are absolute paths of the archives, values are tuples of
+#  (mtime, size, listing), listing is None for the files which are not zip archives.
+_archiveListings        = {}
+
+## [ threading.Lock ] - Lock for the listings of zip archives.
+_archiveListingsLock    = threading.Lock()
+
+#
+## @brief Get identity of given path.
+#
+#  Identity is made of device and inode numbers, therefore it is the same for all the paths (symbolic links,
+#  relative paths etc.) pointing to the same directory.
+#
+#  @param path [ str | None | in  ] - Path.
+#
+#  @exception N/A
+#
+#  @return tuple - Device and inode numbers, None is returned if given path is not a directory.
+def getDirectoryIdentity(path):
+
+    try:
+        _stat = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        return None
+
+    if not stat.S_ISDIR(_stat.st_mode):
+        return None
+
+    return (_stat.st_dev, _stat.st_ino)
+
+#
+## @brief List canonical search paths.
+#
+#  Relative paths are made absolute, symbolic links are resolved. Non-existent paths and paths which are not
+#  directories are skipped, zip archives are listed only if requested. Paths pointing to the same directory or archive
+#  are listed only once.
+#
+#  @param paths           [ list of str | None  | in  ] - Paths to be searched, sys.path is used if None is provided.
+#  @param visited         [ set         | None  | in  ] - Identities of the directories visited already, given set is
+#  updated.
+#  @param includeArchives [ bool        | False | in  ] - List zip archives as well, @see listArchive.
+#
+#  @exception N/A
+#
+#  @return list of str - Absolute paths of the directories and zip archives.
+def listSearchPaths(paths=None, visited=None, includeArchives=False):
+
+    if paths is None:
+        paths = sys.path
+
+    if visited is None:
+        visited = set()
+
+    searchPaths = []
+
+    for path in paths:
+
+        try:
+            path = os.path.realpath(os.path.abspath(path or os.curdir))
+        except (TypeError, ValueError, AttributeError):
+            continue
+
+        identity = getDirectoryIdentity(path)
+
+        if not identity and includeArchives:
+            identity = getArchiveIdentity(path)
+
+        if not identity or identity in visited:
+            continue
+
+        visited.add(identity)
+
+        searchPaths.append(path)
+
+    return searchPaths
+
+#
+## @brief Get identity of given zip archive.
+#
+#  @param path [ str | None | in  ] - Absolute path of the archive.
+#
+#  @exception N/A
+#
+#  @return tuple - Device and inode numbers, None is returned if given path is not a zip archive.
+def getArchiveIdentity(path):
+
+    try:
+        _stat = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        return None
+
+    if not stat.S_ISREG(_stat.st_mode) or listArchive(path) is None:
+        return None
+
+    return (_stat.st_dev, _stat.st_ino)
+
+#
+## @brief Whether given path is a zip archive.
+#
+#  @param path [ str | None | in  ] - Absolute path.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def isArchive(path):
+
+    return os.path.isfile(path) and listArchive(path) is not None
+
+#
+## @brief List the files in given zip archive.
+#
+#  Listings are read from the central directory of the archives once and cached until the archives are modified, so
+#  a single file open replaces stats of all files in them.
+#
+#  @param path [ str | None | in  ] - Absolute path of the archive.
+#
+#  @exception N/A
+#
+#  @return list of str - Paths of the files relative to the archive with / separator, None is returned if given path
+#  is not a zip archive.
+def listArchive(path):
+
+    try:
+        _stat = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        return None
+
+    listing = _archiveListings.get(path)
+    if listing and listing[0] == _stat.st_mtime and listing[1] == _stat.st_size:
+        return listing[2]
+
+    try:
+        with zipfile.ZipFile(path) as archive:
+            names = [x for x in archive.namelist() if not x.endswith('/')]
+    except (IOError, OSError, zipfile.BadZipfile, RuntimeError):
+        names = None
+
+    with _archiveListingsLock:
+        _archiveListings[path] = (_stat.st_mtime, _stat.st_size, names)
+
+    return names
+
+#
+## @brief List the files directly in the Python packages of given zip archive, which end with given suffix.
+#
+#  @param path   [ str | None | in  ] - Absolute path of the archive.
+#  @param suffix [ str | None | in  ] - Suffix of the files, e.g. ApplicationInfoLib.py.
+#
+#  @exception N/A
+#
+#  @return list of tuple - Tuples of (name of the Python package, name of the file) in the order of the packages.
+def listArchivePackageFiles(path, suffix):
+
+    files = []
+
+    for name in listArchive(path) or []:
+
+        parts = name.split('/')
+        if len(parts) != 2 or parts[0].startswith('.') or not parts[1].endswith(suffix):
+            continue
+
+        files.append((parts[0], parts[1]))
+
+    return sorted(files)
+
+#
+## @brief Split given path of a file in a zip archive on sys.path.
+#
+#  @param filePath [ str | None | in  ] - Absolute path of the file, e.g. /path/archive.zip/mFoo/mFooApplicationInfoLib.py.
+#
+#  @exception N/A
+#
+#  @return tuple - Absolute path of the archive and path of the file in it, None is returned if given file isn't in a
+#  zip archive.
+def splitArchivePath(filePath):
+
+    archivePath = os.path.dirname(os.path.dirname(filePath))
+
+    if not isArchive(archivePath):
+        return None
+
+    return (archivePath, os.path.relpath(filePath, archivePath).replace(os.sep, '/'))
+
+#
+## @brief Read given file in a zip archive on sys.path.
+#
+#  @param filePath [ str | None | in  ] - Absolute path of the file, @see splitArchivePath.
+#
+#  @exception N/A
+#
+#  @return bytes - Content, None is returned if the file can't be read.
+def readArchiveFile(filePath):
+
+    archivePath = splitArchivePath(filePath)
+    if not archivePath:
+        return None
+
+    try:
+        with zipfile.ZipFile(archivePath[0]) as archive:
+            return archive.read(archivePath[1])
+    except (IOError, OSError, KeyError, zipfile.BadZipfile, RuntimeError):
+        return None
+
+#
+## @brief List directories (Python packages) in given search path.
+#
+#  Absolute paths of the directories are built with given search path and names of the directories so the
+#  names can be used to import the Python packages. Directories visited already are skipped.
+#
+#  Given set must only contain identities of the package directories, not the ones of the search paths updated by
+#  listSearchPaths function, otherwise packages which are search paths as well (e.g. the current working directory)
+#  would be hidden.
+#
+#  @param path    [ str | None | in  ] - Absolute path of the search path.
+#  @param visited [ set | None | in  ] - Identities of the package directories visited already, given set is updated.
+#
+#  @exception N/A
+#
+#  @return list of str - Absolute paths of the directories.
+def listPackageDirectories(path, visited=None):
+
+    if visited is None:
+        visited = set()
+
+    try:
+        names = os.listdir(path)
+    except OSError:
+        return []
+
+    directories = []
+
+    for name in sorted(names):
+
+        if name.startswith('.'):
+            continue
+
+        directory = os.path.join(path, name)
+
+        identity = getDirectoryIdentity(directory)
+        if not identity or identity in visited:
+            continue
+
+        visited.add(identity)
+
+        directories.append(directory)
+
+    return directories
+
+#
+## @brief Get absolute path of the file given module is imported from by the import system.
+#
+#  Parent packages of the module are imported to find it, the module itself isn't imported. Packages with the same
+#  name in the later search paths are shadowed by the first one, so the file may be in another package directory than
+#  expected.
+#
+#  @param moduleName [ str | None | in  ] - Name of the module, e.g. mFoo.mFooApplicationInfoLib.
+#
+#  @exception N/A
+#
+#  @return str - Path, None is returned if the module can't be found.
+def getModuleFilePath(moduleName):
+
+    try:
+        import importlib.util
+        findSpec = importlib.util.find_spec
+    except (ImportError, AttributeError):
+        # Python 2
+        findSpec = None
+
+    try:
+        if findSpec:
+            spec     = findSpec(moduleName)
+            filePath = spec.origin if spec else None
+        else:
+            loader   = pkgutil.find_loader(moduleName)
+            filePath = loader.get_filename(moduleName) if loader else None
+    except (ImportError, ValueError):
+        # Modules loaded from files under other names have no spec
+        return None
+
+    if not filePath or not os.path.isabs(filePath):
+        return None
+
+    return filePath
+
+#
+## @brief Whether given paths are the same module file, compiled files are considered the same as their sources.
+#
+#  @param filePath      [ str | None | in  ] - Absolute path of the first file.
+#  @param otherFilePath [ str | None | in  ] - Absolute path of the second file.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def isSameModuleFile(filePath, otherFilePath):
+
+    if not filePath or not otherFilePath:
+        return False
+
+    return (os.path.splitext(os.path.realpath(filePath))[0] ==
+            os.path.splitext(os.path.realpath(otherFilePath))[0])
+
+#
+## @brief Get unique name of given module in a shadowed package, @see getModuleFilePath.
+#
+#  Name is built with the name of the module and the real path of its file, so it is the same in all processes and
+#  the name of the package stays the first part of it.
+#
+#  @param moduleName [ str | None | in  ] - Name of the module, unique names are provided as they are.
+#  @param filePath   [ str | None | in  ] - Absolute path of the file of the module.
+#
+#  @exception N/A
+#
+#  @return str - Name, e.g. mFoo.mFooApplicationInfoLib_1a2b3c4d.
+def getShadowedModuleName(moduleName, filePath):
+
+    suffix = '_{}'.format(hashlib.sha1(os.path.realpath(filePath).encode('utf-8')).hexdigest()[:8])
+
+    if moduleName.endswith(suffix):
+        return moduleName
+
+    return '{}{}'.format(moduleName, suffix)
@@ -0,0 +1,507 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mApplication/environmentScanLib.py @brief [ FILE   ] - Scanning applications of other environments.
+## @package mApplication.environmentScanLib    @brief [ MODULE ] - Scanning applications of other environments.
+#
+#  Catalogs of environments given as lists of search paths are built without importing anything into the current
+#  interpreter. App info modules are imported in worker interpreters, which are started with the search paths of the
+#  environment.
+#
+#  Metadata of the applications is cached per package directory with the modification times and sizes of its app
+#  info modules, therefore packages shared by multiple environments are scanned only once. Cache entries are kept in
+#  memory and in the shared cache directory if it is set, @see mApplication.sharedCacheLib.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import json
+import hashlib
+import tempfile
+import threading
+import subprocess
+
+import mApplication.catalogLib
+import mApplication.contentHashLib
+import mApplication.discoveryLib
+import mApplication.sharedCacheLib
+
+import mMecoPackage.enumLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ int ] - Default number of environments scanned concurrently.
+DEFAULT_MAX_WORKERS = 4
+
+#
+## @brief [ CLASS ] - Class scans applications of environments given as lists of search paths.
+class EnvironmentScanner(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED STATIC MEMBERS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## [ dict ] - Metadata of the applications cached per package directory, shared by all scanners. Keys are cache
+    #  keys, @see EnvironmentScanner.getPackageKey, values are lists of dict instances.
+    _packageRecords     = {}
+
+    ## [ threading.Lock ] - Lock for the package records.
+    _packageRecordsLock = threading.Lock()
+
+    ## [ dict ] - Python versions of the executables, keys are the executables, values are versions, e.g. 3.7.
+    _pythonVersions     = {}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param executable     [ str | None                | in  ] - Python executable of the worker interpreters,
+    #  sys.executable is used if None is provided.
+    #  @param cacheDirectory [ str | None                | in  ] - Directory package cache entries are written in,
+    #  shared cache directory is used if None is provided, @see mApplication.sharedCacheLib.SharedCatalogCache.
+    #  @param maxWorkers     [ int | DEFAULT_MAX_WORKERS | in  ] - Number of environments scanned concurrently.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, executable=None, cacheDirectory=None, maxWorkers=DEFAULT_MAX_WORKERS):
+
+        if cacheDirectory is None:
+            cacheDirectory = mApplication.sharedCacheLib.SharedCatalogCache().directory()
+
+        ## [ str ] - Python executable of the worker interpreters.
+        self._executable     = executable if executable else sys.executable
+
+        ## [ str ] - Directory package cache entries are written in.
+        self._cacheDirectory = cacheDirectory
+
+        ## [ int ] - Number of environments scanned concurrently.
+        self._maxWorkers     = maxWorkers
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get cached metadata of the applications for given cache key.
+    #
+    #  @param key [ str | None | in  ] - Cache key.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Metadata, None is returned if there is no cache entry.
+    def _getCachedRecords(self, key):
+
+        with EnvironmentScanner._packageRecordsLock:
+            records = EnvironmentScanner._packageRecords.get(key)
+
+        if records is not None or not self._cacheDirectory:
+            return records
+
+        try:
+            with open(self._getCacheFilePath(key), 'r') as _file:
+                records = json.load(_file)
+        except (IOError, OSError, ValueError):
+            return None
+
+        with EnvironmentScanner._packageRecordsLock:
+            EnvironmentScanner._packageRecords[key] = records
+
+        return records
+
+    #
+    ## @brief Cache given metadata of the applications with given cache key.
+    #
+    #  @param key     [ str          | None | in  ] - Cache key.
+    #  @param records [ list of dict | None | in  ] - Metadata.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _setCachedRecords(self, key, records):
+
+        with EnvironmentScanner._packageRecordsLock:
+            EnvironmentScanner._packageRecords[key] = records
+
+        if not self._cacheDirectory:
+            return
+
+        try:
+            mApplication.catalogLib.writeFileAtomically(self._getCacheFilePath(key), json.dumps(records))
+        except (IOError, OSError):
+            pass
+
+    #
+    ## @brief Get absolute path of the cache file for given cache key.
+    #
+    #  @param key [ str | None | in  ] - Cache key.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Path.
+    def _getCacheFilePath(self, key):
+
+        return os.path.join(self._cacheDirectory, 'package-{}.json'.format(key))
+
+    #
+    ## @brief Scan given package directories in a worker interpreter started with given search paths.
+    #
+    #  @param paths       [ list of str | None | in  ] - Search paths of the environment.
+    #  @param directories [ list of str | None | in  ] - Absolute paths of the package directories.
+    #
+    #  @exception RuntimeError - If the worker interpreter fails.
+    #
+    #  @return dict - Keys are the package directories, values are lists of dict instances (metadata).
+    def _runWorker(self, paths, directories):
+
+        # mApplication of the current interpreter comes first, since older releases in the environment don't provide
+        # the worker
+        pythonPath = [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))] + list(paths)
+
+        environment = dict(os.environ)
+        environment['PYTHONPATH'] = os.pathsep.join(pythonPath)
+
+        fileDescriptor, outputFilePath = tempfile.mkstemp(prefix='mApplicationScan.', suffix='.json')
+        os.close(fileDescriptor)
+
+        try:
+            process = subprocess.Popen([self._executable,
+                                        '-c',
+                                        'import mApplication.environmentScanLib;mApplication.environmentScanLib.runWorker()',
+                                        outputFilePath],
+                                       stdin=subprocess.PIPE,
+                                       stdout=subprocess.PIPE,
+                                       stderr=subprocess.PIPE,
+                                       env=environment)
+
+            stdout, stderr = process.communicate(json.dumps(directories).encode('utf-8'))
+
+            if process.returncode != 0:
+                raise RuntimeError('Scanning environment failed:\n{}'.format(stderr.decode('utf-8', 'replace')))
+
+            with open(outputFilePath, 'r') as _file:
+                return json.load(_file)
+
+        finally:
+            os.remove(outputFilePath)
+
+    #
+    ## @brief Get Python version of the worker interpreters.
+    #
+    #  @exception RuntimeError - If the executable can't be run.
+    #
+    #  @return str - Version, e.g. 3.7.
+    def _getPythonVersion(self):
+
+        pythonVersion = EnvironmentScanner._pythonVersions.get(self._executable)
+        if pythonVersion:
+            return pythonVersion
+
+        if self._executable == sys.executable:
+            pythonVersion = '{}.{}'.format(sys.version_info[0], sys.version_info[1])
+        else:
+            try:
+                output = subprocess.check_output([self._executable,
+                                                  '-c',
+                                                  'import sys;sys.stdout.write("%d.%d" % sys.version_info[:2])'])
+            except (OSError, subprocess.CalledProcessError) as error:
+                raise RuntimeError('Python executable can not be run: {}\n{}'.format(self._executable, error))
+
+            pythonVersion = output.decode('utf-8').strip()
+
+        EnvironmentScanner._pythonVersions[self._executable] = pythonVersion
+
+        return pythonVersion
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Scan applications of the environment given as a list of search paths.
+    #
+    #  Search paths are scanned in the current interpreter to find the package directories, which is done without
+    #  importing anything. Only the package directories without cache entries are scanned by a worker interpreter.
+    #
+    #  @param paths        [ list of str | None | in  ] - Search paths of the environment.
+    #  @param packageNames [ list of str | None | in  ] - Names of the packages to be scanned, all packages are
+    #  scanned if None is provided.
+    #
+    #  @exception RuntimeError - If the worker interpreter fails.
+    #
+    #  @return mApplication.catalogLib.Catalog - Catalog of the environment.
+    def scan(self, paths, packageNames=None):
+
+        pythonVersion = self._getPythonVersion()
+
+        keys    = []
+        missing = {}
+
+        for directory in EnvironmentScanner.listAppPackageDirectories(paths, packageNames=packageNames):
+
+            key = EnvironmentScanner.getPackageKey(directory, pythonVersion=pythonVersion)
+            if not key:
+                continue
+
+            keys.append(key)
+
+            if self._getCachedRecords(key) is None:
+                missing[directory] = key
+
+        if missing:
+
+            scannedRecords = self._runWorker(paths, sorted(missing))
+
+            for directory, key in missing.items():
+                self._setCachedRecords(key, scannedRecords.get(directory, []))
+
+        records = []
+        for key in keys:
+            records.extend(self._getCachedRecords(key) or [])
+
+        if packageNames:
+            _packageNames = [x.lower() for x in packageNames]
+            records = [x for x in records if x['package'].lower() in _packageNames]
+
+        records.sort(key=lambda x: (x['name'], x['module'], x['className']))
+
+        environment = mApplication.catalogLib.Catalog.getEnvironment(paths=paths, packageNames=packageNames)
+        environment['pythonVersion'] = pythonVersion
+        environment['packageHashes'] = mApplication.catalogLib.Catalog.hashPackages(records)
+
+        return mApplication.catalogLib.Catalog(records=records, environment=environment)
+
+    #
+    ## @brief Scan applications of multiple environments concurrently.
+    #
+    #  @param pathsList    [ list of list | None | in  ] - Search paths of the environments.
+    #  @param packageNames [ list of str  | None | in  ] - Names of the packages to be scanned, all packages are
+    #  scanned if None is provided.
+    #
+    #  @exception RuntimeError - If a worker interpreter fails.
+    #
+    #  @return list of mApplication.catalogLib.Catalog - Catalogs of the environments in the given order.
+    def scanMany(self, pathsList, packageNames=None):
+
+        catalogs = [None] * len(pathsList)
+        errors   = []
+        indices  = list(range(len(pathsList)))
+        lock     = threading.Lock()
+
+        def scanNext():
+            while True:
+                with lock:
+                    if not indices or errors:
+                        return
+                    index = indices.pop(0)
+                try:
+                    catalogs[index] = self.scan(pathsList[index], packageNames=packageNames)
+                except Exception as error:
+                    with lock:
+                        errors.append(error)
+
+        threads = [threading.Thread(target=scanNext) for x in range(min(self._maxWorkers, len(pathsList)))]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            raise errors[0]
+
+        return catalogs
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief List package directories, which contain app info modules, in given search paths.
+    #
+    #  Package directories are filtered by their names, which are the names of the packages in Meco environments.
+    #
+    #  @param paths        [ list of str | None | in  ] - Search paths.
+    #  @param packageNames [ list of str | None | in  ] - Names of the packages, all packages are listed if None is
+    #  provided.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Absolute paths of the package directories.
+    @staticmethod
+    def listAppPackageDirectories(paths, packageNames=None):
+
+        if packageNames:
+            packageNames = [x.lower() for x in packageNames]
+
+        visitedDirectories  = set()
+        directories         = []
+
+        for path in mApplication.discoveryLib.listSearchPaths(paths):
+
+            for directory in mApplication.discoveryLib.listPackageDirectories(path, visited=visitedDirectories):
+
+                if packageNames and os.path.basename(directory).lower() not in packageNames:
+                    continue
+
+                if EnvironmentScanner.listAppInfoFiles(directory):
+                    directories.append(directory)
+
+        return directories
+
+    #
+    ## @brief List app info module files in given package directory.
+    #
+    #  @param directory [ str | None | in  ] - Absolute path of the package directory.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Absolute paths of the files.
+    @staticmethod
+    def listAppInfoFiles(directory):
+
+        suffix = '{}.py'.format(mMecoPackage.enumLib.PackagePythonFileSuffix.kApp)
+
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            return []
+
+        return [os.path.join(directory, x) for x in sorted(names) if x.endswith(suffix)]
+
+    #
+    ## @brief Compute content hashes of the packages in given search paths without importing their app info modules.
+    #
+    #  Hashes are computed the same way as the ones of the scanned catalogs, so unchanged packages can be detected
+    #  before scanning, @see mApplication.catalogLib.Catalog.hashPackages.
+    #
+    #  @param paths        [ list of str | None | in  ] - Search paths.
+    #  @param packageNames [ list of str | None | in  ] - Names of the packages, all packages are hashed if None is
+    #  provided.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are names of the packages, values are hashes.
+    @staticmethod
+    def hashPackages(paths, packageNames=None):
+
+        filePaths = {}
+        for directory in EnvironmentScanner.listAppPackageDirectories(paths, packageNames=packageNames):
+            filePaths.setdefault(os.path.basename(directory), []).extend(EnvironmentScanner.listAppInfoFiles(directory))
+
+        return mApplication.catalogLib.Catalog.hashPackageFiles(filePaths)
+
+    #
+    ## @brief Get cache key of given package directory.
+    #
+    #  Key is built with the real path of the directory and the names, modification times and sizes of its app info
+    #  modules, so it changes when an app info module is modified.
+    #
+    #  Content hashes of the app info modules and the package info module are added if content hash validation is
+    #  enabled, @see mApplication.contentHashLib.
+    #
+    #  @param directory     [ str | None | in  ] - Absolute path of the package directory.
+    #  @param pythonVersion [ str | None | in  ] - Python version of the interpreter the package is scanned with,
+    #  e.g. 3.7, version of the current interpreter is used if None is provided.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Key, None is returned if the app info modules can't be accessed.
+    @staticmethod
+    def getPackageKey(directory, pythonVersion=None):
+
+        if not pythonVersion:
+            pythonVersion = '{}.{}'.format(sys.version_info[0], sys.version_info[1])
+
+        directory = os.path.realpath(directory)
+        entries   = []
+
+        filePaths = EnvironmentScanner.listAppInfoFiles(directory)
+
+        for filePath in filePaths:
+
+            try:
+                _stat = os.stat(filePath)
+            except OSError:
+                return None
+
+            entries.append([os.path.basename(filePath), _stat.st_mtime, _stat.st_size])
+
+        if mApplication.contentHashLib.isEnabled():
+
+            filePaths = filePaths + [os.path.join(directory, mApplication.contentHashLib.PACKAGE_INFO_FILE_NAME)]
+            hashes    = mApplication.contentHashLib.hashFiles(filePaths)
+
+            entries.append([[os.path.basename(x), hashes[x]] for x in filePaths])
+
+        data = json.dumps([pythonVersion, directory, entries])
+
+        return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+#
+## @brief Scan package directories in a worker interpreter.
+#
+#  Function is called in the worker interpreters started by EnvironmentScanner class. Absolute paths of the package
+#  directories are read from stdin as JSON, and metadata of the applications is written into the file given as the
+#  first argument as a JSON dict, keys of which are the package directories.
+#
+#  App info modules are loaded from the files in the package directories even if a package with the same name is
+#  earlier on the search paths, @see mApplication.applicationInfoAbs.ApplicationInfo._importModule, since metadata is
+#  cached per package directory and shared by the environments.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def runWorker():
+
+    import mApplication.applicationInfoAbs
+
+    directories = json.loads(sys.stdin.read())
+
+    # Output of the app info modules must not be mixed with the result
+    sys.stdout = sys.stderr
+
+    records = {}
+
+    for directory in directories:
+
+        realDirectory      = os.path.realpath(directory)
+        records[directory] = []
+
+        for _appInfo in mApplication.applicationInfoAbs.ApplicationInfo.iterateDirectory(directory):
+
+            record = _appInfo.asDict()
+
+            # Metadata of the classes defined in other packages must not be cached for this one
+            if os.path.dirname(os.path.realpath(record['filePath'])) == realDirectory:
+                records[directory].append(record)
+
+    with open(sys.argv[1], 'w') as _file:
+        json.dump(records, _file)
@@ -0,0 +1,292 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mApplication/fuzzySearchLib.py @brief [ FILE   ] - Typo tolerant search of applications.
+## @package mApplication.fuzzySearchLib    @brief [ MODULE ] - Typo tolerant search of applications.
+#
+#  Names and keywords of the applications are indexed by their trigrams. Similarity of two terms is the number of
+#  their shared trigrams divided by the number of their distinct trigrams, therefore "lightmixr" and "lightmixer" are
+#  similar. Only the terms sharing enough trigrams with the searched text are scored.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import re
+import math
+import heapq
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ float ] - Minimum similarity of the applications found.
+DEFAULT_THRESHOLD   = 0.3
+
+## [ int ] - Maximum number of the applications found.
+DEFAULT_TOP         = 10
+
+## [ re.Pattern ] - Words of names, e.g. "Light", "Mixer" and "2" for "LightMixer2".
+WORD_PATTERN        = re.compile('[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+')
+
+#
+## @brief Get trigrams of given text.
+#
+#  Text is lowercased and each word of it is padded with two spaces in front and one space at the end, so short
+#  words have trigrams too and the beginnings of the words weigh more.
+#
+#  @param text [ str | None | in  ] - Text.
+#
+#  @exception N/A
+#
+#  @return set of str - Trigrams.
+def getTrigrams(text):
+
+    trigrams = set()
+
+    for word in re.split('[^0-9a-z]+', text.lower()):
+
+        if not word:
+            continue
+
+        word = '  {} '.format(word)
+        trigrams.update([word[x:x + 3] for x in range(len(word) - 2)])
+
+    return trigrams
+
+#
+## @brief Get similarity of given texts.
+#
+#  @param text  [ str | None | in  ] - Text.
+#  @param other [ str | None | in  ] - Other text.
+#
+#  @exception N/A
+#
+#  @return float - Similarity between 0.0 and 1.0.
+def getSimilarity(text, other):
+
+    trigrams      = getTrigrams(text)
+    otherTrigrams = getTrigrams(other)
+
+    if not trigrams or not otherTrigrams:
+        return 0.0
+
+    shared = len(trigrams & otherTrigrams)
+
+    return float(shared) / (len(trigrams) + len(otherTrigrams) - shared)
+
+#
+## @brief Get terms of given metadata of an application, which are indexed.
+#
+#  Terms are the name, the words of the name and the keywords of the application.
+#
+#  @param record [ dict | None | in  ] - Metadata of an application, @see ApplicationInfo.asDict.
+#
+#  @exception N/A
+#
+#  @return set of str - Lowercase terms.
+def getTerms(record):
+
+    terms = set([record['name'].lower()])
+    terms.update([x.lower() for x in WORD_PATTERN.findall(record['name']) if len(x) > 2])
+    terms.update([x.lower() for x in record['keywords'] if x])
+
+    return terms
+
+#
+## @brief [ CLASS ] - Class indexes names and keywords of applications by their trigrams.
+class TrigramIndex(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param records [ list of dict | None | in  ] - Metadata of applications, @see ApplicationInfo.asDict.
+    #  @param data    [ dict         | None | in  ] - Index written before for the same applications, @see asDict.
+    #  Applications are indexed if None is provided.
+    #
+    #  @exception ValueError - If given index doesn't match given applications.
+    #
+    #  @return None - None.
+    def __init__(self, records, data=None):
+
+        ## [ list of dict ] - Metadata of applications.
+        self._records       = list(records)
+
+        ## [ list of str ] - Terms.
+        self._terms         = []
+
+        ## [ list of int ] - Number of trigrams of the terms.
+        self._termSizes     = []
+
+        ## [ list of list of int ] - Indices of the applications of the terms.
+        self._termRecords   = []
+
+        ## [ dict ] - Keys are trigrams, values are lists of indices of the terms.
+        self._postings      = {}
+
+        if data is not None:
+            self._read(data)
+            return
+
+        termIndices = {}
+
+        for recordIndex, record in enumerate(self._records):
+
+            for term in getTerms(record):
+
+                termIndex = termIndices.get(term)
+
+                if termIndex is None:
+
+                    termIndex = len(self._terms)
+                    termIndices[term] = termIndex
+
+                    trigrams = getTrigrams(term)
+
+                    self._terms.append(term)
+                    self._termSizes.append(len(trigrams))
+                    self._termRecords.append([])
+
+                    for trigram in trigrams:
+                        self._postings.setdefault(trigram, []).append(termIndex)
+
+                self._termRecords[termIndex].append(recordIndex)
+
+    #
+    ## @brief Number of applications.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Count.
+    def __len__(self):
+
+        return len(self._records)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Read given index written before.
+    #
+    #  Applications are matched by their packages, modules and class names, so the order of the applications may be
+    #  different.
+    #
+    #  @param data [ dict | None | in  ] - Index, @see asDict.
+    #
+    #  @exception ValueError - If given index doesn't match the applications.
+    #
+    #  @return None - None.
+    def _read(self, data):
+
+        try:
+            keys = data['keys']
+
+            if len(keys) != len(self._records):
+                raise ValueError('Trigram index does not match the applications')
+
+            recordIndices = dict([((x['package'], x['module'], x['className']), index)
+                                  for index, x in enumerate(self._records)])
+            recordIndices = [recordIndices[tuple(x)] for x in keys]
+
+            self._terms       = list(data['terms'])
+            self._termSizes   = list(data['termSizes'])
+            self._termRecords = [[recordIndices[x] for x in y] for y in data['termRecords']]
+            self._postings    = dict(data['postings'])
+
+        except (KeyError, TypeError, IndexError):
+            raise ValueError('Trigram index does not match the applications')
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get dict representation, which can be written with the catalog and read instead of indexing again.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are: keys, which are packages, modules and class names of the applications, terms,
+    #  termSizes, termRecords and postings.
+    def asDict(self):
+
+        return {'keys'        : [[x['package'], x['module'], x['className']] for x in self._records],
+                'terms'       : self._terms,
+                'termSizes'   : self._termSizes,
+                'termRecords' : self._termRecords,
+                'postings'    : self._postings}
+
+    #
+    ## @brief Search given text.
+    #
+    #  Score of an application is the highest similarity of its terms to given text.
+    #
+    #  @param text         [ str      | None              | in  ] - Text to be searched.
+    #  @param threshold    [ float    | DEFAULT_THRESHOLD | in  ] - Minimum similarity between 0.0 and 1.0.
+    #  @param top          [ int      | DEFAULT_TOP       | in  ] - Maximum number of applications, None means no limit.
+    #  @param filterRecord [ callable | None              | in  ] - Function, which gets metadata of an application and
+    #  returns whether it can be found, e.g. to filter parent applications.
+    #
+    #  @exception N/A
+    #
+    #  @return list of tuple - Scores and metadata of applications, highest score first, applications with the same
+    #  score are sorted by their names.
+    def search(self, text, threshold=DEFAULT_THRESHOLD, top=DEFAULT_TOP, filterRecord=None):
+
+        trigrams = getTrigrams(text)
+        if not trigrams:
+            return []
+
+        sharedCounts = {}
+        for trigram in trigrams:
+            for termIndex in self._postings.get(trigram, ()):
+                sharedCounts[termIndex] = sharedCounts.get(termIndex, 0) + 1
+
+        # Similarity can't be more than shared / len(trigrams), terms sharing fewer trigrams are skipped
+        minimumShared = max(1, int(math.ceil(threshold * len(trigrams) - 1e-9)))
+
+        scores = {}
+
+        for termIndex, shared in sharedCounts.items():
+
+            if shared < minimumShared:
+                continue
+
+            score = float(shared) / (len(trigrams) + self._termSizes[termIndex] - shared)
+            if score < threshold:
+                continue
+
+            for recordIndex in self._termRecords[termIndex]:
+                if score > scores.get(recordIndex, 0.0):
+                    scores[recordIndex] = score
+
+        results = [(score, self._records[x]) for x, score in scores.items()
+                   if not filterRecord or filterRecord(self._records[x])]
+
+        sortKey = lambda x: (-x[0], x[1]['name'], x[1]['module'], x[1]['className'])
+
+        if top is None:
+            return sorted(results, key=sortKey)
+
+        return heapq.nsmallest(max(top, 0), results, key=sortKey)
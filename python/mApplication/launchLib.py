@@ -0,0 +1,274 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mApplication/launchLib.py @brief [ FILE   ] - Launching applications.
+## @package mApplication.launchLib    @brief [ MODULE ] - Launching applications.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import ast
+import json
+import threading
+import importlib
+
+import mApplication.catalogLib
+import mApplication.launcherServiceLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ str ] - Name of the environment variable, which provides absolute path of the launch counts file.
+LAUNCH_COUNTS_FILE_ENV_VARIABLE = 'MAPPLICATION_LAUNCH_COUNTS_FILE'
+
+## [ int ] - Default number of the most frequently launched applications, modules of which are imported in advance.
+DEFAULT_WARM_IMPORT_COUNT       = 5
+
+## [ dict ] - Compiled Python commands, keys are commands, values are code objects.
+_compiledCommands               = {}
+
+## [ threading.Lock ] - Lock for the launch counts file.
+_launchCountsLock               = threading.Lock()
+
+#
+## @brief Get absolute path of the file launch counts are recorded in.
+#
+#  @exception N/A
+#
+#  @return str - Path.
+def getLaunchCountsFilePath():
+
+    filePath = os.environ.get(LAUNCH_COUNTS_FILE_ENV_VARIABLE)
+    if filePath:
+        return filePath
+
+    return os.path.join(os.path.expanduser('~'), '.mApplication', 'launchCounts.json')
+
+#
+## @brief Get launch counts of the applications.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are names of the applications, values are dict instances with keys: count, pythonCommand.
+def getLaunchCounts():
+
+    try:
+        with open(getLaunchCountsFilePath(), 'r') as _file:
+            launchCounts = json.load(_file)
+    except (IOError, OSError, ValueError):
+        return {}
+
+    if not isinstance(launchCounts, dict):
+        return {}
+
+    return launchCounts
+
+#
+## @brief Record a launch of given application.
+#
+#  @param appInfo [ mApplication.applicationInfoAbs.ApplicationInfo | None | in  ] - Application info class instance.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def recordLaunch(appInfo):
+
+    with _launchCountsLock:
+
+        launchCounts = getLaunchCounts()
+
+        launchCount = launchCounts.setdefault(appInfo.name(), {'count': 0})
+        launchCount['count']         = launchCount.get('count', 0) + 1
+        launchCount['pythonCommand'] = appInfo.pythonCommand()
+
+        try:
+            mApplication.catalogLib.writeFileAtomically(getLaunchCountsFilePath(), json.dumps(launchCounts, sort_keys=True))
+        except (IOError, OSError):
+            pass
+
+#
+## @brief Get compiled code object of given Python command.
+#
+#  Code objects are cached per command so commands are compiled only once.
+#
+#  @param command [ str | None | in  ] - Python command.
+#
+#  @exception N/A
+#
+#  @return code - Code object.
+def compileCommand(command):
+
+    code = _compiledCommands.get(command)
+    if code is None:
+        code = compile(command, '<mApplication pythonCommand>', 'exec')
+        _compiledCommands[command] = code
+
+    return code
+
+#
+## @brief Get names of the modules imported by given Python command.
+#
+#  @param command [ str | None | in  ] - Python command.
+#
+#  @exception N/A
+#
+#  @return list of str - Names of the modules.
+def getImportedModuleNames(command):
+
+    try:
+        tree = ast.parse(command)
+    except SyntaxError:
+        return []
+
+    moduleNames = []
+
+    for node in ast.walk(tree):
+
+        if isinstance(node, ast.Import):
+            moduleNames.extend([x.name for x in node.names])
+
+        elif isinstance(node, ast.ImportFrom):
+            if node.module and not node.level:
+                moduleNames.append(node.module)
+
+    return moduleNames
+
+#
+## @brief Run Python command of given application.
+#
+#  @param appInfo   [ mApplication.applicationInfoAbs.ApplicationInfo | None | in  ] - Application info class instance.
+#  @param namespace [ dict                                            | None | in  ] - Namespace the command is
+#  executed in, namespace of __main__ module is used if None is provided as parent applications do.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def runPythonCommand(appInfo, namespace=None):
+
+    if namespace is None:
+        namespace = sys.modules['__main__'].__dict__
+
+    exec(compileCommand(appInfo.pythonCommand()), namespace)
+
+#
+## @brief Launch given application.
+#
+#  Python command of the application is run if it has one, otherwise its terminal command is run in a new process or
+#  by the launcher service if it is started, @see mApplication.launcherServiceLib.startService.
+#  Launch is recorded so modules of the most frequently launched applications can be imported in advance,
+#  @see warmImports.
+#
+#  @param appInfo   [ mApplication.applicationInfoAbs.ApplicationInfo | None | in  ] - Application info class instance.
+#  @param namespace [ dict                                            | None | in  ] - Namespace the Python command is
+#  executed in, namespace of __main__ module is used if None is provided.
+#
+#  @exception N/A
+#
+#  @return subprocess.Popen - Process of the terminal command, None is returned if a Python command is run.
+def launch(appInfo, namespace=None):
+
+    process = None
+
+    if appInfo.pythonCommand():
+        runPythonCommand(appInfo, namespace=namespace)
+    elif appInfo.command():
+        process = mApplication.launcherServiceLib.launchCommand(appInfo.command())
+    else:
+        return None
+
+    recordLaunch(appInfo)
+
+    return process
+
+#
+## @brief Import modules of the most frequently launched applications in advance.
+#
+#  Modules are imported one at a time when the event loop of the parent application is idle if a Qt application is
+#  running, otherwise in a background thread. Python commands of the applications are compiled as well.
+#
+#  @param count [ int | DEFAULT_WARM_IMPORT_COUNT | in  ] - Number of the most frequently launched applications.
+#
+#  @exception N/A
+#
+#  @return list of str - Names of the modules to be imported.
+def warmImports(count=DEFAULT_WARM_IMPORT_COUNT):
+
+    launchCounts = getLaunchCounts()
+
+    names = sorted(launchCounts, key=lambda x: launchCounts[x].get('count', 0), reverse=True)[:count]
+
+    commands    = []
+    moduleNames = []
+
+    for name in names:
+
+        command = launchCounts[name].get('pythonCommand')
+        if not command:
+            continue
+
+        commands.append(command)
+
+        for moduleName in getImportedModuleNames(command):
+            if moduleName not in moduleNames and moduleName not in sys.modules:
+                moduleNames.append(moduleName)
+
+    steps = [(compileCommand, x) for x in commands] + [(importlib.import_module, x) for x in moduleNames]
+
+    if not steps:
+        return moduleNames
+
+    def runStep(step):
+        try:
+            step[0](step[1])
+        except Exception:
+            pass
+
+    application = None
+    try:
+        from mQt import QtCore
+        application = QtCore.QCoreApplication.instance()
+    except ImportError:
+        pass
+
+    if application:
+
+        def runNextStep():
+            runStep(steps.pop(0))
+            if steps:
+                QtCore.QTimer.singleShot(0, runNextStep)
+
+        QtCore.QTimer.singleShot(0, runNextStep)
+
+    else:
+
+        def runSteps():
+            for step in steps:
+                runStep(step)
+
+        thread = threading.Thread(target=runSteps, name='mApplicationWarmImports')
+        thread.daemon = True
+        thread.start()
+
+    return moduleNames
@@ -0,0 +1,453 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mApplication/launcherServiceLib.py @brief [ FILE   ] - Launcher service with pre-started interpreters.
+## @package mApplication.launcherServiceLib    @brief [ MODULE ] - Launcher service with pre-started interpreters.
+#
+#  Launcher service keeps a small pool of Python interpreter processes, which have already imported the Meco
+#  environment. Terminal commands, which run Python code (i.e. "python -c CODE", "python script.py" or Meco commands
+#  in bin directories of the packages), are dispatched to them, therefore launched applications don't pay the start
+#  up cost of the interpreter and the environment. Other commands are run in new processes as usual.
+#
+#  Pooling is available on POSIX platforms, commands are always run in new processes on Windows.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import re
+import sys
+import json
+import shlex
+import threading
+import importlib
+import subprocess
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ list of str ] - Modules imported by the interpreters in the pool by default.
+DEFAULT_PRELOAD_MODULES     = ['mCore.displayLib',
+                               'mFileSystem.directoryLib',
+                               'mMecoPackage.packageLib',
+                               'mMecoSettings.envVariablesLib',
+                               'mApplication.applicationInfoAbs']
+
+## [ int ] - Default number of interpreters in the pool.
+DEFAULT_POOL_SIZE           = 2
+
+## [ int ] - Maximum size of the files checked whether they are Meco commands.
+MAX_COMMAND_FILE_SIZE       = 4096
+
+## [ re.Pattern ] - Pattern of the Meco commands in bin directories of the packages, which run Python code.
+MECO_COMMAND_PATTERN        = re.compile(r'^\s*&?\s*\$\{?(?:env:)?MECO_PYTHON_EXECUTABLE_PATH\}?\s+-c\s+"(.*)"\s+\$(?:@|args)\s*$',
+                                         re.MULTILINE)
+
+## [ mApplication.launcherServiceLib.LauncherService ] - Service started by startService function.
+_service                    = None
+
+## [ threading.Lock ] - Lock for the service.
+_serviceLock                = threading.Lock()
+
+#
+## @brief [ CLASS ] - Launcher service, which dispatches commands to pre-started interpreters.
+class LauncherService(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param poolSize       [ int         | DEFAULT_POOL_SIZE       | in  ] - Number of interpreters in the pool.
+    #  @param preloadModules [ list of str | DEFAULT_PRELOAD_MODULES | in  ] - Modules imported by the interpreters.
+    #  @param executable     [ str         | None                    | in  ] - Python executable, value of
+    #  MECO_PYTHON_EXECUTABLE_PATH environment variable or sys.executable is used if None is provided.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, poolSize=DEFAULT_POOL_SIZE, preloadModules=None, executable=None):
+
+        if preloadModules is None:
+            preloadModules = DEFAULT_PRELOAD_MODULES
+
+        if not executable:
+            executable = os.environ.get('MECO_PYTHON_EXECUTABLE_PATH') or sys.executable
+
+        ## [ int ] - Number of interpreters in the pool.
+        self._poolSize       = poolSize
+
+        ## [ list of str ] - Modules imported by the interpreters.
+        self._preloadModules = list(preloadModules)
+
+        ## [ str ] - Python executable.
+        self._executable     = executable
+
+        ## [ list of tuple ] - Interpreters waiting for a command, tuples of (subprocess.Popen, control file).
+        self._pool           = []
+
+        ## [ threading.Lock ] - Lock for the pool.
+        self._lock           = threading.Lock()
+
+        ## [ bool ] - Whether the service is started.
+        self._isStarted      = False
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Start an interpreter and add it to the pool.
+    #
+    #  Commands are sent to the interpreter through a pipe other than its standard streams, so the launched
+    #  application inherits the standard streams of the service.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _addWorker(self):
+
+        readFileDescriptor, writeFileDescriptor = os.pipe()
+
+        try:
+            process = subprocess.Popen([self._executable,
+                                        '-c',
+                                        'import mApplication.launcherServiceLib;mApplication.launcherServiceLib.runWorker()',
+                                        str(readFileDescriptor),
+                                        ','.join(self._preloadModules)],
+                                       pass_fds=(readFileDescriptor,),
+                                       close_fds=True)
+        except (OSError, ValueError):
+            os.close(readFileDescriptor)
+            os.close(writeFileDescriptor)
+            raise
+
+        os.close(readFileDescriptor)
+
+        self._pool.append((process, os.fdopen(writeFileDescriptor, 'w')))
+
+    #
+    ## @brief Get Python code and arguments of given command if it runs Python code with the executable of the pool.
+    #
+    #  @param command [ str | None | in  ] - Terminal command.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are: code, file, argv. None is returned if the command can't be dispatched.
+    def _parseCommand(self, command):
+
+        try:
+            tokens = shlex.split(os.path.expandvars(command))
+        except ValueError:
+            return None
+
+        if not tokens:
+            return None
+
+        if LauncherService._isSameFile(tokens[0], self._executable):
+
+            if len(tokens) > 2 and tokens[1] == '-c':
+                return {'code': tokens[2], 'file': None, 'argv': ['-c'] + tokens[3:]}
+
+            if len(tokens) > 1 and not tokens[1].startswith('-') and os.path.isfile(tokens[1]):
+                return {'code': None, 'file': os.path.abspath(tokens[1]), 'argv': tokens[1:]}
+
+            return None
+
+        # Meco command in bin directory of a package
+        filePath = tokens[0] if os.sep in tokens[0] else LauncherService._findExecutable(tokens[0])
+        if not filePath:
+            return None
+
+        try:
+            if os.path.getsize(filePath) > MAX_COMMAND_FILE_SIZE:
+                return None
+            with open(filePath, 'r') as _file:
+                content = _file.read()
+        except (IOError, OSError, UnicodeDecodeError):
+            return None
+
+        if not LauncherService._isSameFile(os.environ.get('MECO_PYTHON_EXECUTABLE_PATH', ''), self._executable):
+            return None
+
+        match = MECO_COMMAND_PATTERN.search(content)
+        if not match:
+            return None
+
+        return {'code': match.group(1).replace('\\"', '"'), 'file': None, 'argv': ['-c'] + tokens[1:]}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Whether pooling is supported on the current platform.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isSupported(self):
+
+        return os.name == 'posix'
+
+    #
+    ## @brief Whether the service is started.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isStarted(self):
+
+        return self._isStarted
+
+    #
+    ## @brief Start the interpreters in the pool.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def start(self):
+
+        if not self.isSupported():
+            return
+
+        with self._lock:
+
+            self._isStarted = True
+
+            while len(self._pool) < self._poolSize:
+                self._addWorker()
+
+    #
+    ## @brief Stop the interpreters waiting in the pool.
+    #
+    #  Interpreters exit once their control pipes are closed, applications launched already aren't affected.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def stop(self):
+
+        with self._lock:
+
+            self._isStarted = False
+
+            for process, controlFile in self._pool:
+                controlFile.close()
+                process.wait()
+
+            self._pool = []
+
+    #
+    ## @brief Launch given terminal command.
+    #
+    #  Command is dispatched to an interpreter in the pool if it runs Python code with the executable of the pool,
+    #  and a new interpreter is started to replace it. Otherwise the command is run in a new process.
+    #
+    #  @param command [ str | None | in  ] - Terminal command.
+    #  @param cwd     [ str | None | in  ] - Working directory, current working directory is used if None is provided.
+    #
+    #  @exception N/A
+    #
+    #  @return subprocess.Popen - Process running the command.
+    def launch(self, command, cwd=None):
+
+        if not cwd:
+            cwd = os.getcwd()
+
+        job = self._parseCommand(command) if self._isStarted else None
+
+        if job:
+
+            job['cwd']         = cwd
+            job['environment'] = dict(os.environ)
+
+            with self._lock:
+
+                while self._pool:
+
+                    process, controlFile = self._pool.pop(0)
+
+                    if process.poll() is not None:
+                        controlFile.close()
+                        continue
+
+                    try:
+                        controlFile.write('{}\n'.format(json.dumps(job)))
+                        controlFile.close()
+                    except (IOError, OSError, ValueError):
+                        continue
+
+                    self._addWorker()
+
+                    return process
+
+        return subprocess.Popen(command, shell=True, cwd=cwd)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Whether given paths point to the same file.
+    #
+    #  @param path1 [ str | None | in  ] - Path.
+    #  @param path2 [ str | None | in  ] - Path.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    @staticmethod
+    def _isSameFile(path1, path2):
+
+        if not path1 or not path2:
+            return False
+
+        if os.sep not in path1:
+            path1 = LauncherService._findExecutable(path1)
+            if not path1:
+                return False
+
+        return os.path.realpath(path1) == os.path.realpath(path2)
+
+    #
+    ## @brief Find given executable in the directories of PATH environment variable.
+    #
+    #  @param name [ str | None | in  ] - Name of the executable.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the executable, None is returned if it can't be found.
+    @staticmethod
+    def _findExecutable(name):
+
+        for directory in os.environ.get('PATH', '').split(os.pathsep):
+
+            filePath = os.path.join(directory, name)
+            if os.path.isfile(filePath) and os.access(filePath, os.X_OK):
+                return filePath
+
+        return None
+
+#
+## @brief Run an interpreter of the pool.
+#
+#  Function imports the modules to be preloaded, waits for a command on the control pipe and runs it as the
+#  __main__ module. It is called in the interpreters started by the service, arguments are read from sys.argv.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def runWorker():
+
+    readFileDescriptor  = int(sys.argv[1])
+    preloadModules      = [x for x in sys.argv[2].split(',') if x]
+
+    for moduleName in preloadModules:
+        try:
+            importlib.import_module(moduleName)
+        except Exception:
+            pass
+
+    with os.fdopen(readFileDescriptor, 'r') as controlFile:
+        line = controlFile.readline()
+
+    # Control pipe closed, service is stopped
+    if not line:
+        return
+
+    job = json.loads(line)
+
+    os.chdir(job['cwd'])
+    os.environ.clear()
+    os.environ.update(job['environment'])
+
+    sys.argv = job['argv']
+
+    namespace = sys.modules['__main__'].__dict__
+
+    if job['file']:
+        sys.path[0] = os.path.dirname(job['file'])
+        namespace['__file__'] = job['file']
+        with open(job['file'], 'r') as _file:
+            code = compile(_file.read(), job['file'], 'exec')
+    else:
+        code = compile(job['code'], '<string>', 'exec')
+
+    exec(code, namespace)
+
+#
+## @brief Start the launcher service used by launchCommand function.
+#
+#  @param poolSize       [ int         | DEFAULT_POOL_SIZE       | in  ] - Number of interpreters in the pool.
+#  @param preloadModules [ list of str | DEFAULT_PRELOAD_MODULES | in  ] - Modules imported by the interpreters.
+#
+#  @exception N/A
+#
+#  @return mApplication.launcherServiceLib.LauncherService - Service.
+def startService(poolSize=DEFAULT_POOL_SIZE, preloadModules=None):
+
+    global _service
+
+    with _serviceLock:
+
+        if _service is None:
+            _service = LauncherService(poolSize=poolSize, preloadModules=preloadModules)
+
+        _service.start()
+
+    return _service
+
+#
+## @brief Stop the launcher service started by startService function.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def stopService():
+
+    global _service
+
+    with _serviceLock:
+
+        if _service:
+            _service.stop()
+            _service = None
+
+#
+## @brief Launch given terminal command through the launcher service if it is started, otherwise in a new process.
+#
+#  @param command [ str | None | in  ] - Terminal command.
+#  @param cwd     [ str | None | in  ] - Working directory, current working directory is used if None is provided.
+#
+#  @exception N/A
+#
+#  @return subprocess.Popen - Process running the command.
+def launchCommand(command, cwd=None):
+
+    _launcherService = _service
+    if _launcherService:
+        return _launcherService.launch(command, cwd=cwd)
+
+    return subprocess.Popen(command, shell=True, cwd=cwd)
@@ -0,0 +1,426 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mApplication/menuLib.py @brief [ FILE   ] - Menu trees of applications for parent applications.
+## @package mApplication.menuLib    @brief [ MODULE ] - Menu trees of applications for parent applications.
+#
+#  Menu trees are built from full menu paths of the applications once per parent application, menus are then created
+#  in batches while the parent application is idle, so its start up isn't blocked.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import mApplication.catalogLib
+import mApplication.parentApplicationLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ str ] - Step to create a menu.
+STEP_MENU       = 'menu'
+
+## [ str ] - Step to create a menu item.
+STEP_ITEM       = 'item'
+
+## [ str ] - Step to create a separator.
+STEP_SEPARATOR  = 'separator'
+
+## [ dict ] - Menu trees built, keys are parent applications, values are MenuNode instances.
+_menuTrees      = {}
+
+#
+## @brief [ CLASS ] - Node of a menu tree, which is either a menu or a menu item.
+class MenuNode(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param label  [ str  | None | in  ] - Label.
+    #  @param record [ dict | None | in  ] - Metadata of the application for menu items, None for menus.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, label='', record=None):
+
+        ## [ str ] - Label.
+        self._label    = label
+
+        ## [ dict ] - Metadata of the application, @see ApplicationInfo.asDict.
+        self._record   = record
+
+        ## [ list of mApplication.menuLib.MenuNode ] - Child nodes in the order they are created.
+        self._children = []
+
+        ## [ dict ] - Child menus, keys are labels.
+        self._menus    = {}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Label.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Label.
+    def label(self):
+
+        return self._label
+
+    #
+    ## @brief Metadata of the application for menu items.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Metadata, None for menus.
+    def record(self):
+
+        return self._record
+
+    #
+    ## @brief Child nodes, separators are provided as None.
+    #
+    #  @exception N/A
+    #
+    #  @return list of mApplication.menuLib.MenuNode - Nodes.
+    def children(self):
+
+        return self._children
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Whether this node is a menu.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isMenu(self):
+
+        return self._record is None
+
+    #
+    ## @brief Get child menu with given label, which is created if it doesn't exist.
+    #
+    #  @param label [ str | None | in  ] - Label.
+    #
+    #  @exception N/A
+    #
+    #  @return mApplication.menuLib.MenuNode - Node.
+    def getMenu(self, label):
+
+        node = self._menus.get(label)
+        if not node:
+            node = MenuNode(label)
+            self._menus[label] = node
+            self._children.append(node)
+
+        return node
+
+    #
+    ## @brief Add menu item for given metadata of an application.
+    #
+    #  @param label  [ str  | None | in  ] - Label.
+    #  @param record [ dict | None | in  ] - Metadata of the application.
+    #
+    #  @exception N/A
+    #
+    #  @return mApplication.menuLib.MenuNode - Node.
+    def addItem(self, label, record):
+
+        if record['menuSeparatorBefore']:
+            self.addSeparator()
+
+        node = MenuNode(label, record)
+        self._children.append(node)
+
+        if record['menuSeparatorAfter']:
+            self.addSeparator()
+
+        return node
+
+    #
+    ## @brief Add separator, consecutive separators are merged.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addSeparator(self):
+
+        if self._children and self._children[-1] is not None:
+            self._children.append(None)
+
+    #
+    ## @brief Iterate steps to create the menus, items and separators under this node.
+    #
+    #  Menus are provided before their children so they can be used as parents.
+    #
+    #  @exception N/A
+    #
+    #  @return generator - Generator of tuples of (step, node, parent node), node is None for separators.
+    def iterateSteps(self):
+
+        for node in self._children:
+
+            if node is None:
+                yield (STEP_SEPARATOR, None, self)
+                continue
+
+            if node.isMenu():
+                yield (STEP_MENU, node, self)
+                for step in node.iterateSteps():
+                    yield step
+                continue
+
+            yield (STEP_ITEM, node, self)
+
+#
+## @brief Build menu tree of the applications for given parent application.
+#
+#  Menu trees are cached per parent application, @see clearMenuTrees.
+#
+#  @param parentApplication [ str | None | in  ] - Parent application, current parent application is used if None is
+#  provided, @see mApplication.parentApplicationLib.Application.getCurrent.
+#
+#  @exception N/A
+#
+#  @return mApplication.menuLib.MenuNode - Root node, children of which are top level menus (i.e. Meco).
+def getMenuTree(parentApplication=None):
+
+    if not parentApplication:
+        parentApplication = mApplication.parentApplicationLib.Application.getCurrent()
+
+    root = _menuTrees.get(parentApplication)
+    if root:
+        return root
+
+    records = [x for x in mApplication.catalogLib.iterateRecords(parentApplication=parentApplication) if x['fullMenuPath']]
+    records.sort(key=lambda x: x['name'])
+
+    root = MenuNode()
+
+    for record in records:
+
+        labels = record['fullMenuPath'].split('/')
+
+        node = root
+        for label in labels[:-1]:
+            node = node.getMenu(label)
+
+        node.addItem(labels[-1], record)
+
+    _menuTrees[parentApplication] = root
+
+    return root
+
+#
+## @brief Clear menu trees cached.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def clearMenuTrees():
+
+    _menuTrees.clear()
+
+#
+## @brief [ CLASS ] - Class creates menus of a menu tree in batches.
+#
+#  Creation of the actual menus is done by given functions, therefore the class can be used in any parent
+#  application, e.g. maya.cmds.menu and maya.cmds.menuItem in Maya, nuke.Menu.addMenu and nuke.Menu.addCommand
+#  in Nuke or QMenu instances in any Qt based application.
+class MenuBuilder(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC STATIC MEMBERS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## [ int ] - Default number of steps run in each batch.
+    DEFAULT_BATCH_SIZE = 20
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param root            [ mApplication.menuLib.MenuNode | None               | in  ] - Root node of the menu tree.
+    #  @param rootHandle      [ object                        | None               | in  ] - Handle of the menu the
+    #  top level menus will be created under, e.g. name of the main window in Maya or the menu bar in Nuke.
+    #  @param createMenu      [ callable                      | None               | in  ] - Function, which is called
+    #  with parent handle and label, and returns the handle of the menu created.
+    #  @param createItem      [ callable                      | None               | in  ] - Function, which is called
+    #  with parent handle, label and metadata of the application.
+    #  @param createSeparator [ callable                      | None               | in  ] - Function, which is called
+    #  with parent handle.
+    #  @param batchSize       [ int                           | DEFAULT_BATCH_SIZE | in  ] - Number of steps run in each batch.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, root, rootHandle, createMenu, createItem, createSeparator, batchSize=DEFAULT_BATCH_SIZE):
+
+        ## [ int ] - Number of steps run in each batch.
+        self._batchSize         = batchSize
+
+        ## [ callable ] - Function to create menus.
+        self._createMenu        = createMenu
+
+        ## [ callable ] - Function to create menu items.
+        self._createItem        = createItem
+
+        ## [ callable ] - Function to create separators.
+        self._createSeparator   = createSeparator
+
+        ## [ dict ] - Handles of the menus created, keys are ids of the nodes.
+        self._handles           = {id(root): rootHandle}
+
+        ## [ generator ] - Steps to be run, None once all of them are run.
+        self._steps             = root.iterateSteps()
+
+        ## [ callable ] - Function called once all batches are run.
+        self._finishedCallback  = None
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Run next batch and schedule the following one.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _runScheduledBatch(self):
+
+        if self.buildBatch():
+            MenuBuilder._scheduleIdle(self._runScheduledBatch)
+        elif self._finishedCallback:
+            self._finishedCallback()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Whether all menus are created.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isFinished(self):
+
+        return self._steps is None
+
+    #
+    ## @brief Run next batch of steps.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether there are more steps to be run.
+    def buildBatch(self):
+
+        if self._steps is None:
+            return False
+
+        count = 0
+
+        for step, node, parentNode in self._steps:
+
+            parentHandle = self._handles[id(parentNode)]
+
+            if step == STEP_MENU:
+                self._handles[id(node)] = self._createMenu(parentHandle, node.label())
+            elif step == STEP_ITEM:
+                self._createItem(parentHandle, node.label(), node.record())
+            else:
+                self._createSeparator(parentHandle)
+
+            count += 1
+            if count >= self._batchSize:
+                return True
+
+        self._steps = None
+
+        return False
+
+    #
+    ## @brief Run all steps at once.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def build(self):
+
+        while self.buildBatch():
+            pass
+
+    #
+    ## @brief Run batches while the parent application is idle.
+    #
+    #  Each batch is scheduled by a zero timeout Qt timer, which times out once the pending events of the parent
+    #  application are processed, therefore the parent application stays interactive between batches.
+    #
+    #  @param finishedCallback [ callable | None | in  ] - Function called once all batches are run.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def buildDeferred(self, finishedCallback=None):
+
+        self._finishedCallback = finishedCallback
+
+        MenuBuilder._scheduleIdle(self._runScheduledBatch)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Schedule given function to be called when the event loop is idle.
+    #
+    #  @param function [ callable | None | in  ] - Function.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    @staticmethod
+    def _scheduleIdle(function):
+
+        from mQt import QtCore
+
+        QtCore.QTimer.singleShot(0, function)
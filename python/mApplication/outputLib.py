@@ -0,0 +1,318 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mApplication/outputLib.py @brief [ FILE   ] - Machine-readable output of applications.
+## @package mApplication.outputLib    @brief [ MODULE ] - Machine-readable output of applications.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import sys
+import json
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ str ] - Human readable text output.
+FORMAT_TEXT         = 'text'
+
+## [ str ] - Single JSON list.
+FORMAT_JSON         = 'json'
+
+## [ str ] - One JSON object per line.
+FORMAT_NDJSON       = 'ndjson'
+
+## [ str ] - Tab separated values with a header line.
+FORMAT_TSV          = 'tsv'
+
+## [ tuple of str ] - Output formats.
+FORMATS             = (FORMAT_TEXT, FORMAT_JSON, FORMAT_NDJSON, FORMAT_TSV)
+
+## [ dict ] - Short names of the fields, values are keys of the metadata of the applications.
+FIELD_ALIASES       = {'version'  : 'versionStr',
+                       'parents'  : 'parentApplications',
+                       'title'    : 'windowTitle',
+                       'menu'     : 'fullMenuPath',
+                       'class'    : 'className',
+                       'file'     : 'filePath',
+                       'icon'     : 'iconFilePath'}
+
+## [ tuple of str ] - Keys of the metadata of the applications, @see ApplicationInfo.asDict.
+RECORD_KEYS         = ('package', 'packagePath', 'module', 'className', 'filePath', 'name', 'versionMajor',
+                       'versionMinor', 'versionFix', 'versionStr', 'windowTitle', 'isActive', 'description',
+                       'iconFileName', 'iconFilePath', 'usePlatformIcon', 'parentApplications', 'keywords', 'isGUI',
+                       'runAsPanelInNuke', 'documents', 'pythonCommand', 'command', 'menuPath', 'fullMenuPath',
+                       'menuSeparatorBefore', 'menuSeparatorAfter', 'developers')
+
+## [ list of str ] - Fields written if no field is provided.
+DEFAULT_FIELDS      = ['name', 'version', 'parents']
+
+## [ int ] - Number of characters buffered before writing into the stream.
+DEFAULT_BUFFER_SIZE = 65536
+
+#
+## @brief Parse fields given as a string separated by comma.
+#
+#  @param fields      [ str         | None | in  ] - Fields, e.g. name,version,parents. DEFAULT_FIELDS are used if None
+#  is provided.
+#  @param extraFields [ list of str | None | in  ] - Fields added to the metadata by the caller, e.g. score.
+#
+#  @exception ValueError - If a field is unknown.
+#
+#  @return list of str - Fields.
+def parseFields(fields, extraFields=None):
+
+    if not fields:
+        return list(DEFAULT_FIELDS)
+
+    fields = [x.strip() for x in fields.split(',') if x.strip()]
+    validateFields(fields, extraFields=extraFields)
+
+    return fields
+
+#
+## @brief Validate given fields.
+#
+#  @param fields      [ list of str | None | in  ] - Fields, short names in FIELD_ALIASES or RECORD_KEYS.
+#  @param extraFields [ list of str | None | in  ] - Fields added to the metadata by the caller, e.g. score.
+#
+#  @exception ValueError - If a field is unknown, message contains the valid fields.
+#
+#  @return None - None.
+def validateFields(fields, extraFields=None):
+
+    validFields   = set(FIELD_ALIASES) | set(RECORD_KEYS) | set(extraFields or [])
+    unknownFields = [x for x in fields if x not in validFields]
+
+    if unknownFields:
+        raise ValueError('Unknown field(s): {}. Valid fields are: {}'.format(', '.join(unknownFields),
+                                                                             ', '.join(sorted(validFields))))
+
+#
+## @brief Write given data as an indented JSON document.
+#
+#  Used for the outputs, which aren't metadata of applications, e.g. differences of catalogs.
+#
+#  @param data   [ object | None | in  ] - Data, which can be serialized as JSON.
+#  @param stream [ file   | None | in  ] - Stream, sys.stdout is used if None is provided.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def writeDocument(data, stream=None):
+
+    stream = stream if stream else sys.stdout
+
+    stream.write('{}\n'.format(json.dumps(data, indent=4, sort_keys=True)))
+    stream.flush()
+
+#
+## @brief [ CLASS ] - Class writes metadata of applications into a stream through a single buffer.
+class RecordWriter(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param outputFormat [ str         | FORMAT_JSON         | in  ] - Output format, one of FORMATS except FORMAT_TEXT.
+    #  @param fields       [ list of str | None                | in  ] - Fields to be written, short names in
+    #  FIELD_ALIASES or keys of the metadata, @see ApplicationInfo.asDict. DEFAULT_FIELDS are used if None is provided.
+    #  @param stream       [ file        | None                | in  ] - Stream, sys.stdout is used if None is provided.
+    #  @param bufferSize   [ int         | DEFAULT_BUFFER_SIZE | in  ] - Number of characters buffered before writing.
+    #  @param extraFields  [ list of str | None                | in  ] - Fields added to the metadata by the caller,
+    #  e.g. score.
+    #
+    #  @exception ValueError - If given output format is not supported or a field is unknown.
+    #
+    #  @return None - None.
+    def __init__(self, outputFormat=FORMAT_JSON, fields=None, stream=None, bufferSize=DEFAULT_BUFFER_SIZE,
+                 extraFields=None):
+
+        if outputFormat not in (FORMAT_JSON, FORMAT_NDJSON, FORMAT_TSV):
+            raise ValueError('Output format is not supported: {}'.format(outputFormat))
+
+        if fields:
+            validateFields(fields, extraFields=extraFields)
+
+        ## [ str ] - Output format.
+        self._outputFormat  = outputFormat
+
+        ## [ list of str ] - Fields.
+        self._fields        = list(fields) if fields else list(DEFAULT_FIELDS)
+
+        ## [ list of str ] - Keys of the metadata for the fields.
+        self._keys          = [FIELD_ALIASES.get(x, x) for x in self._fields]
+
+        ## [ file ] - Stream.
+        self._stream        = stream if stream else sys.stdout
+
+        ## [ int ] - Number of characters buffered before writing.
+        self._bufferSize    = bufferSize
+
+        ## [ list of str ] - Buffered chunks.
+        self._buffer        = []
+
+        ## [ int ] - Number of characters buffered.
+        self._bufferLength  = 0
+
+        ## [ int ] - Number of records written.
+        self._count         = 0
+
+        # Header is written even if there is no record, so consumers can always parse the columns
+        if self._outputFormat == FORMAT_TSV:
+            self._write('{}\n'.format('\t'.join(self._fields)))
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Add given chunk into the buffer, buffer is flushed if it is full.
+    #
+    #  @param chunk [ str | None | in  ] - Chunk.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _write(self, chunk):
+
+        self._buffer.append(chunk)
+        self._bufferLength += len(chunk)
+
+        if self._bufferLength >= self._bufferSize:
+            self.flush()
+
+    #
+    ## @brief Get values of the fields from given metadata.
+    #
+    #  @param record [ dict | None | in  ] - Metadata of an application.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are the fields.
+    def _getValues(self, record):
+
+        return dict([(field, record.get(key)) for field, key in zip(self._fields, self._keys)])
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Write given metadata of an application.
+    #
+    #  @param record [ dict | None | in  ] - Metadata of an application, @see ApplicationInfo.asDict.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def writeRecord(self, record):
+
+        if self._outputFormat == FORMAT_TSV:
+
+            self._write('{}\n'.format('\t'.join([RecordWriter.formatTSVValue(record.get(x)) for x in self._keys])))
+
+        elif self._outputFormat == FORMAT_NDJSON:
+
+            self._write('{}\n'.format(json.dumps(self._getValues(record), sort_keys=True)))
+
+        else:
+
+            self._write('{}{}'.format(',\n' if self._count else '[\n', json.dumps(self._getValues(record), sort_keys=True)))
+
+        self._count += 1
+
+    #
+    ## @brief Write given metadata of applications and close the output.
+    #
+    #  @param records [ iterable | None | in  ] - Metadata of applications.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of records written.
+    def writeRecords(self, records):
+
+        for record in records:
+            self.writeRecord(record)
+
+        self.close()
+
+        return self._count
+
+    #
+    ## @brief Write the buffered chunks into the stream.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def flush(self):
+
+        if self._buffer:
+            self._stream.write(''.join(self._buffer))
+            self._buffer        = []
+            self._bufferLength  = 0
+
+        self._stream.flush()
+
+    #
+    ## @brief Close the output, JSON list is terminated and the buffer is flushed.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def close(self):
+
+        if self._outputFormat == FORMAT_JSON:
+            self._write('\n]\n' if self._count else '[]\n')
+
+        self.flush()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Format given value for tab separated values.
+    #
+    #  Lists are joined by comma, dict instances are written as JSON, tabs and new lines are replaced by spaces.
+    #
+    #  @param value [ object | None | in  ] - Value.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Formatted value.
+    @staticmethod
+    def formatTSVValue(value):
+
+        if value is None:
+            value = ''
+        elif isinstance(value, (list, tuple)):
+            value = ','.join([x if isinstance(x, str) else json.dumps(x, sort_keys=True) for x in value])
+        elif isinstance(value, dict):
+            value = json.dumps(value, sort_keys=True)
+        else:
+            value = str(value)
+
+        return value.replace('\t', ' ').replace('\r', ' ').replace('\n', ' ')
@@ -0,0 +1,630 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mApplication/sharedCacheLib.py @brief [ FILE   ] - Catalog cache shared by many hosts such as render farm nodes.
+## @package mApplication.sharedCacheLib    @brief [ MODULE ] - Catalog cache shared by many hosts such as render farm nodes.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import glob
+import json
+import time
+import hashlib
+import threading
+
+import mApplication.catalogLib
+import mApplication.contentHashLib
+import mApplication.discoveryLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ str ] - Name of the environment variable, which provides absolute path of the shared cache directory.
+SHARED_CACHE_DIRECTORY_ENV_VARIABLE = 'MAPPLICATION_SHARED_CACHE_DIRECTORY'
+
+## [ float ] - Time in seconds to wait for the process building the catalog before building it locally.
+DEFAULT_LOCK_TIMEOUT                = 300.0
+
+## [ float ] - Time in seconds after which cache entries of other environments are removed,
+#  @see SharedCatalogCache.prune.
+DEFAULT_MAX_ENTRY_AGE               = 604800.0
+
+## [ tuple ] - Patterns of the names of the cache entry files, which are pruned.
+ENTRY_FILE_PATTERNS                 = ('catalog-*.mcat', 'catalog-*.mcat.trigrams', 'catalog-*.lock', 'package-*.json')
+
+## [ threading.Lock ] - Lock to build catalogs, file locks don't exclude the threads of the same process.
+_buildLock                          = threading.Lock()
+
+## [ dict ] - Keys of the cache entries computed in this process, keys are tuples of (cache directory, Python
+#  version, search paths), values are keys, @see SharedCatalogCache.getKey.
+_keys                               = {}
+
+## [ dict ] - Published catalogs validated in this process, keys are absolute paths of the catalogs, values are their
+#  sizes and modification times, @see SharedCatalogCache.isValid.
+_validatedCatalogs                  = {}
+
+## [ threading.Lock ] - Lock for the keys and validated catalogs.
+_memoLock                           = threading.Lock()
+
+#
+## @brief Clear the keys and validated catalogs kept in memory, so the packages are checked again.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def clear():
+
+    with _memoLock:
+        _keys.clear()
+        _validatedCatalogs.clear()
+
+#
+## @brief Get modification time of given path.
+#
+#  @param path [ str | None | in  ] - Absolute path.
+#
+#  @exception N/A
+#
+#  @return float - Modification time, None is returned if the path can't be accessed.
+def getModificationTime(path):
+
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+#
+## @brief [ CLASS ] - Advisory file lock, which works across processes and hosts sharing the file system.
+class FileLock(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param filePath [ str | None | in  ] - Absolute path of the lock file, which is created if it doesn't exist.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, filePath):
+
+        ## [ str ] - Absolute path of the lock file.
+        self._filePath = filePath
+
+        ## [ file ] - Lock file, which is open while the lock is acquired.
+        self._file     = None
+
+    #
+    ## @brief Enter the context by acquiring the lock.
+    #
+    #  @exception N/A
+    #
+    #  @return mApplication.sharedCacheLib.FileLock - Class instance.
+    def __enter__(self):
+
+        self.acquire()
+
+        return self
+
+    #
+    ## @brief Exit the context by releasing the lock.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __exit__(self, *args):
+
+        self.release()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Absolute path of the lock file.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Path.
+    def filePath(self):
+
+        return self._filePath
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Whether the lock is acquired by this instance.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isAcquired(self):
+
+        return self._file is not None
+
+    #
+    ## @brief Acquire the lock.
+    #
+    #  @param timeout      [ float | None | in  ] - Time in seconds to wait for the lock, None waits forever.
+    #  @param pollInterval [ float | 0.1  | in  ] - Time in seconds between attempts.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether the lock is acquired.
+    def acquire(self, timeout=None, pollInterval=0.1):
+
+        if self._file:
+            return True
+
+        directory = os.path.dirname(self._filePath)
+        if directory and not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                if not os.path.isdir(directory):
+                    raise
+
+        _file = open(self._filePath, 'a+')
+
+        startTime = time.time()
+
+        while True:
+
+            if FileLock._lock(_file):
+                self._file = _file
+                return True
+
+            if timeout is not None and time.time() - startTime >= timeout:
+                _file.close()
+                return False
+
+            time.sleep(pollInterval)
+
+    #
+    ## @brief Release the lock.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def release(self):
+
+        if not self._file:
+            return
+
+        FileLock._unlock(self._file)
+
+        self._file.close()
+        self._file = None
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Try to lock given file without blocking.
+    #
+    #  POSIX record locks are used since they are supported by NFS unlike BSD locks.
+    #
+    #  @param _file [ file | None | in  ] - File.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether the file is locked.
+    @staticmethod
+    def _lock(_file):
+
+        try:
+            import fcntl
+        except ImportError:
+            import msvcrt
+            try:
+                _file.seek(0)
+                msvcrt.locking(_file.fileno(), msvcrt.LK_NBLCK, 1)
+            except (IOError, OSError):
+                return False
+            return True
+
+        try:
+            fcntl.lockf(_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except (IOError, OSError):
+            return False
+
+        return True
+
+    #
+    ## @brief Unlock given file.
+    #
+    #  @param _file [ file | None | in  ] - File.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    @staticmethod
+    def _unlock(_file):
+
+        try:
+            import fcntl
+        except ImportError:
+            import msvcrt
+            _file.seek(0)
+            msvcrt.locking(_file.fileno(), msvcrt.LK_UNLCK, 1)
+            return
+
+        fcntl.lockf(_file.fileno(), fcntl.LOCK_UN)
+
+#
+## @brief [ CLASS ] - Catalog cache in a shared directory.
+#
+#  Catalog of an environment is built by a single process under an advisory file lock and published atomically in
+#  the shared directory, other processes wait for the lock and read the published catalog instead of searching the
+#  packages themselves.
+class SharedCatalogCache(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param directory   [ str   | None                 | in  ] - Absolute path of the shared cache directory,
+    #  value of SHARED_CACHE_DIRECTORY_ENV_VARIABLE environment variable is used if None is provided.
+    #  @param lockTimeout [ float | DEFAULT_LOCK_TIMEOUT | in  ] - Time in seconds to wait for the process building
+    #  the catalog, catalog is built locally without being published once the time is up.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, directory=None, lockTimeout=DEFAULT_LOCK_TIMEOUT):
+
+        ## [ str ] - Absolute path of the shared cache directory.
+        self._directory   = directory if directory else os.environ.get(SHARED_CACHE_DIRECTORY_ENV_VARIABLE, '')
+
+        ## [ float ] - Time in seconds to wait for the lock.
+        self._lockTimeout = lockTimeout
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Absolute path of the shared cache directory.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Path.
+    def directory(self):
+
+        return self._directory
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Whether the shared cache is enabled.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isEnabled(self):
+
+        return bool(self._directory)
+
+    #
+    ## @brief Get key of the cache entry for the current environment.
+    #
+    #  Key is built with the environment the catalog is validated with, modification times of the search paths, which
+    #  change when packages are added to or removed from them, and modification times of the package directories,
+    #  which change when app info modules are added to or removed from them. Files in the package directories aren't
+    #  accessed, app info modules edited in place are detected by validating the published catalog instead,
+    #  @see SharedCatalogCache.isValid.
+    #
+    #  Key is computed once per process for each environment, @see clear.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Key.
+    def getKey(self):
+
+        environment = mApplication.catalogLib.Catalog.getEnvironment()
+        memoKey     = (self._directory, environment['pythonVersion'], tuple(environment['paths']))
+
+        with _memoLock:
+            key = _keys.get(memoKey)
+
+        if key:
+            return key
+
+        mtimes             = []
+        visitedDirectories = set()
+
+        for path in environment['paths']:
+
+            mtimes.append([path, getModificationTime(path)])
+
+            for directory in mApplication.discoveryLib.listPackageDirectories(path, visited=visitedDirectories):
+                mtimes.append([directory, getModificationTime(directory)])
+
+        data = json.dumps([environment['pythonVersion'], environment['paths'], mtimes], sort_keys=True)
+        key  = hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+        with _memoLock:
+            _keys[memoKey] = key
+
+        return key
+
+    #
+    ## @brief Get absolute path of the published catalog for given key.
+    #
+    #  @param key [ str | None | in  ] - Key, @see SharedCatalogCache.getKey.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Path.
+    def getCatalogFilePath(self, key):
+
+        return os.path.join(self._directory, 'catalog-{}.mcat'.format(key))
+
+    #
+    ## @brief Get absolute path of the lock file for given key.
+    #
+    #  @param key [ str | None | in  ] - Key, @see SharedCatalogCache.getKey.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Path.
+    def getLockFilePath(self, key):
+
+        return os.path.join(self._directory, 'catalog-{}.lock'.format(key))
+
+    #
+    ## @brief Whether given published catalog is up to date with the app info modules and package info modules.
+    #
+    #  Modification times and sizes of the files are compared with the ones written in the catalog when it was
+    #  published. Fingerprint of their contents is compared as well if content hash validation is enabled, so modified
+    #  packages are detected even if their modification times are preserved, @see mApplication.contentHashLib.
+    #
+    #  @param catalog [ mApplication.catalogLib.Catalog | None | in  ] - Published catalog.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isValid(self, catalog):
+
+        environment  = catalog.environment()
+        packageFiles = environment.get('packageFiles')
+
+        if packageFiles is None:
+            return False
+
+        for filePath, mtime, size in packageFiles:
+
+            try:
+                _stat = os.stat(filePath)
+            except OSError:
+                return False
+
+            if _stat.st_mtime != mtime or _stat.st_size != size:
+                return False
+
+        if mApplication.contentHashLib.isEnabled():
+            return environment.get('packageFingerprint') == self._getFingerprint(environment['paths'])
+
+        return True
+
+    #
+    ## @brief Remove cache entries, which haven't been published or written for given time.
+    #
+    #  Entries of the environments, which aren't used anymore, would pile up in the shared directory otherwise. An
+    #  entry removed while it is still used is published again by the next process needing it. Lock files are removed
+    #  only if they aren't locked.
+    #
+    #  @param maxAge [ float       | DEFAULT_MAX_ENTRY_AGE | in  ] - Time in seconds.
+    #  @param keep   [ list of str | None                  | in  ] - Keys of the entries, which are kept.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Absolute paths of the removed files.
+    def prune(self, maxAge=DEFAULT_MAX_ENTRY_AGE, keep=None):
+
+        if not self.isEnabled():
+            return []
+
+        keep        = set(keep or [])
+        currentTime = time.time()
+        removed     = []
+
+        for pattern in ENTRY_FILE_PATTERNS:
+
+            for filePath in glob.glob(os.path.join(self._directory, pattern)):
+
+                key = os.path.basename(filePath).split('.')[0].split('-', 1)[-1]
+                if key in keep:
+                    continue
+
+                mtime = getModificationTime(filePath)
+                if mtime is None or currentTime - mtime < maxAge:
+                    continue
+
+                if filePath.endswith('.lock'):
+                    _lock = FileLock(filePath)
+                    if not _lock.acquire(timeout=0):
+                        continue
+                    _lock.release()
+
+                try:
+                    os.remove(filePath)
+                except OSError:
+                    # Files can be in use on Windows or removed by another process
+                    continue
+
+                removed.append(filePath)
+
+        return removed
+
+    #
+    ## @brief Get catalog of the current environment.
+    #
+    #  Published catalog is read if it exists and it is valid, @see SharedCatalogCache.isValid. Otherwise the lock is
+    #  acquired, and the catalog is built and published unless another process published it while waiting for the
+    #  lock. Old entries of other environments are pruned after publishing, @see SharedCatalogCache.prune.
+    #
+    #  Published catalogs are validated once per process.
+    #
+    #  @exception N/A
+    #
+    #  @return mApplication.catalogLib.Catalog - Class instance, None is returned if the shared cache is not enabled.
+    def get(self):
+
+        if not self.isEnabled():
+            return None
+
+        key             = self.getKey()
+        catalogFilePath = self.getCatalogFilePath(key)
+
+        _catalog = self._loadValid(catalogFilePath)
+        if _catalog:
+            return _catalog
+
+        with _buildLock:
+
+            _lock = FileLock(self.getLockFilePath(key))
+
+            if not _lock.acquire(timeout=self._lockTimeout):
+                return mApplication.catalogLib.Catalog.build()
+
+            try:
+
+                # Another process or thread may have published the catalog while waiting for the lock
+                _catalog = self._loadValid(catalogFilePath)
+                if _catalog:
+                    return _catalog
+
+                _catalog = self._build()
+                _catalog.write(catalogFilePath, binary=True)
+
+                with _memoLock:
+                    _validatedCatalogs[catalogFilePath] = mApplication.catalogLib.getFileStamp(catalogFilePath)
+
+            finally:
+                _lock.release()
+
+        self.prune(keep=[key])
+
+        return _catalog
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get fingerprint of the contents of the app info modules and package info modules in given search paths.
+    #
+    #  Content hashes of the files are kept in the cache directory, @see mApplication.contentHashLib.
+    #
+    #  @param paths [ list of str | None | in  ] - Search paths.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Fingerprint.
+    def _getFingerprint(self, paths):
+
+        hashesFilePath = os.path.join(self._directory, mApplication.contentHashLib.HASHES_FILE_NAME)
+
+        return mApplication.contentHashLib.getFingerprint(paths, hashesFilePath=hashesFilePath)
+
+    #
+    ## @brief Build the catalog of the current environment to be published.
+    #
+    #  Modification times and sizes of the app info modules and package info modules, and the fingerprint of their
+    #  contents if content hash validation is enabled, are written in the environment of the catalog, so processes
+    #  reading it can validate it, @see SharedCatalogCache.isValid.
+    #
+    #  @exception N/A
+    #
+    #  @return mApplication.catalogLib.Catalog - Catalog.
+    def _build(self):
+
+        _catalog    = mApplication.catalogLib.Catalog.build()
+        environment = _catalog.environment()
+
+        packageFiles = []
+        for filePath in mApplication.contentHashLib.listPackageFiles(environment['paths']):
+            try:
+                _stat = os.stat(filePath)
+            except OSError:
+                continue
+            packageFiles.append([filePath, _stat.st_mtime, _stat.st_size])
+
+        environment['packageFiles'] = packageFiles
+
+        if mApplication.contentHashLib.isEnabled():
+            environment['packageFingerprint'] = self._getFingerprint(environment['paths'])
+
+        return _catalog
+
+    #
+    ## @brief Load given published catalog if it is valid, @see SharedCatalogCache.isValid.
+    #
+    #  @param catalogFilePath [ str | None | in  ] - Absolute path of the published catalog.
+    #
+    #  @exception N/A
+    #
+    #  @return mApplication.catalogLib.Catalog - Catalog, None is returned if it doesn't exist or it isn't valid.
+    def _loadValid(self, catalogFilePath):
+
+        _catalog = mApplication.catalogLib.Catalog.load(catalogFilePath)
+        if not _catalog:
+            return None
+
+        stamp = mApplication.catalogLib.getFileStamp(catalogFilePath)
+
+        with _memoLock:
+            if _validatedCatalogs.get(catalogFilePath) == stamp:
+                return _catalog
+
+        if not self.isValid(_catalog):
+            return None
+
+        with _memoLock:
+            _validatedCatalogs[catalogFilePath] = stamp
+
+        return _catalog
@@ -0,0 +1,623 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mApplication/sqliteCatalogLib.py @brief [ FILE   ] - SQLite catalog of applications.
+## @package mApplication.sqliteCatalogLib    @brief [ MODULE ] - SQLite catalog of applications.
+#
+#  SQLite catalogs store one row per application with indexes on name, package, parent applications, keywords, active
+#  flag and version, so filters of ApplicationInfo.list method run as indexed SQL queries. Keywords and descriptions
+#  are also stored in a full text search table if FTS5 is available in the SQLite library.
+#
+#  Unlike the other catalog artifacts, SQLite catalogs can be updated in place, applications of the packages are
+#  replaced by row upserts, @see SQLiteCatalog.updatePackages.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import json
+import sqlite3
+import tempfile
+import threading
+
+try:
+    from urllib.request import pathname2url
+except ImportError:
+    from urllib import pathname2url
+
+import mApplication.catalogLib
+import mApplication.parentApplicationLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ bytes ] - Header of SQLite database files.
+SQLITE_HEADER   = b'SQLite format 3\0'
+
+## [ int ] - Version of the schema, tables of the databases created with older versions are populated when opened.
+SCHEMA_VERSION  = 2
+
+## [ bool ] - Whether UPSERT (INSERT ... ON CONFLICT DO UPDATE) is supported, which requires SQLite 3.24.0.
+HAS_UPSERT      = sqlite3.sqlite_version_info >= (3, 24, 0)
+
+## [ list of str ] - Statements to create the tables and indexes.
+SCHEMA          = ['CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL)',
+                   'CREATE TABLE IF NOT EXISTS applications ('
+                   'id INTEGER PRIMARY KEY, '
+                   'package TEXT NOT NULL, '
+                   'module TEXT NOT NULL, '
+                   'className TEXT NOT NULL, '
+                   'name TEXT NOT NULL, '
+                   'lowerName TEXT NOT NULL, '
+                   'versionMajor INTEGER NOT NULL, '
+                   'versionMinor INTEGER NOT NULL, '
+                   'versionFix INTEGER NOT NULL, '
+                   'isActive INTEGER NOT NULL, '
+                   'record TEXT NOT NULL, '
+                   'UNIQUE (package, module, className))',
+                   'CREATE TABLE IF NOT EXISTS parentApplications ('
+                   'applicationId INTEGER NOT NULL REFERENCES applications(id) ON DELETE CASCADE, '
+                   'parentApplication TEXT NOT NULL)',
+                   'CREATE TABLE IF NOT EXISTS keywords ('
+                   'applicationId INTEGER NOT NULL REFERENCES applications(id) ON DELETE CASCADE, '
+                   'keyword TEXT NOT NULL)',
+                   'CREATE TABLE IF NOT EXISTS developers ('
+                   'applicationId INTEGER NOT NULL REFERENCES applications(id) ON DELETE CASCADE, '
+                   'userName TEXT NOT NULL, '
+                   'email TEXT NOT NULL)',
+                   'CREATE TABLE IF NOT EXISTS documents ('
+                   'applicationId INTEGER NOT NULL REFERENCES applications(id) ON DELETE CASCADE, '
+                   'url TEXT NOT NULL)',
+                   'CREATE INDEX IF NOT EXISTS applicationsNameIndex ON applications (name, module, className)',
+                   'CREATE INDEX IF NOT EXISTS applicationsPackageIndex ON applications (package COLLATE NOCASE)',
+                   'CREATE INDEX IF NOT EXISTS applicationsActiveIndex ON applications (isActive)',
+                   'CREATE INDEX IF NOT EXISTS applicationsVersionIndex ON applications (name, versionMajor, versionMinor, versionFix)',
+                   'CREATE INDEX IF NOT EXISTS parentApplicationsIndex ON parentApplications (parentApplication, applicationId)',
+                   'CREATE INDEX IF NOT EXISTS parentApplicationsApplicationIndex ON parentApplications (applicationId)',
+                   'CREATE INDEX IF NOT EXISTS keywordsIndex ON keywords (keyword, applicationId)',
+                   'CREATE INDEX IF NOT EXISTS keywordsApplicationIndex ON keywords (applicationId)',
+                   'CREATE INDEX IF NOT EXISTS developersUserNameIndex ON developers (userName, applicationId)',
+                   'CREATE INDEX IF NOT EXISTS developersEmailIndex ON developers (email, applicationId)',
+                   'CREATE INDEX IF NOT EXISTS developersApplicationIndex ON developers (applicationId)',
+                   'CREATE INDEX IF NOT EXISTS documentsUrlIndex ON documents (url, applicationId)',
+                   'CREATE INDEX IF NOT EXISTS documentsApplicationIndex ON documents (applicationId)']
+
+## [ str ] - Statement to create the full text search table.
+FTS_SCHEMA      = 'CREATE VIRTUAL TABLE IF NOT EXISTS applicationsText USING fts5(name, keywords, description)'
+
+#
+## @brief Whether given file is a SQLite catalog.
+#
+#  @param filePath [ str | None | in  ] - Absolute path of the file.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def isSQLiteCatalog(filePath):
+
+    try:
+        with open(filePath, 'rb') as _file:
+            return _file.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+    except (IOError, OSError):
+        return False
+
+#
+## @brief Write given catalog into given file as a SQLite catalog atomically.
+#
+#  Database is created in a temporary file in the same directory, which is then renamed.
+#
+#  @param catalog  [ mApplication.catalogLib.Catalog | None | in  ] - Catalog.
+#  @param filePath [ str                             | None | in  ] - Absolute path of the database file.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def write(catalog, filePath):
+
+    directory = os.path.dirname(os.path.abspath(filePath))
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    fileDescriptor, temporaryFilePath = tempfile.mkstemp(prefix='.{}.'.format(os.path.basename(filePath)),
+                                                         dir=directory)
+    os.close(fileDescriptor)
+
+    try:
+        _catalog = SQLiteCatalog(temporaryFilePath)
+        _catalog.setEnvironment(catalog.environment())
+        _catalog.upsertRecords(catalog.records())
+        _catalog.close()
+
+        os.chmod(temporaryFilePath, 0o644)
+        mApplication.catalogLib.replaceFile(temporaryFilePath, filePath)
+
+        catalog.writeTrigramIndex(filePath)
+
+    except Exception:
+        if os.path.isfile(temporaryFilePath):
+            os.remove(temporaryFilePath)
+        raise
+
+#
+## @brief [ CLASS ] - Catalog of applications stored in a SQLite database file.
+class SQLiteCatalog(mApplication.catalogLib.Catalog):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  Database is created if it doesn't exist. Read-only databases are opened without creating or migrating the
+    #  tables, so shared catalogs can be read from read-only file systems or by users who can't write them.
+    #
+    #  @param filePath [ str  | None  | in  ] - Absolute path of the database file.
+    #  @param readOnly [ bool | False | in  ] - Open the database in read-only mode.
+    #
+    #  @exception sqlite3.Error - If given file is not a SQLite database.
+    #  @exception ValueError    - If given read-only database is created with an older schema version.
+    #
+    #  @return None - None.
+    def __init__(self, filePath, readOnly=False):
+
+        ## [ threading.RLock ] - Lock for the connection, which is shared by the threads.
+        self._lock       = threading.RLock()
+
+        ## [ sqlite3.Connection ] - Connection.
+        self._connection = SQLiteCatalog._connect(filePath, readOnly)
+        self._connection.execute('PRAGMA foreign_keys = ON')
+
+        ## [ bool ] - Whether full text search is available.
+        self._hasFTS     = True
+
+        if readOnly:
+
+            row = self._connection.execute('SELECT value FROM metadata WHERE key = ?', ('schemaVersion',)).fetchone()
+            if not row or int(row[0]) < SCHEMA_VERSION:
+                self._connection.close()
+                raise ValueError('Schema of read-only catalog is out of date: {}'.format(filePath))
+
+            self._hasFTS = self._connection.execute('SELECT COUNT(*) FROM sqlite_master WHERE name = ?',
+                                                    ('applicationsText',)).fetchone()[0] > 0
+
+        else:
+
+            with self._connection:
+                for statement in SCHEMA:
+                    self._connection.execute(statement)
+
+            try:
+                with self._connection:
+                    self._connection.execute(FTS_SCHEMA)
+            except sqlite3.OperationalError:
+                self._hasFTS = False
+
+            self._migrate()
+
+        row = self._connection.execute('SELECT value FROM metadata WHERE key = ?', ('environment',)).fetchone()
+
+        mApplication.catalogLib.Catalog.__init__(self,
+                                                 records=None,
+                                                 environment=json.loads(row[0]) if row else None,
+                                                 filePath=filePath)
+
+    #
+    ## @brief Number of applications.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Count.
+    def __len__(self):
+
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM applications').fetchone()[0]
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Metadata of applications.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Metadata sorted by names, @see ApplicationInfo.asDict.
+    def records(self):
+
+        return self._select('SELECT record FROM applications ORDER BY name, module, className')
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Run given query, which selects the record column.
+    #
+    #  @param statement  [ str   | None | in  ] - SQL statement.
+    #  @param parameters [ tuple | ()   | in  ] - Parameters.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Metadata of applications.
+    def _select(self, statement, parameters=()):
+
+        with self._lock:
+            rows = self._connection.execute(statement, parameters).fetchall()
+
+        return [json.loads(x[0]) for x in rows]
+
+    #
+    ## @brief Populate the tables added after the schema version the database was created with.
+    #
+    #  Applications are upserted again from their metadata stored in the database.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _migrate(self):
+
+        row = self._connection.execute('SELECT value FROM metadata WHERE key = ?', ('schemaVersion',)).fetchone()
+        if row and int(row[0]) >= SCHEMA_VERSION:
+            return
+
+        with self._lock, self._connection:
+
+            for x in self._connection.execute('SELECT record FROM applications').fetchall():
+                self._upsertRecord(json.loads(x[0]))
+
+            self._connection.execute('INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)',
+                                     ('schemaVersion', str(SCHEMA_VERSION)))
+
+    #
+    ## @brief Insert or update given metadata of an application, it has to be called in a transaction.
+    #
+    #  @param record [ dict | None | in  ] - Metadata of the application.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _upsertRecord(self, record):
+
+        data = json.dumps(record, sort_keys=True, separators=(',', ':'))
+
+        values = (record['package'], record['module'], record['className'], record['name'], record['name'].lower(),
+                  record['versionMajor'], record['versionMinor'], record['versionFix'], 1 if record['isActive'] else 0,
+                  data)
+
+        if HAS_UPSERT:
+            self._connection.execute('INSERT INTO applications '
+                                     '(package, module, className, name, lowerName, versionMajor, versionMinor, versionFix, isActive, record) '
+                                     'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) '
+                                     'ON CONFLICT (package, module, className) DO UPDATE SET '
+                                     'name = excluded.name, lowerName = excluded.lowerName, '
+                                     'versionMajor = excluded.versionMajor, versionMinor = excluded.versionMinor, '
+                                     'versionFix = excluded.versionFix, isActive = excluded.isActive, record = excluded.record',
+                                     values)
+
+        # Ids are kept by updating existing applications, INSERT OR REPLACE would delete their rows in other tables
+        elif not self._connection.execute('UPDATE applications SET '
+                                          'name = ?, lowerName = ?, versionMajor = ?, versionMinor = ?, versionFix = ?, '
+                                          'isActive = ?, record = ? '
+                                          'WHERE package = ? AND module = ? AND className = ?',
+                                          values[3:] + values[:3]).rowcount:
+            self._connection.execute('INSERT INTO applications '
+                                     '(package, module, className, name, lowerName, versionMajor, versionMinor, versionFix, isActive, record) '
+                                     'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                                     values)
+
+        applicationId = self._connection.execute('SELECT id FROM applications WHERE package = ? AND module = ? AND className = ?',
+                                                 (record['package'], record['module'], record['className'])).fetchone()[0]
+
+        self._connection.execute('DELETE FROM parentApplications WHERE applicationId = ?', (applicationId,))
+        self._connection.executemany('INSERT INTO parentApplications (applicationId, parentApplication) VALUES (?, ?)',
+                                     [(applicationId, x) for x in set(record['parentApplications'])])
+
+        self._connection.execute('DELETE FROM keywords WHERE applicationId = ?', (applicationId,))
+        self._connection.executemany('INSERT INTO keywords (applicationId, keyword) VALUES (?, ?)',
+                                     [(applicationId, x) for x in set(record['keywords'])])
+
+        self._connection.execute('DELETE FROM developers WHERE applicationId = ?', (applicationId,))
+        self._connection.executemany('INSERT INTO developers (applicationId, userName, email) VALUES (?, ?, ?)',
+                                     [(applicationId,
+                                       mApplication.catalogLib.normalizeSecondaryKey(mApplication.catalogLib.INDEX_DEVELOPER,
+                                                                                     x.get('userName')),
+                                       mApplication.catalogLib.normalizeSecondaryKey(mApplication.catalogLib.INDEX_EMAIL,
+                                                                                     x.get('email')))
+                                      for x in record['developers']])
+
+        self._connection.execute('DELETE FROM documents WHERE applicationId = ?', (applicationId,))
+        self._connection.executemany('INSERT INTO documents (applicationId, url) VALUES (?, ?)',
+                                     [(applicationId, x) for x in
+                                      mApplication.catalogLib.getSecondaryKeys(record, mApplication.catalogLib.INDEX_DOCUMENT_URL)])
+
+        if self._hasFTS:
+            self._connection.execute('DELETE FROM applicationsText WHERE rowid = ?', (applicationId,))
+            self._connection.execute('INSERT INTO applicationsText (rowid, name, keywords, description) VALUES (?, ?, ?, ?)',
+                                     (applicationId, record['name'], ' '.join(record['keywords']), record['description'] or ''))
+
+    #
+    ## @brief Delete applications, which match given condition, it has to be called in a transaction.
+    #
+    #  @param condition  [ str   | None | in  ] - SQL condition on applications table.
+    #  @param parameters [ tuple | None | in  ] - Parameters.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _delete(self, condition, parameters):
+
+        if self._hasFTS:
+            self._connection.execute('DELETE FROM applicationsText WHERE rowid IN (SELECT id FROM applications WHERE {})'.format(condition),
+                                     parameters)
+
+        self._connection.execute('DELETE FROM applications WHERE {}'.format(condition), parameters)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Whether full text search is available, @see SQLiteCatalog.searchText.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def hasFTS(self):
+
+        return self._hasFTS
+
+    #
+    ## @brief Set environment the catalog is built for.
+    #
+    #  @param environment [ dict | None | in  ] - Environment, @see mApplication.catalogLib.Catalog.getEnvironment.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setEnvironment(self, environment):
+
+        with self._lock, self._connection:
+            self._connection.execute('INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)',
+                                     ('environment', json.dumps(environment, sort_keys=True)))
+
+        self._environment  = environment
+        self._versionIndex = None
+        self._trigramIndex = None
+        self._secondaryIndexes = {}
+
+        # Trigram index written next to the database doesn't match it anymore
+        self._fileStamp    = None
+
+    #
+    ## @brief Insert or update given metadata of applications in a single transaction.
+    #
+    #  Applications are identified by their packages, modules and class names.
+    #
+    #  @param records [ list of dict | None | in  ] - Metadata of the applications.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def upsertRecords(self, records):
+
+        with self._lock, self._connection:
+            for record in records:
+                self._upsertRecord(record)
+
+        self._versionIndex = None
+        self._trigramIndex = None
+        self._secondaryIndexes = {}
+
+        # Trigram index written next to the database doesn't match it anymore
+        self._fileStamp    = None
+
+    #
+    ## @brief Update applications of given packages by searching them in the current environment.
+    #
+    #  Applications of the packages are upserted, the ones which don't exist anymore are deleted. Applications of the
+    #  other packages aren't touched, therefore there is no need to search all packages.
+    #
+    #  @param packageNames [ list of str | None | in  ] - Names of the packages.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of applications of the packages.
+    def updatePackages(self, packageNames):
+
+        import mApplication.applicationInfoAbs
+
+        records = [x.asDict() for x in mApplication.applicationInfoAbs.ApplicationInfo.iterate(packageNames=packageNames)]
+
+        with self._lock, self._connection:
+
+            for packageName in packageNames:
+
+                keys = [(x['module'], x['className']) for x in records if x['package'].lower() == packageName.lower()]
+
+                for row in self._connection.execute('SELECT id, module, className FROM applications '
+                                                    'WHERE package = ? COLLATE NOCASE', (packageName,)).fetchall():
+                    if (row[1], row[2]) not in keys:
+                        self._delete('id = ?', (row[0],))
+
+            for record in records:
+                self._upsertRecord(record)
+
+        environment = dict(self._environment)
+
+        packageHashes = dict(environment.get('packageHashes') or {})
+        packageHashes.update(mApplication.catalogLib.Catalog.hashPackages(records))
+        environment['packageHashes'] = packageHashes
+
+        self.setEnvironment(environment)
+
+        return len(records)
+
+    #
+    ## @brief Query metadata of applications by an indexed SQL query.
+    #
+    #  Filters work the same way as they do in ApplicationInfo.list method.
+    #
+    #  @param parentApplication [ str  | None | in  ] - Parent application name, which listed applications can be run in.
+    #  @param packageName       [ str  | None | in  ] - Name of the package, the applications will be list for.
+    #  @param keyword           [ str  | None | in  ] - Keyword to be searched.
+    #  @param ignoreInactive    [ bool | True | in  ] - Ignore, therefore do not list inactive applications.
+    #  @param limit             [ int  | None | in  ] - Maximum number of applications, None means no limit.
+    #  @param offset            [ int  | 0    | in  ] - Number of applications to be skipped.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Metadata of applications sorted by their names.
+    def query(self, parentApplication=None, packageName=None, keyword=None, ignoreInactive=True, limit=None, offset=0):
+
+        conditions = []
+        parameters = []
+
+        if ignoreInactive:
+            conditions.append('isActive = 1')
+
+        if packageName:
+            conditions.append('package = ? COLLATE NOCASE')
+            parameters.append(packageName)
+
+        if parentApplication and parentApplication != mApplication.parentApplicationLib.Application.kAll:
+            conditions.append('id IN (SELECT applicationId FROM parentApplications WHERE parentApplication = ?)')
+            parameters.append(parentApplication)
+
+        if keyword:
+            conditions.append('(id IN (SELECT applicationId FROM keywords WHERE keyword = ?) OR instr(lowerName, ?) > 0)')
+            parameters.extend([keyword, keyword])
+
+        statement = 'SELECT record FROM applications'
+        if conditions:
+            statement += ' WHERE {}'.format(' AND '.join(conditions))
+
+        statement += ' ORDER BY name, module, className'
+
+        if limit is not None:
+            statement += ' LIMIT ? OFFSET ?'
+            parameters.extend([max(limit, 0), max(offset or 0, 0)])
+        elif offset:
+            statement += ' LIMIT -1 OFFSET ?'
+            parameters.append(max(offset, 0))
+
+        return self._select(statement, tuple(parameters))
+
+    #
+    ## @brief Find metadata of applications by their developers and documents by an indexed SQL query.
+    #
+    #  Arguments are the same as mApplication.catalogLib.Catalog.findBySecondaryKeys method.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Metadata of applications sorted by their names.
+    def findBySecondaryKeys(self, developer=None, email=None, documentUrl=None):
+
+        conditions = []
+        parameters = []
+
+        if developer:
+            conditions.append('id IN (SELECT applicationId FROM developers WHERE userName = ?)')
+            parameters.append(mApplication.catalogLib.normalizeSecondaryKey(mApplication.catalogLib.INDEX_DEVELOPER, developer))
+
+        if email:
+            conditions.append('id IN (SELECT applicationId FROM developers WHERE email = ?)')
+            parameters.append(mApplication.catalogLib.normalizeSecondaryKey(mApplication.catalogLib.INDEX_EMAIL, email))
+
+        if documentUrl:
+            conditions.append('id IN (SELECT applicationId FROM documents WHERE url = ?)')
+            parameters.append(mApplication.catalogLib.normalizeSecondaryKey(mApplication.catalogLib.INDEX_DOCUMENT_URL, documentUrl))
+
+        statement = 'SELECT record FROM applications'
+        if conditions:
+            statement += ' WHERE {}'.format(' AND '.join(conditions))
+
+        return self._select('{} ORDER BY name, module, className'.format(statement), tuple(parameters))
+
+    #
+    ## @brief Search names, keywords and descriptions of the applications by full text search.
+    #
+    #  @param text  [ str | None | in  ] - Text to be searched, FTS5 query syntax can be used.
+    #  @param limit [ int | None | in  ] - Maximum number of applications, None means no limit.
+    #
+    #  @exception sqlite3.OperationalError - If given text is not a valid FTS5 query.
+    #
+    #  @return list of dict - Metadata of applications in order of relevance, empty list is returned if full text
+    #  search is not available.
+    def searchText(self, text, limit=None):
+
+        if not self._hasFTS:
+            return []
+
+        return self._select('SELECT applications.record FROM applicationsText '
+                            'JOIN applications ON applications.id = applicationsText.rowid '
+                            'WHERE applicationsText MATCH ? ORDER BY rank LIMIT ?',
+                            (text, -1 if limit is None else limit))
+
+    #
+    ## @brief Close the connection.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def close(self):
+
+        with self._lock:
+            self._connection.close()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Connect to given database file.
+    #
+    #  Read-only databases are opened by a URI in read-only mode, so neither the database nor its journal is written.
+#  Python 2 doesn't support URIs, its read-only connections refuse writes by query_only pragma.
+    #
+    #  @param filePath [ str  | None | in  ] - Absolute path of the database file.
+    #  @param readOnly [ bool | None | in  ] - Open the database in read-only mode.
+    #
+    #  @exception sqlite3.Error - If the database can't be opened.
+    #
+    #  @return sqlite3.Connection - Connection.
+    @staticmethod
+    def _connect(filePath, readOnly):
+
+        if not readOnly:
+            return sqlite3.connect(filePath, check_same_thread=False)
+
+        uri = 'file:{}?mode=ro'.format(pathname2url(os.path.abspath(filePath)))
+
+        try:
+            return sqlite3.connect(uri, check_same_thread=False, uri=True)
+        except TypeError:
+            # URIs aren't supported by Python 2, writes are refused by the connection instead
+            connection = sqlite3.connect(filePath, check_same_thread=False)
+            connection.execute('PRAGMA query_only = ON')
+            return connection
@@ -0,0 +1,987 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_applicationInfoAbs.py @brief [ FILE   ] - Tests of mApplication.applicationInfoAbs module.
+#
+#  Test packages are created in search paths in a temporary directory, which are added to sys.path.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+import mApplication.applicationInfoAbs
+import mApplication.catalogLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ str ] - Template of an app info class of the test packages.
+APP_INFO_CLASS_TEMPLATE = '''
+class {className}ApplicationInfo(mApplication.applicationInfoAbs.ApplicationInfo):
+    def __init__(self):
+        self._name = '{name}'
+        self._versionMajor = {versionMajor}
+        self._keywords = {keywords}
+        self._parentApplications = {parentApplications}
+        self._developers = {developers}
+        self._documents = {documents}
+        mApplication.applicationInfoAbs.ApplicationInfo.__init__(self)
+'''
+
+## [ list of str ] - Environment variables, which make applications listed from catalogs instead of the packages.
+CATALOG_ENV_VARIABLES   = ['MAPPLICATION_CATALOG_FILE', 'MAPPLICATION_SHARED_CACHE_DIRECTORY']
+
+#
+## @brief Get source code of an app info module.
+#
+#  @param applications [ list of dict | None | in  ] - Applications, keys of dict instances are: name,
+#  versionMajor (optional), keywords (optional), parentApplications (optional), developers (optional), documents
+#  (optional).
+#
+#  @exception N/A
+#
+#  @return str - Source code.
+def getAppInfoModuleSource(applications):
+
+    source = 'import mApplication.applicationInfoAbs\n'
+
+    for application in applications:
+        source += APP_INFO_CLASS_TEMPLATE.format(className=application['name'].replace(' ', ''),
+                                                 name=application['name'],
+                                                 versionMajor=application.get('versionMajor', 1),
+                                                 keywords=application.get('keywords', ['test']),
+                                                 parentApplications=application.get('parentApplications', ['standalone']),
+                                                 developers=application.get('developers', []),
+                                                 documents=application.get('documents', []))
+
+    return source
+
+#
+## @brief [ CLASS ] - Base class of the tests, which list applications of test packages.
+class ApplicationInfoTestCase(unittest.TestCase):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create the temporary directory and disable catalogs.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        self._directory     = tempfile.mkdtemp(prefix='mApplicationInfoTest')
+        self._searchPaths   = []
+        self._packageNames  = set()
+        self._environment   = dict([(x, os.environ.pop(x)) for x in CATALOG_ENV_VARIABLES if x in os.environ])
+
+    #
+    ## @brief Remove the test packages from sys.path and sys.modules and remove the temporary directory.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def tearDown(self):
+
+        for path in self._searchPaths:
+            if path in sys.path:
+                sys.path.remove(path)
+
+        for moduleName in list(sys.modules):
+            if moduleName.split('.')[0] in self._packageNames:
+                sys.modules.pop(moduleName, None)
+
+        mApplication.applicationInfoAbs.ApplicationInfo.clearFailedModules()
+
+        os.environ.update(self._environment)
+
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    #
+    ## @brief Create a search path in the temporary directory and append it to sys.path.
+    #
+    #  @param name [ str | None | in  ] - Name of the search path directory.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the search path.
+    def _addSearchPath(self, name):
+
+        path = os.path.join(self._directory, name)
+        os.makedirs(path)
+
+        sys.path.append(path)
+        self._searchPaths.append(path)
+
+        return path
+
+    #
+    ## @brief Create a test package in given search path.
+    #
+    #  @param searchPath   [ str          | None | in  ] - Absolute path of the search path.
+    #  @param packageName  [ str          | None | in  ] - Name of the package.
+    #  @param applications [ list of dict | None | in  ] - Applications, @see getAppInfoModuleSource.
+    #  @param source       [ str          | None | in  ] - Source code of the app info module, which is used instead of
+    #  the applications if provided.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the app info module.
+    def _addPackage(self, searchPath, packageName, applications=None, source=None):
+
+        packagePath = os.path.join(searchPath, packageName)
+        os.makedirs(packagePath)
+
+        self._packageNames.add(packageName)
+
+        with open(os.path.join(packagePath, '__init__.py'), 'w') as _file:
+            _file.write('')
+
+        with open(os.path.join(packagePath, 'packageInfoLib.py'), 'w') as _file:
+            _file.write("NAME = '{}'\n".format(packageName))
+
+        filePath = os.path.join(packagePath, '{}ApplicationInfoLib.py'.format(packageName))
+
+        with open(filePath, 'w') as _file:
+            _file.write(source if source is not None else getAppInfoModuleSource(applications or []))
+
+        return filePath
+
+    #
+    ## @brief Get names, versions and files of given applications.
+    #
+    #  @param appInfoList [ list of mApplication.applicationInfoAbs.ApplicationInfo | None | in  ] - Applications.
+    #
+    #  @exception N/A
+    #
+    #  @return list of tuple - Names, version strings and absolute paths of the app info modules.
+    def _describe(self, appInfoList):
+
+        return [(x.name(), x.versionStr(), os.path.realpath(x.asDict()['filePath'])) for x in appInfoList]
+
+#
+## @brief [ CLASS ] - Tests of the negative cache of the app info modules and classes failed during listing.
+class NegativeCacheTest(ApplicationInfoTestCase):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create a package, which can be imported, and a package, which raises an error when it is imported.
+    #
+    #  Broken app info module appends a line into a marker file each time it is executed.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        ApplicationInfoTestCase.setUp(self)
+
+        searchPath          = self._addSearchPath('root')
+        self._markerPath    = os.path.join(self._directory, 'marker.txt')
+
+        self._addPackage(searchPath, 'mValidTest', [{'name': 'LightMixer'}])
+
+        self._brokenFilePath = self._addPackage(searchPath,
+                                                'mBrokenTest',
+                                                source="open({!r}, 'a').write('imported\\n')\n"
+                                                       "raise RuntimeError('Broken app info module')\n".format(self._markerPath))
+
+    #
+    ## @brief Get number of the times the broken app info module has been executed.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Count.
+    def _getImportCount(self):
+
+        if not os.path.isfile(self._markerPath):
+            return 0
+
+        with open(self._markerPath, 'r') as _file:
+            return len(_file.read().splitlines())
+
+    #
+    ## @brief Broken app info module is recorded once and skipped by the next listings.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testBrokenModuleSkipped(self):
+
+        ApplicationInfo = mApplication.applicationInfoAbs.ApplicationInfo
+
+        for index in range(3):
+            self.assertEqual([x.name() for x in ApplicationInfo.list() if x.asDict()['package'].endswith('Test')],
+                             ['LightMixer'])
+
+        self.assertEqual(self._getImportCount(), 1)
+
+        failedModules = [x for x in ApplicationInfo.getFailedModules()
+                         if os.path.realpath(x['filePath']) == os.path.realpath(self._brokenFilePath)]
+
+        self.assertEqual(len(failedModules), 1)
+        self.assertIsNone(failedModules[0]['className'])
+        self.assertIsInstance(failedModules[0]['error'], RuntimeError)
+        self.assertIn('Broken app info module', failedModules[0]['traceback'])
+
+    #
+    ## @brief Fixed app info module is imported again and removed from the negative cache.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testFixedModuleImportedAgain(self):
+
+        ApplicationInfo = mApplication.applicationInfoAbs.ApplicationInfo
+
+        ApplicationInfo.list()
+
+        _stat = os.stat(self._brokenFilePath)
+
+        with open(self._brokenFilePath, 'w') as _file:
+            _file.write(getAppInfoModuleSource([{'name': 'RenderQueue'}]))
+
+        # Modification time must differ even on file systems with coarse timestamps
+        os.utime(self._brokenFilePath, (_stat.st_atime, _stat.st_mtime + 10))
+
+        self.assertEqual(sorted([x.name() for x in ApplicationInfo.list() if x.asDict()['package'].endswith('Test')]),
+                         ['LightMixer', 'RenderQueue'])
+
+        self.assertEqual([x for x in ApplicationInfo.getFailedModules()
+                          if os.path.realpath(x['filePath']) == os.path.realpath(self._brokenFilePath)], [])
+
+    #
+    ## @brief App info class failed to be instantiated is recorded by its name, other classes of its module are listed.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testBrokenClassSkipped(self):
+
+        filePath = self._addPackage(self._searchPaths[0],
+                                    'mBrokenClassTest',
+                                    source=getAppInfoModuleSource([{'name': 'Compositor'}]) +
+                                           '\nclass BrokenApplicationInfo(mApplication.applicationInfoAbs.ApplicationInfo):\n'
+                                           '    def __init__(self):\n'
+                                           '        raise ValueError(\'Broken app info class\')\n')
+
+        ApplicationInfo = mApplication.applicationInfoAbs.ApplicationInfo
+
+        self.assertEqual([x.name() for x in ApplicationInfo.list(packageName='mBrokenClassTest')], ['Compositor'])
+        self.assertEqual([x.name() for x in ApplicationInfo.list(packageName='mBrokenClassTest')], ['Compositor'])
+
+        self.assertEqual([(x['className'], type(x['error'])) for x in ApplicationInfo.getFailedModules()
+                          if os.path.realpath(x['filePath']) == os.path.realpath(filePath)],
+                         [('BrokenApplicationInfo', ValueError)])
+
+#
+## @brief [ CLASS ] - Tests of listing applications from frozen catalog artifacts.
+class FrozenCatalogTest(ApplicationInfoTestCase):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create a test package.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        ApplicationInfoTestCase.setUp(self)
+
+        self._searchPath        = self._addSearchPath('root')
+        self._filePath          = self._addPackage(self._searchPath,
+                                                   'mFrozenTest',
+                                                   [{'name': 'LightMixer', 'parentApplications': ['maya']},
+                                                    {'name': 'RenderQueue'}])
+        self._catalogFilePath   = os.path.join(self._directory, 'catalog.json')
+
+    #
+    ## @brief Clear the catalog.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def tearDown(self):
+
+        os.environ.pop('MAPPLICATION_CATALOG_FILE', None)
+
+        ApplicationInfoTestCase.tearDown(self)
+
+    #
+    ## @brief Build and write the catalog artifact of the test package, and use it for listing.
+    #
+    #  Modules imported for building the catalog are removed from sys.modules, so listing can be checked not to
+    #  import them.
+    #
+    #  @param packageNames [ list of str | None | in  ] - Names of the packages, None means all packages.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _writeCatalog(self, packageNames=None):
+
+        mApplication.catalogLib.Catalog.build(packageNames=packageNames).write(self._catalogFilePath)
+
+        sys.modules.pop('mFrozenTest.mFrozenTestApplicationInfoLib', None)
+
+        os.environ['MAPPLICATION_CATALOG_FILE'] = self._catalogFilePath
+
+    #
+    ## @brief Applications are listed from the catalog without importing app info modules.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testListedFromCatalog(self):
+
+        self._writeCatalog()
+
+        # Catalog is frozen, so modifications of the packages aren't listed until it is written again
+        with open(self._filePath, 'w') as _file:
+            _file.write(getAppInfoModuleSource([{'name': 'Compositor'}]))
+
+        ApplicationInfo = mApplication.applicationInfoAbs.ApplicationInfo
+
+        appInfoList = ApplicationInfo.list(packageName='mFrozenTest', lazy=True)
+
+        self.assertEqual([x.name() for x in appInfoList], ['LightMixer', 'RenderQueue'])
+        self.assertEqual([x.isLoaded() for x in appInfoList], [False, False])
+        self.assertEqual([x.name() for x in ApplicationInfo.list(parentApplication='maya', lazy=True)], ['LightMixer'])
+        self.assertNotIn('mFrozenTest.mFrozenTestApplicationInfoLib', sys.modules)
+
+        self._writeCatalog()
+
+        self.assertEqual([x.name() for x in ApplicationInfo.list(packageName='mFrozenTest', lazy=True)], ['Compositor'])
+
+    #
+    ## @brief Catalog built for another environment isn't used.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testCatalogOfAnotherEnvironmentIgnored(self):
+
+        self._writeCatalog()
+
+        self.assertIsNotNone(mApplication.catalogLib.Catalog.load())
+
+        self._addPackage(self._addSearchPath('other'), 'mFrozenOtherTest', [{'name': 'Compositor'}])
+
+        self.assertIsNone(mApplication.catalogLib.Catalog.load())
+        self.assertEqual([x.name() for x in mApplication.applicationInfoAbs.ApplicationInfo.list(packageName='mFrozenOtherTest')],
+                         ['Compositor'])
+
+    #
+    ## @brief Catalog built for some packages is used only for them.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testCatalogOfSomePackages(self):
+
+        self._addPackage(self._searchPath, 'mFrozenOtherTest', [{'name': 'Compositor'}])
+
+        self._writeCatalog(packageNames=['mFrozenTest'])
+
+        ApplicationInfo = mApplication.applicationInfoAbs.ApplicationInfo
+
+        self.assertEqual([x.isLoaded() for x in ApplicationInfo.list(packageName='mFrozenTest', lazy=True)], [False, False])
+        # Other packages are searched, so their app info classes are instantiated instead of proxies
+        self.assertEqual([(x.name(), isinstance(x, mApplication.applicationInfoAbs.ApplicationInfoProxy))
+                          for x in ApplicationInfo.list(packageName='mFrozenOtherTest', lazy=True)],
+                         [('Compositor', False)])
+
+#
+## @brief [ CLASS ] - Tests of the pagination of the listed applications.
+class PaginationTest(ApplicationInfoTestCase):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create a test package, app info classes aren't in the order of the names of the applications.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        ApplicationInfoTestCase.setUp(self)
+
+        self._names = ['App{}'.format(x) for x in 'HCJAEBGIDF']
+
+        self._addPackage(self._addSearchPath('root'),
+                         'mPageTest',
+                         [{'name': x, 'keywords': ['even' if index % 2 else 'odd']} for index, x in enumerate(self._names)])
+
+        self._names.sort()
+
+    #
+    ## @brief Clear the catalog.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def tearDown(self):
+
+        os.environ.pop('MAPPLICATION_CATALOG_FILE', None)
+
+        ApplicationInfoTestCase.tearDown(self)
+
+    #
+    ## @brief List all pages of the applications of the test package.
+    #
+    #  @param pageSize [ int  | None  | in  ] - Number of applications in a page.
+    #  @param keyword  [ str  | None  | in  ] - Keyword to be searched.
+    #  @param lazy     [ bool | False | in  ] - List proxies if a catalog is available.
+    #
+    #  @exception N/A
+    #
+    #  @return list of list - Names of the applications in each page, the last page is empty.
+    def _listPages(self, pageSize, keyword=None, lazy=False):
+
+        pages = []
+
+        while not pages or pages[-1]:
+            pages.append([x.name() for x in mApplication.applicationInfoAbs.ApplicationInfo.list(packageName='mPageTest',
+                                                                                                  keyword=keyword,
+                                                                                                  limit=pageSize,
+                                                                                                  offset=len(pages) * pageSize,
+                                                                                                  lazy=lazy)])
+
+        return pages
+
+    #
+    ## @brief Pages contain the applications in the order of their names, with and without a catalog.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testPages(self):
+
+        for useCatalog in (False, True):
+
+            if useCatalog:
+                catalogFilePath = os.path.join(self._directory, 'catalog.json')
+                mApplication.catalogLib.Catalog.build().write(catalogFilePath)
+                os.environ['MAPPLICATION_CATALOG_FILE'] = catalogFilePath
+
+            self.assertEqual(self._listPages(3, lazy=useCatalog), [self._names[0:3],
+                                                                   self._names[3:6],
+                                                                   self._names[6:9],
+                                                                   self._names[9:],
+                                                                   []])
+
+            self.assertEqual(self._listPages(4, keyword='odd', lazy=useCatalog),
+                             [['AppD', 'AppE', 'AppG', 'AppH'], ['AppJ'], []])
+
+    #
+    ## @brief Limit and offset are applied to the applications matching the filters.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testLimitAndOffset(self):
+
+        ApplicationInfo = mApplication.applicationInfoAbs.ApplicationInfo
+
+        self.assertEqual([x.name() for x in ApplicationInfo.list(packageName='mPageTest', offset=8)], self._names[8:])
+        self.assertEqual([x.name() for x in ApplicationInfo.list(packageName='mPageTest', limit=20)], self._names)
+        self.assertEqual(ApplicationInfo.list(packageName='mPageTest', limit=0), [])
+        self.assertEqual(ApplicationInfo.list(packageName='mPageTest', limit=2, offset=10), [])
+
+        self.assertEqual(mApplication.catalogLib.selectRange([5, 3, 9, 1], limit=2, offset=-1), [1, 3])
+        self.assertEqual(mApplication.catalogLib.selectRange(iter([5, 3, 9, 1]), key=lambda x: -x, offset=1), [5, 3, 1])
+
+#
+## @brief [ CLASS ] - Tests of listing applications for several queries at once.
+class ListManyTest(ApplicationInfoTestCase):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create two test packages, applications of which run in different parent applications.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        ApplicationInfoTestCase.setUp(self)
+
+        searchPath = self._addSearchPath('root')
+
+        self._addPackage(searchPath,
+                         'mManyTest',
+                         [{'name': 'LightMixer', 'parentApplications': ['maya', 'nuke']},
+                          {'name': 'RenderQueue', 'parentApplications': ['nuke'], 'keywords': ['render']}])
+
+        self._addPackage(searchPath,
+                         'mManyOtherTest',
+                         source=getAppInfoModuleSource([{'name': 'Compositor', 'parentApplications': ['maya']}]) +
+                                '\nclass InactiveApplicationInfo(CompositorApplicationInfo):\n'
+                                '    def __init__(self):\n'
+                                '        CompositorApplicationInfo.__init__(self)\n'
+                                '        self._name = \'Inactive\'\n'
+                                '        self._isActive = False\n')
+
+        self._queries = [{'parentApplication': 'maya'},
+                         {'parentApplication': 'nuke'},
+                         {'packageName': 'mManyTest', 'keyword': 'render'},
+                         {'parentApplication': 'maya', 'ignoreInactive': False},
+                         {'parentApplication': 'houdini'}]
+
+    #
+    ## @brief Clear the catalog.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def tearDown(self):
+
+        os.environ.pop('MAPPLICATION_CATALOG_FILE', None)
+
+        ApplicationInfoTestCase.tearDown(self)
+
+    #
+    ## @brief Results of the queries are the same as the ones listed one by one, with and without a catalog.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testSameAsList(self):
+
+        ApplicationInfo = mApplication.applicationInfoAbs.ApplicationInfo
+
+        expected = [[x.name() for x in ApplicationInfo.list(**query) if x.asDict()['package'].startswith('mMany')]
+                    for query in self._queries]
+
+        self.assertEqual(expected, [['Compositor', 'LightMixer'],
+                                    ['LightMixer', 'RenderQueue'],
+                                    ['RenderQueue'],
+                                    ['Compositor', 'Inactive', 'LightMixer'],
+                                    []])
+
+        for useCatalog in (False, True):
+
+            if useCatalog:
+                catalogFilePath = os.path.join(self._directory, 'catalog.json')
+                mApplication.catalogLib.Catalog.build().write(catalogFilePath)
+                os.environ['MAPPLICATION_CATALOG_FILE'] = catalogFilePath
+
+            appInfoLists = ApplicationInfo.listMany(self._queries, lazy=useCatalog)
+
+            self.assertEqual([[x.name() for x in y if x.asDict()['package'].startswith('mMany')] for y in appInfoLists],
+                             expected)
+
+    #
+    ## @brief Applications matching several queries are shared by their results.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testSharedInstances(self):
+
+        mayaList, nukeList = mApplication.applicationInfoAbs.ApplicationInfo.listMany([{'parentApplication': 'maya'},
+                                                                                       {'parentApplication': 'nuke'}])
+
+        self.assertIs([x for x in mayaList if x.name() == 'LightMixer'][0],
+                      [x for x in nukeList if x.name() == 'LightMixer'][0])
+
+        self.assertEqual(mApplication.applicationInfoAbs.ApplicationInfo.listMany([]), [])
+
+#
+## @brief [ CLASS ] - Tests of the typo tolerant search of the applications.
+class FuzzySearchTest(ApplicationInfoTestCase):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create two releases of a test package.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        ApplicationInfoTestCase.setUp(self)
+
+        for name, versionMajor in [('first', 1), ('second', 2)]:
+            self._addPackage(self._addSearchPath(name),
+                             'mFuzzyTest',
+                             [{'name': 'LightMixer', 'versionMajor': versionMajor, 'parentApplications': ['maya']},
+                              {'name': 'LightRig', 'versionMajor': versionMajor, 'keywords': ['rig']},
+                              {'name': 'RenderQueue', 'versionMajor': versionMajor, 'keywords': ['render']}])
+
+    #
+    ## @brief Clear the catalog.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def tearDown(self):
+
+        os.environ.pop('MAPPLICATION_CATALOG_FILE', None)
+
+        ApplicationInfoTestCase.tearDown(self)
+
+    #
+    ## @brief Search gives the same ranking with and without a catalog.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testSearch(self):
+
+        ApplicationInfo = mApplication.applicationInfoAbs.ApplicationInfo
+
+        for useCatalog in (False, True):
+
+            if useCatalog:
+                catalogFilePath = os.path.join(self._directory, 'catalog.json')
+                mApplication.catalogLib.Catalog.build().write(catalogFilePath)
+                os.environ['MAPPLICATION_CATALOG_FILE'] = catalogFilePath
+
+            search = lambda text, **kwargs: [(x.name(), x.versionStr())
+                                             for score, x in ApplicationInfo.fuzzySearch(text,
+                                                                                         packageName='mFuzzyTest',
+                                                                                         lazy=useCatalog,
+                                                                                         **kwargs)]
+
+            self.assertEqual(search('lightmixr', latestOnly=True)[:1], [('LightMixer', '2.0.0')])
+            self.assertEqual(search('light', latestOnly=True, top=2), [('LightMixer', '2.0.0'), ('LightRig', '2.0.0')])
+            self.assertEqual(search('light', parentApplication='maya'), [('LightMixer', '1.0.0'), ('LightMixer', '2.0.0')])
+            self.assertEqual(search('rendr', threshold=0.9), [])
+
+#
+## @brief [ CLASS ] - Tests of listing applications by their developers and documents.
+class OwnershipTest(ApplicationInfoTestCase):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create a test package, applications of which have different developers and documents.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        ApplicationInfoTestCase.setUp(self)
+
+        soner = {'userName': 'soner', 'name': 'Safak', 'email': 'Soner@Example.com', 'web': ''}
+        other = {'userName': 'other', 'name': 'Other', 'email': 'other@example.com', 'web': ''}
+
+        self._addPackage(self._addSearchPath('root'),
+                         'mOwnerTest',
+                         [{'name'               : 'LightMixer',
+                           'parentApplications' : ['maya'],
+                           'developers'         : [soner],
+                           'documents'          : [{'title': 'Manual', 'url': 'http://doc/lightMixer/'}]},
+                          {'name'               : 'RenderQueue',
+                           'developers'         : [other, soner],
+                           'documents'          : [{'title': 'Manual', 'url': 'http://doc/renderQueue'}]},
+                          {'name'               : 'Compositor',
+                           'developers'         : [other]}])
+
+    #
+    ## @brief Clear the catalog.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def tearDown(self):
+
+        os.environ.pop('MAPPLICATION_CATALOG_FILE', None)
+
+        ApplicationInfoTestCase.tearDown(self)
+
+    #
+    ## @brief Applications matching all given developers and documents are listed, with and without a catalog.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testListByOwnership(self):
+
+        for useCatalog in (False, True):
+
+            if useCatalog:
+                catalogFilePath = os.path.join(self._directory, 'catalog.json')
+                mApplication.catalogLib.Catalog.build().write(catalogFilePath)
+                os.environ['MAPPLICATION_CATALOG_FILE'] = catalogFilePath
+
+            listNames = lambda **kwargs: [x.name() for x in mApplication.applicationInfoAbs.ApplicationInfo.listByOwnership(
+                packageName='mOwnerTest', lazy=useCatalog, **kwargs)]
+
+            self.assertEqual(listNames(developer='SONER'), ['LightMixer', 'RenderQueue'])
+            self.assertEqual(listNames(email='soner@example.com'), ['LightMixer', 'RenderQueue'])
+            self.assertEqual(listNames(developer='other'), ['Compositor', 'RenderQueue'])
+            self.assertEqual(listNames(documentUrl='http://doc/lightMixer'), ['LightMixer'])
+            self.assertEqual(listNames(documentUrl='http://doc/renderQueue/', developer='soner'), ['RenderQueue'])
+            self.assertEqual(listNames(developer='soner', parentApplication='maya'), ['LightMixer'])
+            self.assertEqual(listNames(developer='nobody'), [])
+
+    #
+    ## @brief Secondary indexes of the catalog are keyed by normalized values.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testSecondaryIndexes(self):
+
+        _catalog = mApplication.catalogLib.Catalog.build(packageNames=['mOwnerTest'])
+
+        getIndex = lambda index: dict([(key, [x['name'] for x in value])
+                                       for key, value in _catalog.getSecondaryIndex(index).items()])
+
+        self.assertEqual(getIndex(mApplication.catalogLib.INDEX_DEVELOPER), {'soner' : ['LightMixer', 'RenderQueue'],
+                                                                             'other' : ['Compositor', 'RenderQueue']})
+        self.assertEqual(getIndex(mApplication.catalogLib.INDEX_EMAIL),
+                         {'soner@example.com' : ['LightMixer', 'RenderQueue'],
+                          'other@example.com' : ['Compositor', 'RenderQueue']})
+        self.assertEqual(getIndex(mApplication.catalogLib.INDEX_DOCUMENT_URL), {'http://doc/lightMixer'  : ['LightMixer'],
+                                                                                'http://doc/renderQueue' : ['RenderQueue']})
+
+        self.assertEqual([x['name'] for x in _catalog.findBySecondaryKeys()], ['Compositor', 'LightMixer', 'RenderQueue'])
+
+        with self.assertRaises(ValueError):
+            _catalog.getSecondaryIndex('unknown')
+
+#
+## @brief [ CLASS ] - Tests of the packages with the same name in several search paths.
+class ShadowedPackageTest(ApplicationInfoTestCase):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create two releases of the same package in two search paths.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        ApplicationInfoTestCase.setUp(self)
+
+        self._firstFilePath  = os.path.realpath(self._addPackage(self._addSearchPath('first'),
+                                                                 'mShadowTest',
+                                                                 [{'name': 'LightMixer', 'versionMajor': 2},
+                                                                  {'name': 'RenderQueue'}]))
+
+        self._secondFilePath = os.path.realpath(self._addPackage(self._addSearchPath('second'),
+                                                                 'mShadowTest',
+                                                                 [{'name': 'LightMixer', 'versionMajor': 3}]))
+
+    #
+    ## @brief Each release is listed once from its own app info module.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testReleasesLoadedFromTheirOwnFiles(self):
+
+        appInfoList = mApplication.applicationInfoAbs.ApplicationInfo.list(packageName='mShadowTest')
+
+        self.assertEqual(sorted(self._describe(appInfoList)), [('LightMixer', '2.0.0', self._firstFilePath),
+                                                              ('LightMixer', '3.0.0', self._secondFilePath),
+                                                              ('RenderQueue', '1.0.0', self._firstFilePath)])
+
+        # Importing by name still provides the first release
+        self.assertTrue(sys.modules['mShadowTest.mShadowTestApplicationInfoLib'].__file__.startswith(
+            os.path.dirname(self._firstFilePath)))
+
+    #
+    ## @brief A symbolic link to a search path doesn't list its packages again.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testSymbolicLinkToSearchPath(self):
+
+        linkPath = os.path.join(self._directory, 'link')
+        os.symlink(self._searchPaths[0], linkPath)
+
+        sys.path.insert(0, linkPath)
+        self._searchPaths.append(linkPath)
+
+        appInfoList = mApplication.applicationInfoAbs.ApplicationInfo.list(packageName='mShadowTest')
+
+        self.assertEqual(len(appInfoList), 3)
+        self.assertEqual(sorted([x.versionStr() for x in appInfoList if x.name() == 'LightMixer']), ['2.0.0', '3.0.0'])
+
+    #
+    ## @brief Applications loaded from the metadata of a shadowed release are the same release.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testShadowedReleaseLoadedFromRecord(self):
+
+        record = [x.asDict() for x in mApplication.applicationInfoAbs.ApplicationInfo.list(packageName='mShadowTest')
+                  if x.versionMajor() == 3][0]
+
+        _proxy = mApplication.applicationInfoAbs.ApplicationInfoProxy(record)
+
+        self.assertEqual(_proxy.getInstance().versionStr(), '3.0.0')
+        self.assertEqual(os.path.realpath(_proxy.getInstance().asDict()['filePath']), self._secondFilePath)
+
+
+#
+## @brief [ CLASS ] - Tests of the version lookups for releases of a package in several search paths.
+class VersionTest(ApplicationInfoTestCase):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create three releases of the same package, the latest one isn't the first on sys.path.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        ApplicationInfoTestCase.setUp(self)
+
+        self._filePaths = {}
+
+        for name, versionMajor in [('first', 2), ('second', 3), ('third', 1)]:
+            filePath = self._addPackage(self._addSearchPath(name),
+                                        'mVersionTest',
+                                        [{'name': 'LightMixer', 'versionMajor': versionMajor},
+                                         {'name': 'RenderQueue', 'versionMajor': versionMajor}])
+
+            self._filePaths[versionMajor] = os.path.realpath(filePath)
+
+    #
+    ## @brief Clear the catalog.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def tearDown(self):
+
+        os.environ.pop('MAPPLICATION_CATALOG_FILE', None)
+
+        ApplicationInfoTestCase.tearDown(self)
+
+    #
+    ## @brief Write a catalog of the test packages and use it for listing.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _useCatalog(self):
+
+        catalogFilePath = os.path.join(self._directory, 'catalog.json')
+
+        mApplication.catalogLib.Catalog.build().write(catalogFilePath)
+
+        os.environ['MAPPLICATION_CATALOG_FILE'] = catalogFilePath
+
+    #
+    ## @brief The latest release is found in a later search path by searching the packages.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testFindWithoutCatalog(self):
+
+        ApplicationInfo = mApplication.applicationInfoAbs.ApplicationInfo
+
+        self.assertEqual(self._describe([ApplicationInfo.findLatest('LightMixer')]),
+                         [('LightMixer', '3.0.0', self._filePaths[3])])
+
+        self.assertEqual(self._describe([ApplicationInfo.findVersion('LightMixer', (1, 0, 0))]),
+                         [('LightMixer', '1.0.0', self._filePaths[1])])
+
+        self.assertEqual([x.versionStr() for x in ApplicationInfo.findVersionRange('LightMixer', minimum=(2, 0, 0))],
+                         ['3.0.0', '2.0.0'])
+
+        self.assertIsNone(ApplicationInfo.findVersion('LightMixer', (4, 0, 0)))
+
+    #
+    ## @brief Version index of the catalog finds the latest release without importing the other releases.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testFindWithCatalog(self):
+
+        self._useCatalog()
+
+        ApplicationInfo = mApplication.applicationInfoAbs.ApplicationInfo
+
+        _proxy = ApplicationInfo.findLatest('LightMixer', lazy=True)
+
+        self.assertFalse(_proxy.isLoaded())
+        self.assertEqual(self._describe([_proxy.getInstance()]), [('LightMixer', '3.0.0', self._filePaths[3])])
+
+        self.assertEqual([x.versionStr() for x in ApplicationInfo.findVersionRange('LightMixer',
+                                                                                   minimum=(1, 0, 0),
+                                                                                   maximum=(3, 0, 0))],
+                         ['2.0.0', '1.0.0'])
+
+    #
+    ## @brief Only the latest release of each application is listed, with and without a catalog.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testLatestOnly(self):
+
+        ApplicationInfo = mApplication.applicationInfoAbs.ApplicationInfo
+
+        expected = [('LightMixer', '3.0.0', self._filePaths[3]), ('RenderQueue', '3.0.0', self._filePaths[3])]
+
+        self.assertEqual(len(ApplicationInfo.list(packageName='mVersionTest')), 6)
+        self.assertEqual(self._describe(ApplicationInfo.list(packageName='mVersionTest', latestOnly=True)), expected)
+
+        self._useCatalog()
+
+        appInfoList = ApplicationInfo.list(packageName='mVersionTest', latestOnly=True, lazy=True)
+
+        self.assertEqual([(x.name(), x.versionStr(), os.path.realpath(x.asDict()['filePath'])) for x in appInfoList],
+                         expected)
+        self.assertEqual([x.isLoaded() for x in appInfoList], [False, False])
+        self.assertEqual(self._describe(ApplicationInfo.list(packageName='mVersionTest', latestOnly=True, limit=1)),
+                         expected[:1])
+
+if __name__ == '__main__':
+    unittest.main()
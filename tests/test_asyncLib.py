@@ -0,0 +1,137 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_asyncLib.py @brief [ FILE   ] - Tests of mApplication.asyncLib module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import asyncio
+import unittest
+
+import mApplication.applicationInfoAbs
+import mApplication.asyncLib
+
+import test_applicationInfoAbs
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ float ] - Time in seconds each app info module of the test packages takes to be imported.
+IMPORT_DURATION = 0.1
+
+#
+## @brief [ CLASS ] - Tests of the asyncio API for application discovery.
+class AsyncTest(test_applicationInfoAbs.ApplicationInfoTestCase):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create test packages, app info modules of which are slow to be imported.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        test_applicationInfoAbs.ApplicationInfoTestCase.setUp(self)
+
+        searchPath = self._addSearchPath('root')
+
+        for index in range(3):
+            self._addPackage(searchPath,
+                             'mAsyncTest{}'.format(index),
+                             source='import time\ntime.sleep({})\n{}'.format(
+                                 IMPORT_DURATION,
+                                 test_applicationInfoAbs.getAppInfoModuleSource([{'name': 'App{}x{}'.format(index, x),
+                                                                                  'parentApplications': ['maya']}
+                                                                                 for x in range(2)])))
+
+    #
+    ## @brief Applications listed asynchronously are the same as the ones listed synchronously.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testList(self):
+
+        async def listApplications():
+            return await mApplication.asyncLib.alist(parentApplication='maya', limit=3, offset=2)
+
+        self.assertEqual([x.name() for x in asyncio.run(listApplications())], ['App1x0', 'App1x1', 'App2x0'])
+        self.assertEqual([x.name() for x in mApplication.applicationInfoAbs.ApplicationInfo.list(parentApplication='maya',
+                                                                                                 limit=3,
+                                                                                                 offset=2)],
+                         ['App1x0', 'App1x1', 'App2x0'])
+
+    #
+    ## @brief Event loop keeps running other tasks while app info modules are imported.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testEventLoopNotBlocked(self):
+
+        ticks = []
+
+        async def tick(task):
+            while not task.done():
+                ticks.append(None)
+                await asyncio.sleep(0.01)
+
+        async def listApplications():
+            task = asyncio.ensure_future(mApplication.asyncLib.alist(parentApplication='maya'))
+            await tick(task)
+            return await task
+
+        self.assertEqual(len(asyncio.run(listApplications())), 6)
+
+        # Modules are imported for at least three times IMPORT_DURATION, ticks run every 10 milliseconds meanwhile
+        self.assertGreater(len(ticks), 10)
+
+    #
+    ## @brief Discovery cancelled while an app info module is imported doesn't prevent the next ones.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testCancel(self):
+
+        async def listApplications():
+
+            task = asyncio.ensure_future(mApplication.asyncLib.alist(parentApplication='maya'))
+            await asyncio.sleep(IMPORT_DURATION / 2)
+
+            task.cancel()
+
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+            return await asyncio.wait_for(mApplication.asyncLib.alist(parentApplication='maya'), timeout=10)
+
+        self.assertEqual(len(asyncio.run(listApplications())), 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,218 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_binaryCatalogLib.py @brief [ FILE   ] - Tests of mApplication.binaryCatalogLib module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+import mApplication.catalogLib
+import mApplication.binaryCatalogLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+#
+## @brief Get metadata of a test application.
+#
+#  @param name   [ str  | None | in  ] - Name of the application.
+#  @param values [ dict | None | in  ] - Values of the other fields.
+#
+#  @exception N/A
+#
+#  @return dict - Metadata, @see mApplication.applicationInfoAbs.ApplicationInfo.asDict.
+def getRecord(name, **values):
+
+    record = {'package'             : 'mBinaryTest',
+              'packagePath'         : '/tmp/mBinaryTest',
+              'module'              : 'mBinaryTest.mBinaryTestApplicationInfoLib',
+              'className'           : '{}ApplicationInfo'.format(name),
+              'filePath'            : '/tmp/mBinaryTest/mBinaryTestApplicationInfoLib.py',
+              'name'                : name,
+              'versionMajor'        : 1,
+              'versionMinor'        : 0,
+              'versionFix'          : 0,
+              'versionStr'          : '1.0.0',
+              'windowTitle'         : '{} - 1.0.0'.format(name),
+              'isActive'            : True,
+              'description'         : '',
+              'iconFileName'        : '',
+              'iconFilePath'        : '',
+              'usePlatformIcon'     : False,
+              'parentApplications'  : ['standalone'],
+              'keywords'            : ['test'],
+              'isGUI'               : False,
+              'runAsPanelInNuke'    : False,
+              'documents'           : [],
+              'pythonCommand'       : '',
+              'command'             : '',
+              'menuPath'            : '',
+              'fullMenuPath'        : '',
+              'menuSeparatorBefore' : False,
+              'menuSeparatorAfter'  : False,
+              'developers'          : []}
+
+    record.update(values)
+
+    return record
+
+#
+## @brief [ CLASS ] - Tests of mApplication.binaryCatalogLib.MappedCatalog class.
+class MappedCatalogTest(unittest.TestCase):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Write a binary catalog of test applications into a temporary directory.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        self._directory = tempfile.mkdtemp(prefix='mApplicationBinaryTest')
+        self._filePath  = os.path.join(self._directory, 'catalog.mcat')
+
+        self._catalog   = mApplication.catalogLib.Catalog(
+            records=[getRecord('RenderQueue', keywords=['render', 'farm'], parentApplications=['nuke', 'maya']),
+                     getRecord('lightMixer', keywords=['light'], parentApplications=['maya'], description=u'I\u015f\u0131k'),
+                     getRecord('Zeta', isActive=False, keywords=['render']),
+                     getRecord('Compositor', package='mOtherTest', keywords=['comp'],
+                               documents=[{'title': 'Doc', 'url': 'http://doc/comp'}])],
+            environment={'pythonVersion': '3.0', 'paths': ['/tmp']})
+
+        self._catalogs  = []
+
+        mApplication.binaryCatalogLib.write(self._catalog, self._filePath)
+
+    #
+    ## @brief Close the mapped catalogs and remove the temporary directory.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def tearDown(self):
+
+        for _catalog in self._catalogs:
+            _catalog.close()
+
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    #
+    ## @brief Map the test catalog.
+    #
+    #  @exception N/A
+    #
+    #  @return mApplication.binaryCatalogLib.MappedCatalog - Catalog.
+    def _open(self):
+
+        _catalog = mApplication.binaryCatalogLib.MappedCatalog(self._filePath)
+
+        self._catalogs.append(_catalog)
+
+        return _catalog
+
+    #
+    ## @brief Mapped catalog provides the written metadata and environment.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testRoundTrip(self):
+
+        _catalog = self._open()
+
+        key = lambda x: x['name']
+
+        self.assertEqual(len(_catalog), 4)
+        self.assertEqual(sorted(_catalog.records(), key=key), sorted(self._catalog.records(), key=key))
+        self.assertEqual(_catalog.environment(), self._catalog.environment())
+
+        self.assertTrue(mApplication.binaryCatalogLib.isBinaryCatalog(self._filePath))
+
+        # Binary catalogs can be converted back into JSON
+        jsonFilePath = os.path.join(self._directory, 'catalog.json')
+        _catalog.write(jsonFilePath)
+
+        self.assertFalse(mApplication.binaryCatalogLib.isBinaryCatalog(jsonFilePath))
+        self.assertEqual(sorted(mApplication.catalogLib.Catalog.read(jsonFilePath).records(), key=key),
+                         sorted(self._catalog.records(), key=key))
+
+    #
+    ## @brief Lookups in the mapped buffer give the same results as the in-memory catalog.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testQuery(self):
+
+        _catalog = self._open()
+
+        for filters in [{},
+                        {'ignoreInactive': False},
+                        {'parentApplication': 'maya'},
+                        {'keyword': 'render'},
+                        {'keyword': 'mix'},
+                        {'keyword': 'render', 'ignoreInactive': False, 'limit': 1, 'offset': 1},
+                        {'packageName': 'MOTHERTEST'},
+                        {'ignoreInactive': False, 'limit': 2, 'offset': 1}]:
+
+            self.assertEqual([x['name'] for x in _catalog.query(**filters)],
+                             [x['name'] for x in self._catalog.query(**filters)],
+                             filters)
+
+        self.assertEqual([x['name'] for x in _catalog.findByName('LIGHTMIXER')], ['lightMixer'])
+        self.assertEqual(sorted([x['name'] for x in _catalog.findByKeyword('render')]), ['RenderQueue', 'Zeta'])
+        self.assertEqual(_catalog.findByKeyword('missing'), [])
+
+    #
+    ## @brief Files, which aren't binary catalogs of the current format version, aren't read.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testInvalidFile(self):
+
+        with open(self._filePath, 'r+b') as _file:
+            _file.seek(len(mApplication.binaryCatalogLib.MAGIC))
+            _file.write(b'\xff\xff\xff\xff')
+
+        with self.assertRaises(ValueError):
+            self._open()
+
+        self.assertIsNone(mApplication.catalogLib.Catalog.read(self._filePath))
+
+        with open(self._filePath, 'wb') as _file:
+            _file.write(mApplication.binaryCatalogLib.MAGIC)
+
+        self.assertIsNone(mApplication.catalogLib.Catalog.read(self._filePath))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,213 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_catalogDiffLib.py @brief [ FILE   ] - Tests of mApplication.catalogDiffLib module.
+#
+#  Two releases of the test packages are created in two search paths, which are compared as environments and as
+#  catalog artifacts.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+import mApplication.catalogDiffLib
+import mApplication.environmentScanLib
+
+import test_applicationInfoAbs
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ list of str ] - Names of the test packages.
+PACKAGE_NAMES = ['mDiffTest', 'mDiffSameTest']
+
+#
+## @brief [ CLASS ] - Tests of mApplication.catalogDiffLib.CatalogDiff class.
+class CatalogDiffTest(unittest.TestCase):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create the old and the new releases of the test packages.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        self._directory = os.path.realpath(tempfile.mkdtemp(prefix='mApplicationDiffTest'))
+        self._oldPath   = os.path.join(self._directory, 'old')
+        self._newPath   = os.path.join(self._directory, 'new')
+
+        self._addPackage(self._oldPath, 'mDiffTest', [{'name': 'LightMixer', 'parentApplications': ['maya']},
+                                                      {'name': 'RenderQueue'}])
+
+        self._addPackage(self._newPath, 'mDiffTest', [{'name': 'LightMixer', 'versionMajor': 2,
+                                                       'parentApplications': ['maya', 'nuke']},
+                                                      {'name': 'Painter'}])
+
+        for path in (self._oldPath, self._newPath):
+            self._addPackage(path, 'mDiffSameTest', [{'name': 'Compositor'}])
+
+    #
+    ## @brief Remove the temporary directory.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def tearDown(self):
+
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    #
+    ## @brief Create a test package in given search path.
+    #
+    #  @param searchPath   [ str          | None | in  ] - Absolute path of the search path.
+    #  @param packageName  [ str          | None | in  ] - Name of the package.
+    #  @param applications [ list of dict | None | in  ] - Applications, @see test_applicationInfoAbs.getAppInfoModuleSource.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _addPackage(self, searchPath, packageName, applications):
+
+        packagePath = os.path.join(searchPath, packageName)
+        os.makedirs(packagePath)
+
+        for fileName, source in [('__init__.py', ''),
+                                 ('packageInfoLib.py', "NAME = '{}'\n".format(packageName)),
+                                 ('{}ApplicationInfoLib.py'.format(packageName),
+                                  test_applicationInfoAbs.getAppInfoModuleSource(applications))]:
+
+            with open(os.path.join(packagePath, fileName), 'w') as _file:
+                _file.write(source)
+
+    #
+    ## @brief Get environment source of given search path, search paths of the current interpreter are appended.
+    #
+    #  @param path [ str | None | in  ] - Search path of the test packages.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Search paths separated by os.pathsep.
+    def _getSource(self, path):
+
+        return os.pathsep.join([path] + [x for x in sys.path if x])
+
+    #
+    ## @brief Write catalog artifact of the test packages in given search path.
+    #
+    #  @param path [ str | None | in  ] - Search path of the test packages.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the artifact.
+    def _writeCatalog(self, path):
+
+        filePath = os.path.join(self._directory, '{}.json'.format(os.path.basename(path)))
+
+        scanner  = mApplication.environmentScanLib.EnvironmentScanner(cacheDirectory='')
+        scanner.scan(self._getSource(path).split(os.pathsep), packageNames=PACKAGE_NAMES).write(filePath)
+
+        return filePath
+
+    #
+    ## @brief Check the differences between the old and the new releases.
+    #
+    #  @param catalogDiff [ mApplication.catalogDiffLib.CatalogDiff | None | in  ] - Differences.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _checkDiff(self, catalogDiff):
+
+        # Packages of the current interpreter may be listed as well if an environment is compared with an artifact
+        data = dict([(key, [x for x in value if x['package'] in PACKAGE_NAMES]) if key != 'unchangedPackages' else (key, value)
+                     for key, value in catalogDiff.asDict().items()])
+
+        self.assertFalse(catalogDiff.isEmpty())
+        self.assertEqual([x['name'] for x in data['added']], ['Painter'])
+        self.assertEqual([x['name'] for x in data['removed']], ['RenderQueue'])
+        self.assertEqual([(x['name'], x['oldVersion'], x['newVersion']) for x in data['versionChanged']],
+                         [('LightMixer', '1.0.0', '2.0.0')])
+        self.assertEqual([(x['name'], x['oldParentApplications'], x['newParentApplications'])
+                          for x in data['parentApplicationsChanged']],
+                         [('LightMixer', ['maya'], ['maya', 'nuke'])])
+
+        # Identical packages in both releases aren't compared
+        self.assertIn('mDiffSameTest', data['unchangedPackages'])
+        self.assertNotIn('mDiffTest', data['unchangedPackages'])
+
+    #
+    ## @brief Environments are compared by scanning only the changed packages.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testEnvironments(self):
+
+        self._checkDiff(mApplication.catalogDiffLib.CatalogDiff.fromSources(self._getSource(self._oldPath),
+                                                                            self._getSource(self._newPath)))
+
+        self.assertTrue(mApplication.catalogDiffLib.CatalogDiff.fromSources(self._getSource(self._newPath),
+                                                                            self._getSource(self._newPath)).isEmpty())
+
+    #
+    ## @brief Catalog artifacts are compared with each other and with environments.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testCatalogArtifacts(self):
+
+        oldFilePath = self._writeCatalog(self._oldPath)
+        newFilePath = self._writeCatalog(self._newPath)
+
+        self._checkDiff(mApplication.catalogDiffLib.CatalogDiff.fromSources(oldFilePath, newFilePath))
+        self._checkDiff(mApplication.catalogDiffLib.CatalogDiff.fromSources(oldFilePath, self._getSource(self._newPath)))
+
+    #
+    ## @brief Catalog artifacts, which can't be read, are reported.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testInvalidArtifact(self):
+
+        filePath = os.path.join(self._directory, 'invalid.json')
+
+        with open(filePath, 'w') as _file:
+            _file.write('{')
+
+        with self.assertRaises(ValueError):
+            mApplication.catalogDiffLib.CatalogDiff.fromSources(filePath, self._getSource(self._newPath))
+
+
+if __name__ == '__main__':
+    unittest.main()
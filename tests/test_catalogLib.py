@@ -0,0 +1,227 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_catalogLib.py @brief [ FILE   ] - Tests of mApplication.catalogLib module.
+#
+#  Snapshots of the catalog store are queried by several threads while they are refreshed from JSON, binary and
+#  SQLite catalogs.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import time
+import shutil
+import tempfile
+import unittest
+import threading
+
+import mApplication.catalogLib
+import mApplication.binaryCatalogLib
+import mApplication.sqliteCatalogLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ int ] - Number of the refreshes.
+REFRESH_COUNT   = 12
+
+## [ int ] - Number of the threads querying snapshots.
+READER_COUNT    = 4
+
+#
+## @brief Get metadata of a test application.
+#
+#  @param generation [ int | None | in  ] - Generation of the catalog the application belongs to.
+#  @param index      [ int | None | in  ] - Index of the application.
+#
+#  @exception N/A
+#
+#  @return dict - Metadata, @see mApplication.applicationInfoAbs.ApplicationInfo.asDict.
+def getRecord(generation, index):
+
+    return {'package'             : 'mCatalogTest',
+            'packagePath'         : '/tmp/mCatalogTest',
+            'module'              : 'mCatalogTest.mCatalogTestApplicationInfoLib',
+            'className'           : 'App{}x{}ApplicationInfo'.format(generation, index),
+            'filePath'            : '/tmp/mCatalogTest/mCatalogTestApplicationInfoLib.py',
+            'name'                : 'App{}x{}'.format(generation, index),
+            'versionMajor'        : 1,
+            'versionMinor'        : 0,
+            'versionFix'          : 0,
+            'versionStr'          : '1.0.0',
+            'windowTitle'         : '',
+            'isActive'            : True,
+            'description'         : '',
+            'iconFileName'        : '',
+            'iconFilePath'        : '',
+            'usePlatformIcon'     : False,
+            'parentApplications'  : ['standalone'],
+            'keywords'            : ['test'],
+            'isGUI'               : False,
+            'runAsPanelInNuke'    : False,
+            'documents'           : [],
+            'pythonCommand'       : '',
+            'command'             : '',
+            'menuPath'            : '',
+            'fullMenuPath'        : '',
+            'menuSeparatorBefore' : False,
+            'menuSeparatorAfter'  : False,
+            'developers'          : []}
+
+#
+## @brief [ CLASS ] - Tests of mApplication.catalogLib.CatalogStore class.
+class CatalogStoreTest(unittest.TestCase):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create the temporary directory for the catalog artifacts.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        self._directory   = tempfile.mkdtemp(prefix='mApplicationCatalogTest')
+        self._environment = mApplication.catalogLib.Catalog.getEnvironment(paths=[self._directory])
+        self._generation  = 0
+        self._catalogs    = []
+
+    #
+    ## @brief Close the catalogs and remove the temporary directory.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def tearDown(self):
+
+        for _catalog in self._catalogs:
+            _catalog.close()
+
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    #
+    ## @brief Load a new catalog, backends are used in turn and each catalog has one more application than the
+    #  previous one.
+    #
+    #  @exception N/A
+    #
+    #  @return mApplication.catalogLib.Catalog - Catalog.
+    def _load(self):
+
+        generation        = self._generation
+        self._generation += 1
+
+        _catalog = mApplication.catalogLib.Catalog(records=[getRecord(generation, x) for x in range(generation + 1)],
+                                                   environment=dict(self._environment))
+
+        if generation % 3 == 1:
+            filePath = os.path.join(self._directory, 'catalog.mcat')
+            mApplication.binaryCatalogLib.write(_catalog, filePath)
+            _catalog = mApplication.binaryCatalogLib.MappedCatalog(filePath)
+            self._catalogs.append(_catalog)
+
+        elif generation % 3 == 2:
+            filePath = os.path.join(self._directory, 'catalog.db')
+            mApplication.sqliteCatalogLib.write(_catalog, filePath)
+            _catalog = mApplication.sqliteCatalogLib.SQLiteCatalog(filePath)
+            self._catalogs.append(_catalog)
+
+        return _catalog
+
+    #
+    ## @brief Snapshots queried during refreshes are consistent and frozen for all backends.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testParallelQueriesDuringRefresh(self):
+
+        store   = mApplication.catalogLib.CatalogStore(loader=self._load)
+        done    = threading.Event()
+        errors  = []
+
+        def query():
+            try:
+                while not done.is_set():
+
+                    snapshot = store.snapshot()
+                    self.assertIs(type(snapshot), mApplication.catalogLib.Catalog)
+                    self.assertIsInstance(snapshot.records(), tuple)
+
+                    names = [x['name'] for x in snapshot.query(keyword='test')]
+                    self.assertEqual(len(names), len(snapshot))
+                    self.assertEqual(len(set([x.split('x')[0] for x in names])), 1)
+                    self.assertEqual(len(names), int(names[0][3:].split('x')[0]) + 1)
+
+                    self.assertEqual([x['name'] for x in snapshot.query(keyword='test')], names)
+
+                    # Writer isn't starved for the GIL
+                    time.sleep(0.001)
+
+            except Exception as error:
+                errors.append(error)
+
+        store.snapshot()
+
+        threads = [threading.Thread(target=query) for x in range(READER_COUNT)]
+
+        for thread in threads:
+            thread.start()
+
+        try:
+            for x in range(REFRESH_COUNT):
+                store.refresh()
+        finally:
+            done.set()
+
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(store.generation(), REFRESH_COUNT + 1)
+
+    #
+    ## @brief Snapshots don't change when the SQLite catalog they are loaded from is updated.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testSQLiteRecordsCopied(self):
+
+        self._generation = 2
+
+        store    = mApplication.catalogLib.CatalogStore(loader=self._load)
+        snapshot = store.snapshot()
+
+        self._catalogs[-1].upsertRecords([getRecord(2, 3)])
+
+        self.assertEqual(len(self._catalogs[-1]), 4)
+        self.assertEqual(len(snapshot), 3)
+        self.assertEqual(len(store.query()), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_discoveryLib.py @brief [ FILE   ] - Tests of mApplication.discoveryLib module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+import mApplication.discoveryLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Tests of the search paths and package directories.
+class DiscoveryTest(unittest.TestCase):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create two search paths with packages and a symbolic link to the first one.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        self._directory  = os.path.realpath(tempfile.mkdtemp(prefix='mApplicationDiscoveryTest'))
+        self._firstPath  = os.path.join(self._directory, 'first')
+        self._secondPath = os.path.join(self._directory, 'second')
+        self._linkPath   = os.path.join(self._directory, 'link')
+        self._filePath   = os.path.join(self._directory, 'file.txt')
+
+        for path in [os.path.join(self._firstPath, 'mFoo'),
+                     os.path.join(self._firstPath, 'mBar'),
+                     os.path.join(self._secondPath, 'mFoo')]:
+            os.makedirs(path)
+
+        os.symlink(self._firstPath, self._linkPath)
+
+        with open(self._filePath, 'w') as _file:
+            _file.write('')
+
+        self._currentDirectory = os.getcwd()
+
+    #
+    ## @brief Remove the temporary directory.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def tearDown(self):
+
+        os.chdir(self._currentDirectory)
+
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    #
+    ## @brief Duplicate, symbolically linked and relative search paths are listed once, the first one is kept.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testSearchPathsDeduplicated(self):
+
+        os.chdir(self._directory)
+
+        paths = [self._linkPath,
+                 self._secondPath,
+                 'first',
+                 self._firstPath + os.sep,
+                 os.path.join(self._directory, 'missing'),
+                 self._filePath,
+                 'second']
+
+        self.assertEqual(mApplication.discoveryLib.listSearchPaths(paths), [self._firstPath, self._secondPath])
+
+    #
+    ## @brief Package directories are listed once for a shared visited set, packages with the same name in different
+    #  search paths are listed for each search path.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testPackageDirectories(self):
+
+        visited     = set()
+        directories = []
+
+        for path in mApplication.discoveryLib.listSearchPaths([self._firstPath, self._linkPath, self._secondPath]):
+            directories.extend(mApplication.discoveryLib.listPackageDirectories(path, visited=visited))
+
+        self.assertEqual(directories, [os.path.join(self._firstPath, 'mBar'),
+                                       os.path.join(self._firstPath, 'mFoo'),
+                                       os.path.join(self._secondPath, 'mFoo')])
+
+        self.assertEqual(mApplication.discoveryLib.listPackageDirectories(self._linkPath, visited=visited), [])
+
+    #
+    ## @brief Unique names of the modules in shadowed packages keep the package name and don't change when they are
+    #  built again.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testShadowedModuleName(self):
+
+        filePath   = os.path.join(self._secondPath, 'mFoo', 'mFooApplicationInfoLib.py')
+        moduleName = mApplication.discoveryLib.getShadowedModuleName('mFoo.mFooApplicationInfoLib', filePath)
+
+        self.assertTrue(moduleName.startswith('mFoo.mFooApplicationInfoLib_'))
+        self.assertEqual(mApplication.discoveryLib.getShadowedModuleName(moduleName, filePath), moduleName)
+        self.assertNotEqual(mApplication.discoveryLib.getShadowedModuleName('mFoo.mFooApplicationInfoLib',
+                                                                            os.path.join(self._linkPath, 'mFoo', 'x.py')),
+                            moduleName)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_environmentScanLib.py @brief [ FILE   ] - Tests of mApplication.environmentScanLib module.
+#
+#  Environments are made of search paths in a temporary directory and the search paths of the current interpreter,
+#  which provide the dependencies of mApplication to the worker interpreters.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+import mApplication.environmentScanLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ str ] - Template of the app info module of the test packages.
+APP_INFO_MODULE_TEMPLATE = '''import mApplication.applicationInfoAbs
+class LightMixerApplicationInfo(mApplication.applicationInfoAbs.ApplicationInfo):
+    def __init__(self):
+        self._name = 'LightMixer'
+        self._versionMajor = {versionMajor}
+        self._keywords = ['test']
+        mApplication.applicationInfoAbs.ApplicationInfo.__init__(self)
+'''
+
+#
+## @brief [ CLASS ] - Tests of mApplication.environmentScanLib.EnvironmentScanner class.
+class EnvironmentScannerTest(unittest.TestCase):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create two releases of the test package in two search paths.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        self._directory  = os.path.realpath(tempfile.mkdtemp(prefix='mApplicationScanTest'))
+        self._firstPath  = os.path.join(self._directory, 'first')
+        self._secondPath = os.path.join(self._directory, 'second')
+
+        for path, versionMajor in [(self._firstPath, 2), (self._secondPath, 3)]:
+
+            packagePath = os.path.join(path, 'mScanTest')
+            os.makedirs(packagePath)
+
+            with open(os.path.join(packagePath, '__init__.py'), 'w') as _file:
+                _file.write('')
+
+            with open(os.path.join(packagePath, 'packageInfoLib.py'), 'w') as _file:
+                _file.write("NAME = 'mScanTest'\n")
+
+            with open(os.path.join(packagePath, 'mScanTestApplicationInfoLib.py'), 'w') as _file:
+                _file.write(APP_INFO_MODULE_TEMPLATE.format(versionMajor=versionMajor))
+
+        self._scanner = mApplication.environmentScanLib.EnvironmentScanner(cacheDirectory='')
+
+    #
+    ## @brief Remove the temporary directory.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def tearDown(self):
+
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    #
+    ## @brief Scan the applications of the test package in given search paths.
+    #
+    #  @param paths [ list of str | None | in  ] - Search paths, search paths of the current interpreter are appended.
+    #
+    #  @exception N/A
+    #
+    #  @return list of tuple - Versions and absolute paths of the app info modules.
+    def _scan(self, paths):
+
+        _catalog = self._scanner.scan(paths + [x for x in sys.path if x], packageNames=['mScanTest'])
+
+        return [(x['versionStr'], os.path.realpath(x['filePath'])) for x in _catalog.records()]
+
+    #
+    ## @brief Metadata cached for a shadowed package directory belongs to that directory, so environments sharing it
+    #  get its own release.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testShadowedPackageCachedWithItsOwnRecords(self):
+
+        firstFilePath  = os.path.join(self._firstPath, 'mScanTest', 'mScanTestApplicationInfoLib.py')
+        secondFilePath = os.path.join(self._secondPath, 'mScanTest', 'mScanTestApplicationInfoLib.py')
+
+        self.assertEqual(sorted(self._scan([self._firstPath, self._secondPath])), [('2.0.0', firstFilePath),
+                                                                                   ('3.0.0', secondFilePath)])
+
+        self.assertEqual(self._scan([self._secondPath]), [('3.0.0', secondFilePath)])
+
+    #
+    ## @brief Scanning doesn't import the app info modules into the current interpreter.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testScanDoesNotImport(self):
+
+        self._scan([self._firstPath])
+
+        self.assertFalse([x for x in sys.modules if x.split('.')[0] == 'mScanTest'])
+
+
+if __name__ == '__main__':
+    unittest.main()
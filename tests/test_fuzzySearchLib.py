@@ -0,0 +1,323 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_fuzzySearchLib.py @brief [ FILE   ] - Tests of mApplication.fuzzySearchLib module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import json
+import random
+import shutil
+import tempfile
+import unittest
+
+import mApplication.catalogLib
+import mApplication.fuzzySearchLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ list of str ] - Texts searched by the tests, e.g. with typos.
+SEARCHED_TEXTS = ['lightmixr', 'light', 'mixer', 'rendr queue', 'paint', 'comp', 'xyz']
+
+#
+## @brief Get metadata of a test application.
+#
+#  @param name   [ str  | None | in  ] - Name of the application.
+#  @param values [ dict | None | in  ] - Values of the other fields.
+#
+#  @exception N/A
+#
+#  @return dict - Metadata, @see mApplication.applicationInfoAbs.ApplicationInfo.asDict.
+def getRecord(name, **values):
+
+    record = {'package'             : 'mFuzzyTest',
+              'packagePath'         : '/tmp/mFuzzyTest',
+              'module'              : 'mFuzzyTest.mFuzzyTestApplicationInfoLib',
+              'className'           : '{}ApplicationInfo'.format(name),
+              'filePath'            : '/tmp/mFuzzyTest/mFuzzyTestApplicationInfoLib.py',
+              'name'                : name,
+              'versionMajor'        : 1,
+              'versionMinor'        : 0,
+              'versionFix'          : 0,
+              'versionStr'          : '1.0.0',
+              'windowTitle'         : '{} - 1.0.0'.format(name),
+              'isActive'            : True,
+              'description'         : '',
+              'iconFileName'        : '',
+              'iconFilePath'        : '',
+              'usePlatformIcon'     : False,
+              'parentApplications'  : ['standalone'],
+              'keywords'            : ['test'],
+              'isGUI'               : False,
+              'runAsPanelInNuke'    : False,
+              'documents'           : [],
+              'pythonCommand'       : '',
+              'command'             : '',
+              'menuPath'            : '',
+              'fullMenuPath'        : '',
+              'menuSeparatorBefore' : False,
+              'menuSeparatorAfter'  : False,
+              'developers'          : []}
+
+    record.update(values)
+
+    return record
+
+#
+## @brief Get metadata of the test applications.
+#
+#  @exception N/A
+#
+#  @return list of dict - Metadata.
+def getRecords():
+
+    return [getRecord('LightMixer', keywords=['light', 'mixer']),
+            getRecord('LightRig', keywords=['light', 'rig']),
+            getRecord('RenderQueue', keywords=['render', 'farm'], parentApplications=['nuke']),
+            getRecord('PaintFX', keywords=['paint']),
+            getRecord('Compositor', keywords=['comp', 'nuke'])]
+
+#
+## @brief [ CLASS ] - Tests of mApplication.fuzzySearchLib.TrigramIndex class.
+class TrigramIndexTest(unittest.TestCase):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Index the test applications.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        self._records      = getRecords()
+        self._trigramIndex = mApplication.fuzzySearchLib.TrigramIndex(self._records)
+
+    #
+    ## @brief Search given text.
+    #
+    #  @param text         [ str          | None | in  ] - Text to be searched.
+    #  @param trigramIndex [ TrigramIndex | None | in  ] - Index, index of the test applications is used if None is
+    #  provided.
+    #  @param kwargs       [ dict         | None | in  ] - Other arguments of the search.
+    #
+    #  @exception N/A
+    #
+    #  @return list of tuple - Rounded scores and names of the applications found.
+    def _search(self, text, trigramIndex=None, **kwargs):
+
+        trigramIndex = trigramIndex if trigramIndex else self._trigramIndex
+
+        return [(round(score, 6), x['name']) for score, x in trigramIndex.search(text, **kwargs)]
+
+    #
+    ## @brief Applications are ranked by similarity, typos are tolerated.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testRanking(self):
+
+        self.assertEqual([x[1] for x in self._search('lightmixr')][:1], ['LightMixer'])
+        self.assertEqual([x[1] for x in self._search('rendr queue')][:1], ['RenderQueue'])
+
+        # Equally similar applications are sorted by their names
+        self.assertEqual(self._search('light')[:2], [(1.0, 'LightMixer'), (1.0, 'LightRig')])
+
+        self.assertEqual(self._search('light', top=1), [(1.0, 'LightMixer')])
+        self.assertEqual(self._search('light', filterRecord=lambda x: x['name'] != 'LightMixer')[:1], [(1.0, 'LightRig')])
+        self.assertEqual(self._search('xyz'), [])
+        self.assertEqual(self._search(''), [])
+
+    #
+    ## @brief Scores are the highest similarities of the terms of the applications, nothing below the threshold is
+    #  found.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testScores(self):
+
+        for text in SEARCHED_TEXTS:
+
+            for threshold in (0.1, 0.3, 0.6):
+
+                expected = []
+
+                for record in self._records:
+                    score = max([mApplication.fuzzySearchLib.getSimilarity(text, x)
+                                 for x in mApplication.fuzzySearchLib.getTerms(record)])
+                    if score >= threshold:
+                        expected.append((round(score, 6), record['name']))
+
+                self.assertEqual(self._search(text, threshold=threshold, top=None),
+                                 sorted(expected, key=lambda x: (-x[0], x[1])),
+                                 (text, threshold))
+
+    #
+    ## @brief Index read from its dict representation gives the same results, even if the applications are in
+    #  another order.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testRead(self):
+
+        records = list(self._records)
+        random.Random(0).shuffle(records)
+
+        # Index is written as JSON with the catalog
+        data         = json.loads(json.dumps(self._trigramIndex.asDict()))
+        trigramIndex = mApplication.fuzzySearchLib.TrigramIndex(records, data=data)
+
+        for text in SEARCHED_TEXTS:
+            self.assertEqual(self._search(text, trigramIndex=trigramIndex, top=None), self._search(text, top=None))
+
+        with self.assertRaises(ValueError):
+            mApplication.fuzzySearchLib.TrigramIndex(records[1:], data=data)
+
+        with self.assertRaises(ValueError):
+            mApplication.fuzzySearchLib.TrigramIndex([getRecord('Other')] + records[1:], data=data)
+
+#
+## @brief [ CLASS ] - Tests of the trigram indexes written next to the catalog artifacts.
+class CatalogTrigramIndexTest(unittest.TestCase):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Write a catalog of the test applications.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        self._directory = tempfile.mkdtemp(prefix='mApplicationFuzzyTest')
+        self._filePath  = os.path.join(self._directory, 'catalog.json')
+        self._catalogs  = []
+
+    #
+    ## @brief Close the catalogs and remove the temporary directory.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def tearDown(self):
+
+        for _catalog in self._catalogs:
+            if hasattr(_catalog, 'close'):
+                _catalog.close()
+
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    #
+    ## @brief Read the test catalog.
+    #
+    #  @exception N/A
+    #
+    #  @return mApplication.catalogLib.Catalog - Catalog.
+    def _read(self):
+
+        _catalog = mApplication.catalogLib.Catalog.read(self._filePath)
+
+        self._catalogs.append(_catalog)
+
+        return _catalog
+
+    #
+    ## @brief Write an index of given applications next to the test catalog for its current artifact.
+    #
+    #  @param records [ list of dict | None | in  ] - Metadata of applications.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _writeIndex(self, records):
+
+        with open(mApplication.catalogLib.getTrigramIndexFilePath(self._filePath), 'w') as _file:
+            json.dump({'version'  : mApplication.catalogLib.CATALOG_FORMAT_VERSION,
+                       'artifact' : mApplication.catalogLib.getFileStamp(self._filePath),
+                       'index'    : mApplication.fuzzySearchLib.TrigramIndex(records).asDict()}, _file)
+
+    #
+    ## @brief Index written with the catalog is read instead of indexing the applications again, for JSON and binary
+    #  catalogs.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testIndexReused(self):
+
+        for binary in (False, True):
+
+            mApplication.catalogLib.Catalog(records=getRecords()).write(self._filePath, binary=binary)
+
+            self.assertTrue(os.path.isfile(mApplication.catalogLib.getTrigramIndexFilePath(self._filePath)))
+            self.assertEqual(self._read().getTrigramIndex().search('lightmixr')[0][1]['name'], 'LightMixer')
+
+            # Index of the same applications with another keyword can only be found if the written index is used
+            self._writeIndex([dict(x, keywords=['sidecar']) if x['name'] == 'PaintFX' else x for x in getRecords()])
+
+            self.assertEqual([x[1]['name'] for x in self._read().getTrigramIndex().search('sidecar')], ['PaintFX'])
+
+    #
+    ## @brief Index written for another artifact is indexed again and written for the current one.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testStaleIndexRebuilt(self):
+
+        mApplication.catalogLib.Catalog(records=getRecords()).write(self._filePath)
+        self._writeIndex([dict(x, keywords=['sidecar']) if x['name'] == 'PaintFX' else x for x in getRecords()])
+
+        # Artifact is replaced without its index
+        records = getRecords()[1:] + [getRecord('Painter', keywords=['paint'])]
+        mApplication.catalogLib.writeFileAtomically(
+            self._filePath,
+            json.dumps(mApplication.catalogLib.Catalog(records=records).asDict()))
+
+        trigramIndex = self._read().getTrigramIndex()
+
+        self.assertEqual(trigramIndex.search('sidecar'), [])
+        self.assertEqual([x[1]['name'] for x in trigramIndex.search('paint')], ['PaintFX', 'Painter'])
+
+        with open(mApplication.catalogLib.getTrigramIndexFilePath(self._filePath), 'r') as _file:
+            self.assertEqual(json.load(_file)['artifact'], mApplication.catalogLib.getFileStamp(self._filePath))
+
+        # Index, which can't be read, is indexed again as well
+        with open(mApplication.catalogLib.getTrigramIndexFilePath(self._filePath), 'w') as _file:
+            _file.write('{')
+
+        self.assertEqual(len(self._read().getTrigramIndex()), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
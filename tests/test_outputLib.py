@@ -0,0 +1,154 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_outputLib.py @brief [ FILE   ] - Tests of mApplication.outputLib module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import io
+import json
+import unittest
+
+import mApplication.outputLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Tests of mApplication.outputLib.RecordWriter class.
+class RecordWriterTest(unittest.TestCase):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create metadata of test applications.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        self._records = [{'name'               : 'LightMixer',
+                          'versionStr'         : '1.0.0',
+                          'parentApplications' : ['maya', 'nuke'],
+                          'description'        : 'Mixes\tlights\nof scenes'},
+                         {'name'               : 'RenderQueue',
+                          'versionStr'         : '2.1.0',
+                          'parentApplications' : [],
+                          'description'        : None}]
+
+    #
+    ## @brief Write given metadata by a writer.
+    #
+    #  @param outputFormat [ str          | None | in  ] - Output format.
+    #  @param records      [ list of dict | None | in  ] - Metadata of applications.
+    #  @param kwargs       [ dict         | None | in  ] - Other arguments of the writer.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Output.
+    def _write(self, outputFormat, records, **kwargs):
+
+        stream = io.StringIO()
+        writer = mApplication.outputLib.RecordWriter(outputFormat, stream=stream, **kwargs)
+
+        self.assertEqual(writer.writeRecords(records), len(records))
+
+        return stream.getvalue()
+
+    #
+    ## @brief JSON output is a list of the default fields, empty output is an empty list.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testJSON(self):
+
+        self.assertEqual(json.loads(self._write(mApplication.outputLib.FORMAT_JSON, self._records)),
+                         [{'name': 'LightMixer', 'version': '1.0.0', 'parents': ['maya', 'nuke']},
+                          {'name': 'RenderQueue', 'version': '2.1.0', 'parents': []}])
+
+        self.assertEqual(json.loads(self._write(mApplication.outputLib.FORMAT_JSON, [])), [])
+
+    #
+    ## @brief NDJSON output is one object per line, small buffers don't change the output.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testNDJSON(self):
+
+        output = self._write(mApplication.outputLib.FORMAT_NDJSON, self._records, fields=['name', 'description'],
+                             bufferSize=1)
+
+        self.assertEqual([json.loads(x) for x in output.splitlines()],
+                         [{'name': 'LightMixer', 'description': 'Mixes\tlights\nof scenes'},
+                          {'name': 'RenderQueue', 'description': None}])
+
+        self.assertEqual(self._write(mApplication.outputLib.FORMAT_NDJSON, []), '')
+
+    #
+    ## @brief TSV output has a header line even without records, values can't break the columns.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testTSV(self):
+
+        fields = ['name', 'parents', 'description']
+
+        self.assertEqual(self._write(mApplication.outputLib.FORMAT_TSV, self._records, fields=fields).splitlines(),
+                         ['name\tparents\tdescription',
+                          'LightMixer\tmaya,nuke\tMixes lights of scenes',
+                          'RenderQueue\t\t'])
+
+        self.assertEqual(self._write(mApplication.outputLib.FORMAT_TSV, [], fields=fields),
+                         'name\tparents\tdescription\n')
+
+    #
+    ## @brief Unknown fields and output formats are rejected, extra fields are accepted only if given.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testUnknownFields(self):
+
+        with self.assertRaises(ValueError) as context:
+            mApplication.outputLib.parseFields('name,colour')
+
+        self.assertIn('colour', str(context.exception))
+
+        with self.assertRaises(ValueError):
+            mApplication.outputLib.RecordWriter(mApplication.outputLib.FORMAT_TSV, fields=['score'])
+
+        with self.assertRaises(ValueError):
+            mApplication.outputLib.RecordWriter(mApplication.outputLib.FORMAT_TEXT)
+
+        self.assertEqual(mApplication.outputLib.parseFields(' name , score ', extraFields=['score']), ['name', 'score'])
+        self.assertEqual(mApplication.outputLib.parseFields(''), mApplication.outputLib.DEFAULT_FIELDS)
+
+
+if __name__ == '__main__':
+    unittest.main()
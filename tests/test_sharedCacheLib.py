@@ -0,0 +1,277 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_sharedCacheLib.py @brief [ FILE   ] - Tests of mApplication.sharedCacheLib module.
+#
+#  Several processes get the catalog of the same environment from a shared cache in a temporary directory, the same
+#  way render farm nodes do.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import glob
+import json
+import time
+import shutil
+import tempfile
+import unittest
+import subprocess
+
+import mApplication.sharedCacheLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+## [ str ] - Template of the app info module of the test package.
+APP_INFO_MODULE_TEMPLATE = '''import mApplication.applicationInfoAbs
+class {name}ApplicationInfo(mApplication.applicationInfoAbs.ApplicationInfo):
+    def __init__(self):
+        self._name = '{name}'
+        self._keywords = ['test']
+        mApplication.applicationInfoAbs.ApplicationInfo.__init__(self)
+'''
+
+## [ str ] - Code run by the processes, it writes names of the applications in the catalog as JSON.
+PROCESS_CODE = '''
+import sys, json
+import mApplication.sharedCacheLib
+_catalog = mApplication.sharedCacheLib.SharedCatalogCache(sys.argv[1]).get()
+sys.stdout.write(json.dumps(sorted([x['name'] for x in _catalog.records() if x['package'] == 'mSharedCacheTest'])))
+'''
+
+#
+## @brief [ CLASS ] - Tests of mApplication.sharedCacheLib.SharedCatalogCache class.
+class SharedCatalogCacheTest(unittest.TestCase):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create the test package and the cache directory.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        self._directory      = tempfile.mkdtemp(prefix='mApplicationSharedCacheTest')
+        self._rootPath       = os.path.join(self._directory, 'root')
+        self._packagePath    = os.path.join(self._rootPath, 'mSharedCacheTest')
+        self._cacheDirectory = os.path.join(self._directory, 'cache')
+
+        os.makedirs(self._packagePath)
+        os.makedirs(self._cacheDirectory)
+
+        with open(os.path.join(self._packagePath, '__init__.py'), 'w') as _file:
+            _file.write('')
+
+        with open(os.path.join(self._packagePath, 'packageInfoLib.py'), 'w') as _file:
+            _file.write("NAME = 'mSharedCacheTest'\n")
+
+        self._writeAppInfoModule('FirstApp')
+
+    #
+    ## @brief Remove the temporary directory.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def tearDown(self):
+
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    #
+    ## @brief Write the app info module of the test package.
+    #
+    #  @param name [ str | None | in  ] - Name of the application.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _writeAppInfoModule(self, name):
+
+        with open(os.path.join(self._packagePath, 'mSharedCacheTestApplicationInfoLib.py'), 'w') as _file:
+            _file.write(APP_INFO_MODULE_TEMPLATE.format(name=name))
+
+    #
+    ## @brief Start processes, which get the catalog from the shared cache at the same time.
+    #
+    #  @param count [ int | 1 | in  ] - Number of the processes.
+    #
+    #  @exception N/A
+    #
+    #  @return list of list - Names of the applications got by each process.
+    def _getCatalogs(self, count=1):
+
+        environment = dict(os.environ)
+        environment.pop('MAPPLICATION_CATALOG_FILE', None)
+        environment['PYTHONPATH']               = os.pathsep.join([self._rootPath] + [x for x in sys.path if x])
+        environment['PYTHONDONTWRITEBYTECODE']  = '1'
+
+        processes = [subprocess.Popen([sys.executable, '-c', PROCESS_CODE, self._cacheDirectory],
+                                      stdout=subprocess.PIPE,
+                                      stderr=subprocess.PIPE,
+                                      cwd=self._directory,
+                                      env=environment) for x in range(count)]
+
+        results = []
+
+        for process in processes:
+            stdout, stderr = process.communicate()
+            self.assertEqual(process.returncode, 0, stderr.decode('utf-8', 'replace'))
+            results.append(json.loads(stdout.decode('utf-8')))
+
+        return results
+
+    #
+    ## @brief Concurrent processes publish a single catalog and get the same applications.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testConcurrentProcesses(self):
+
+        results = self._getCatalogs(count=8)
+
+        self.assertEqual(results, [['FirstApp']] * 8)
+        self.assertEqual(len(glob.glob(os.path.join(self._cacheDirectory, 'catalog-*.mcat'))), 1)
+
+    #
+    ## @brief Editing an app info module in place publishes the catalog again.
+    #
+    #  Modification times of the search path and the package directory are restored, so only the app info module
+    #  itself is modified and the key of the entry doesn't change.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testAppInfoModuleEditedInPlace(self):
+
+        self.assertEqual(self._getCatalogs(), [['FirstApp']])
+
+        rootStat    = os.stat(self._rootPath)
+        packageStat = os.stat(self._packagePath)
+
+        self._writeAppInfoModule('SecondApp')
+
+        os.utime(self._packagePath, (packageStat.st_atime, packageStat.st_mtime))
+        os.utime(self._rootPath, (rootStat.st_atime, rootStat.st_mtime))
+
+        self.assertEqual(self._getCatalogs(), [['SecondApp']])
+        self.assertEqual(self._getCatalogs(), [['SecondApp']])
+        self.assertEqual(len(glob.glob(os.path.join(self._cacheDirectory, 'catalog-*.mcat'))), 1)
+
+    #
+    ## @brief Content hash validation publishes the catalog again if an app info module is modified without changing
+    #  its size and modification time.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testContentModifiedWithPreservedTimes(self):
+
+        # Hashes are persisted in the cache directory, so the processes don't read unmodified files again
+        for name, value in (('MAPPLICATION_CONTENT_HASH_VALIDATION', '1'),
+                            (mApplication.sharedCacheLib.SHARED_CACHE_DIRECTORY_ENV_VARIABLE, self._cacheDirectory)):
+            os.environ[name] = value
+            self.addCleanup(os.environ.pop, name, None)
+
+        self.assertEqual(self._getCatalogs(), [['FirstApp']])
+
+        filePath    = os.path.join(self._packagePath, 'mSharedCacheTestApplicationInfoLib.py')
+        fileStat    = os.stat(filePath)
+        packageStat = os.stat(self._packagePath)
+        rootStat    = os.stat(self._rootPath)
+
+        # Same length as the former name, so the size of the module doesn't change either
+        self._writeAppInfoModule('OtherApp')
+
+        # Times are restored in nanoseconds, so they are exactly the same
+        for path, _stat in ((filePath, fileStat), (self._packagePath, packageStat), (self._rootPath, rootStat)):
+            os.utime(path, ns=(_stat.st_atime_ns, _stat.st_mtime_ns))
+
+        self.assertEqual(os.stat(filePath).st_mtime_ns, fileStat.st_mtime_ns)
+        self.assertEqual(os.stat(filePath).st_size, fileStat.st_size)
+        self.assertEqual(self._getCatalogs(), [['OtherApp']])
+
+    #
+    ## @brief Key of the entry is computed once per process.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testKeyMemoized(self):
+
+        sys.path.append(self._rootPath)
+
+        try:
+            cache = mApplication.sharedCacheLib.SharedCatalogCache(self._cacheDirectory)
+            key   = cache.getKey()
+
+            os.makedirs(os.path.join(self._rootPath, 'mSharedCacheOtherTest'))
+
+            self.assertEqual(cache.getKey(), key)
+
+            mApplication.sharedCacheLib.clear()
+
+            self.assertNotEqual(cache.getKey(), key)
+
+        finally:
+            sys.path.remove(self._rootPath)
+            mApplication.sharedCacheLib.clear()
+
+    #
+    ## @brief Old entries of other environments are removed when a catalog is published, the used ones are kept.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testOldEntriesPruned(self):
+
+        oldTime       = time.time() - mApplication.sharedCacheLib.DEFAULT_MAX_ENTRY_AGE - 60
+        oldFileNames  = ['catalog-old.mcat', 'catalog-old.mcat.trigrams', 'catalog-old.lock', 'package-old.json']
+        newFileNames  = ['catalog-new.mcat', 'catalog-new.lock']
+
+        for fileName in oldFileNames + newFileNames:
+
+            filePath = os.path.join(self._cacheDirectory, fileName)
+
+            with open(filePath, 'w') as _file:
+                _file.write('')
+
+            if fileName in oldFileNames:
+                os.utime(filePath, (oldTime, oldTime))
+
+        self.assertEqual(self._getCatalogs(), [['FirstApp']])
+
+        fileNames = os.listdir(self._cacheDirectory)
+
+        self.assertEqual([x for x in oldFileNames if x in fileNames], [])
+        self.assertEqual([x for x in newFileNames if x in fileNames], newFileNames)
+        self.assertEqual(len([x for x in fileNames if x.endswith('.mcat')]), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,237 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_sqliteCatalogLib.py @brief [ FILE   ] - Tests of mApplication.sqliteCatalogLib module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+import mApplication.catalogLib
+import mApplication.sqliteCatalogLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+#
+## @brief Get metadata of a test application.
+#
+#  @param name   [ str  | None | in  ] - Name of the application.
+#  @param values [ dict | None | in  ] - Values of the other fields.
+#
+#  @exception N/A
+#
+#  @return dict - Metadata, @see mApplication.applicationInfoAbs.ApplicationInfo.asDict.
+def getRecord(name, **values):
+
+    record = {'package'             : 'mSQLiteTest',
+              'packagePath'         : '/tmp/mSQLiteTest',
+              'module'              : 'mSQLiteTest.mSQLiteTestApplicationInfoLib',
+              'className'           : '{}ApplicationInfo'.format(name),
+              'filePath'            : '/tmp/mSQLiteTest/mSQLiteTestApplicationInfoLib.py',
+              'name'                : name,
+              'versionMajor'        : 1,
+              'versionMinor'        : 0,
+              'versionFix'          : 0,
+              'versionStr'          : '1.0.0',
+              'windowTitle'         : '{} - 1.0.0'.format(name),
+              'isActive'            : True,
+              'description'         : '',
+              'iconFileName'        : '',
+              'iconFilePath'        : '',
+              'usePlatformIcon'     : False,
+              'parentApplications'  : ['standalone'],
+              'keywords'            : ['test'],
+              'isGUI'               : False,
+              'runAsPanelInNuke'    : False,
+              'documents'           : [],
+              'pythonCommand'       : '',
+              'command'             : '',
+              'menuPath'            : '',
+              'fullMenuPath'        : '',
+              'menuSeparatorBefore' : False,
+              'menuSeparatorAfter'  : False,
+              'developers'          : []}
+
+    record.update(values)
+
+    return record
+
+#
+## @brief [ CLASS ] - Tests of mApplication.sqliteCatalogLib.SQLiteCatalog class.
+class SQLiteCatalogTest(unittest.TestCase):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Write a catalog of test applications into a temporary directory.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        self._directory = tempfile.mkdtemp(prefix='mApplicationSQLiteTest')
+        self._filePath  = os.path.join(self._directory, 'catalog.db')
+
+        self._records   = [getRecord('RenderQueue', keywords=['render'], parentApplications=['nuke']),
+                           getRecord('LightMixer',
+                                     keywords=['light', 'compositing'],
+                                     parentApplications=['maya', 'nuke'],
+                                     developers=[{'userName': 'soner', 'name': 'Safak', 'email': 'S@x.com', 'web': ''}],
+                                     documents=[{'title': 'Doc', 'url': 'http://doc/lm/'}]),
+                           getRecord('Zeta', isActive=False)]
+
+        self._catalogs  = []
+
+        mApplication.sqliteCatalogLib.write(mApplication.catalogLib.Catalog(records=self._records,
+                                                                            environment={'pythonVersion': '3.0',
+                                                                                         'paths': []}),
+                                            self._filePath)
+
+    #
+    ## @brief Close the catalogs and remove the temporary directory.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def tearDown(self):
+
+        for _catalog in self._catalogs:
+            _catalog.close()
+
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    #
+    ## @brief Open the test catalog.
+    #
+    #  @param readOnly [ bool | False | in  ] - Open the catalog in read-only mode.
+    #
+    #  @exception N/A
+    #
+    #  @return mApplication.sqliteCatalogLib.SQLiteCatalog - Catalog.
+    def _open(self, readOnly=False):
+
+        _catalog = mApplication.sqliteCatalogLib.SQLiteCatalog(self._filePath, readOnly=readOnly)
+
+        self._catalogs.append(_catalog)
+
+        return _catalog
+
+    #
+    ## @brief Catalog read back from the database provides the written metadata and environment.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testWriteRead(self):
+
+        _catalog = mApplication.catalogLib.Catalog.read(self._filePath)
+        self._catalogs.append(_catalog)
+
+        self.assertIsInstance(_catalog, mApplication.sqliteCatalogLib.SQLiteCatalog)
+        self.assertEqual(_catalog.records(), sorted(self._records, key=lambda x: x['name']))
+        self.assertEqual(_catalog.environment(), {'pythonVersion': '3.0', 'paths': []})
+        self.assertEqual(len(_catalog), 3)
+
+    #
+    ## @brief Indexed queries give the same results as the in-memory catalog.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testQuery(self):
+
+        _catalog  = self._open(readOnly=True)
+        reference = mApplication.catalogLib.Catalog(records=self._records)
+
+        for filters in [{},
+                        {'ignoreInactive': False},
+                        {'parentApplication': 'nuke'},
+                        {'keyword': 'light'},
+                        {'keyword': 'render', 'parentApplication': 'maya'},
+                        {'packageName': 'msqlitetest', 'limit': 1, 'offset': 1},
+                        {'ignoreInactive': False, 'offset': 2}]:
+
+            self.assertEqual([x['name'] for x in _catalog.query(**filters)],
+                             [x['name'] for x in reference.query(**filters)],
+                             filters)
+
+        self.assertEqual([x['name'] for x in _catalog.findBySecondaryKeys(developer='SONER')], ['LightMixer'])
+        self.assertEqual([x['name'] for x in _catalog.findBySecondaryKeys(documentUrl='http://doc/lm')], ['LightMixer'])
+
+    #
+    ## @brief Upserted applications are updated in place, read-only catalogs can't be written.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testUpsert(self):
+
+        _catalog = self._open()
+        _catalog.upsertRecords([getRecord('LightMixer', versionMajor=2, keywords=['light'])])
+
+        self.assertEqual(len(_catalog), 3)
+        self.assertEqual([x['versionMajor'] for x in _catalog.query(keyword='light')], [2])
+        self.assertEqual(_catalog.query(keyword='compositing'), [])
+
+        with self.assertRaises(sqlite3.Error):
+            self._open(readOnly=True).upsertRecords([getRecord('Other')])
+
+    #
+    ## @brief Tables added after the schema version a catalog was written with are populated when it is opened,
+    #  read-only catalogs with older schemas aren't used.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testMigrate(self):
+
+        connection = sqlite3.connect(self._filePath)
+
+        with connection:
+            connection.execute('DELETE FROM developers')
+            connection.execute('DELETE FROM documents')
+            connection.execute('UPDATE metadata SET value = ? WHERE key = ?', ('1', 'schemaVersion'))
+
+        connection.close()
+
+        with self.assertRaises(ValueError):
+            self._open(readOnly=True)
+
+        self.assertIsNone(mApplication.catalogLib.Catalog.read(self._filePath))
+
+        _catalog = self._open()
+
+        self.assertEqual([x['name'] for x in _catalog.findBySecondaryKeys(email='s@x.com')], ['LightMixer'])
+        self.assertEqual(len(self._open(readOnly=True)), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()